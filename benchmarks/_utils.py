@@ -0,0 +1,33 @@
+import os
+import timeit
+from typing import Callable
+
+ASSETS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)),
+    "youtube_transcript_api",
+    "test",
+    "assets",
+)
+
+
+def load_asset(filename: str) -> bytes:
+    with open(os.path.join(ASSETS_DIR, filename), mode="rb") as file:
+        return file.read()
+
+
+def measure(function: Callable, number: int, repeat: int = 5) -> float:
+    """
+    :return: the best time of a single call of `function` in microseconds
+    """
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 1e6
+
+
+def report(name: str, baseline: float, optimized: float) -> None:
+    print(
+        "{name:<55} {baseline:>10.1f} us {optimized:>10.1f} us {speedup:>6.1f}x".format(
+            name=name,
+            baseline=baseline,
+            optimized=optimized,
+            speedup=baseline / optimized,
+        )
+    )
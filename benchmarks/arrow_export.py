@@ -0,0 +1,89 @@
+"""
+Compares converting every transcript to a table on its own, using `to_raw_data()`, and
+writing the concatenated tables to a Parquet file with exporting all transcripts using
+an `ArrowExporter`. This requires `pyarrow` to be installed.
+
+Run from the repository root: `python -m benchmarks.arrow_export`
+"""
+
+import os
+from tempfile import TemporaryDirectory
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+from youtube_transcript_api.export import ArrowExporter
+
+from ._utils import measure, report
+
+TRANSCRIPT_COUNT = 1_000
+SNIPPETS_PER_TRANSCRIPT = 300
+
+
+def build_transcripts():
+    return [
+        FetchedTranscript(
+            snippets=[
+                FetchedTranscriptSnippet(
+                    text="snippet number {index} of the transcript".format(index=i),
+                    start=i * 2.0,
+                    duration=2.0,
+                )
+                for i in range(SNIPPETS_PER_TRANSCRIPT)
+            ],
+            video_id="video{index}".format(index=index),
+            language="English",
+            language_code="en" if index % 2 else "de",
+            is_generated=True,
+        )
+        for index in range(TRANSCRIPT_COUNT)
+    ]
+
+
+def main():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        print("pyarrow is not installed")
+        return
+
+    transcripts = build_transcripts()
+
+    with TemporaryDirectory() as directory:
+
+        def export_raw_data():
+            tables = []
+            for transcript in transcripts:
+                rows = [
+                    dict(
+                        snippet,
+                        video_id=transcript.video_id,
+                        language_code=transcript.language_code,
+                        is_generated=transcript.is_generated,
+                    )
+                    for snippet in transcript.to_raw_data()
+                ]
+                tables.append(pyarrow.Table.from_pylist(rows))
+            pyarrow.parquet.write_table(
+                pyarrow.concat_tables(tables),
+                os.path.join(directory, "raw_data.parquet"),
+            )
+
+        def export_with_exporter():
+            with ArrowExporter(os.path.join(directory, "dataset")) as exporter:
+                for transcript in transcripts:
+                    exporter.add(transcript)
+
+        print(
+            "{count} transcripts with {snippets} snippets each".format(
+                count=TRANSCRIPT_COUNT, snippets=SNIPPETS_PER_TRANSCRIPT
+            )
+        )
+        report(
+            "export to parquet (to_raw_data vs. ArrowExporter)",
+            measure(export_raw_data, number=1, repeat=3),
+            measure(export_with_exporter, number=1, repeat=3),
+        )
+
+
+if __name__ == "__main__":
+    main()
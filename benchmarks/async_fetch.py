@@ -0,0 +1,118 @@
+"""
+Compares fetching many transcripts concurrently by running `YouTubeTranscriptApi.fetch`
+in a pool of 64 threads (as `run_in_executor` would), with running
+`AsyncYouTubeTranscriptApi.fetch` for all of them on a single event loop. Both use an
+HTTP layer, which answers every request with a static asset after a simulated network
+latency, so no requests are sent to YouTube.
+
+Run from the repository root: `python -m benchmarks.async_fetch`
+"""
+
+import asyncio
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from requests import Response, Session
+from requests.adapters import BaseAdapter
+
+from youtube_transcript_api import (
+    AsyncHttpClient,
+    AsyncHttpResponse,
+    AsyncYouTubeTranscriptApi,
+    HttpxAsyncClient,
+    YouTubeTranscriptApi,
+)
+
+from ._utils import load_asset, report
+
+FETCH_COUNT = 1_000
+THREAD_COUNT = 64
+LATENCY = 0.05
+ASSETS = {
+    "https://www.youtube.com/watch": load_asset("youtube.html.static"),
+    "https://www.youtube.com/youtubei/v1/player": load_asset(
+        "youtube.innertube.json.static"
+    ),
+    "https://www.youtube.com/api/timedtext": load_asset("transcript.xml.static"),
+}
+
+
+def get_asset(url: str) -> bytes:
+    return next(content for prefix, content in ASSETS.items() if url.startswith(prefix))
+
+
+class SimulatedAdapter(BaseAdapter):
+    def send(self, request, **kwargs):
+        time.sleep(LATENCY)
+        response = Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(get_asset(request.url))
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class SimulatedAsyncHttpClient(AsyncHttpClient):
+    async def get(self, url, consume=None):
+        await asyncio.sleep(LATENCY)
+        if consume is not None:
+            content = get_asset(url)
+            for offset in range(0, len(content), HttpxAsyncClient.CHUNK_SIZE):
+                if consume(content[offset : offset + HttpxAsyncClient.CHUNK_SIZE]):
+                    break
+            return AsyncHttpResponse(url, 200)
+        return AsyncHttpResponse(url, 200, get_asset(url))
+
+    async def post(self, url, json):
+        await asyncio.sleep(LATENCY)
+        return AsyncHttpResponse(url, 200, get_asset(url))
+
+    def get_cookie(self, name, domain):
+        return None
+
+    def set_cookie(self, name, value, domain):
+        pass
+
+
+def fetch_in_threads():
+    http_client = Session()
+    http_client.mount("https://", SimulatedAdapter())
+    ytt_api = YouTubeTranscriptApi(http_client=http_client)
+    with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+        return list(executor.map(ytt_api.fetch, ["GJLlxj_dtq8"] * FETCH_COUNT))
+
+
+async def fetch_on_event_loop():
+    async with AsyncYouTubeTranscriptApi(
+        http_client=SimulatedAsyncHttpClient()
+    ) as ytt_api:
+        return await asyncio.gather(
+            *(ytt_api.fetch("GJLlxj_dtq8") for _ in range(FETCH_COUNT))
+        )
+
+
+def measure_once(function) -> float:
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1e6
+
+
+def main():
+    print(
+        "{count} fetches of 3 requests each, {latency:.0f} ms latency per request".format(
+            count=FETCH_COUNT, latency=LATENCY * 1000
+        )
+    )
+    report(
+        "fetch ({threads} threads vs. asyncio)".format(threads=THREAD_COUNT),
+        measure_once(fetch_in_threads),
+        measure_once(lambda: asyncio.run(fetch_on_event_loop())),
+    )
+
+
+if __name__ == "__main__":
+    main()
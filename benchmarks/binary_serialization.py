@@ -0,0 +1,96 @@
+"""
+Compares storing a transcript as JSON, using the `JSONFormatter`, and loading it with
+`json.loads` with storing it in the binary format of `serialization`, regarding the
+size of the data and how long it takes to write and load it.
+
+Run from the repository root: `python -m benchmarks.binary_serialization`
+"""
+
+import json
+import os
+from tempfile import TemporaryDirectory
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+from youtube_transcript_api import serialization
+from youtube_transcript_api.formatters import JSONFormatter
+from youtube_transcript_api.serialization import TimeFormat
+
+from ._utils import measure, report
+
+SNIPPET_COUNT = 100_000
+
+
+def main():
+    transcript = FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(
+                text="snippet number {index} of the transcript".format(index=i),
+                start=i * 1.5,
+                duration=1.5,
+            )
+            for i in range(SNIPPET_COUNT)
+        ],
+        video_id="video_id",
+        language="English",
+        language_code="en",
+        is_generated=True,
+    )
+    formatter = JSONFormatter()
+    json_data = formatter.format_transcript(transcript)
+    binary_data = serialization.dumps(transcript)
+
+    print("{count} snippets".format(count=SNIPPET_COUNT))
+    print(
+        "size: json {json_size:.1f} MB, binary {binary_size:.1f} MB, "
+        "binary (ms) {ms_size:.1f} MB".format(
+            json_size=len(json_data.encode("utf-8")) / 1024 / 1024,
+            binary_size=len(binary_data) / 1024 / 1024,
+            ms_size=len(
+                serialization.dumps(transcript, time_format=TimeFormat.MILLISECONDS)
+            )
+            / 1024
+            / 1024,
+        )
+    )
+    report(
+        "write (json vs. binary)",
+        measure(lambda: formatter.format_transcript(transcript), number=1),
+        measure(lambda: serialization.dumps(transcript), number=1),
+    )
+    report(
+        "load (json vs. binary)",
+        measure(lambda: json.loads(json_data), number=1),
+        measure(lambda: serialization.loads(binary_data), number=1),
+    )
+
+    with TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "transcript.json")
+        binary_path = os.path.join(directory, "transcript.bin")
+        with open(json_path, "w", encoding="utf-8") as file:
+            file.write(json_data)
+        serialization.dump(transcript, binary_path)
+
+        def load_json():
+            with open(json_path, encoding="utf-8") as file:
+                return json.load(file)
+
+        def sum_json_durations():
+            return sum(snippet["duration"] for snippet in load_json())
+
+        def sum_binary_durations():
+            return sum(serialization.load(binary_path).snippets.durations)
+
+        report(
+            "load file (json vs. mmap)",
+            measure(load_json, number=1),
+            measure(lambda: serialization.load(binary_path), number=1),
+        )
+        report(
+            "load file and sum durations (json vs. mmap)",
+            measure(sum_json_durations, number=1),
+            measure(sum_binary_durations, number=1),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Compares sending a parsed transcript from a worker process of a `ProcessPoolFetcher` to
+the parent process as a pickled `FetchedTranscript`, with sending it in the binary
+format of `serialization`, like the `ProcessPoolFetcher` does. The worker side of the
+transfer is pickling the result, the parent side is unpickling it.
+
+Run from the repository root: `python -m benchmarks.bulk_transfer`
+"""
+
+import pickle
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+from youtube_transcript_api import serialization
+
+from ._utils import measure, report
+
+SNIPPET_COUNT = 2_000
+
+
+def main():
+    transcript = FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(
+                text="snippet number {index} of the transcript".format(index=i),
+                start=i * 1.5,
+                duration=1.5,
+            )
+            for i in range(SNIPPET_COUNT)
+        ],
+        video_id="video_id",
+        language="English",
+        language_code="en",
+        is_generated=True,
+    )
+    pickled_transcript = pickle.dumps(transcript)
+    pickled_binary = pickle.dumps(serialization.dumps(transcript))
+
+    print("{count} snippets per transcript".format(count=SNIPPET_COUNT))
+    print(
+        "size: pickled dataclasses {pickle_size:.1f} KB, binary {binary_size:.1f} KB".format(
+            pickle_size=len(pickled_transcript) / 1024,
+            binary_size=len(pickled_binary) / 1024,
+        )
+    )
+    report(
+        "worker: pickle (dataclasses vs. binary)",
+        measure(lambda: pickle.dumps(transcript), number=20),
+        measure(lambda: pickle.dumps(serialization.dumps(transcript)), number=20),
+    )
+    report(
+        "parent: unpickle (dataclasses vs. binary)",
+        measure(lambda: pickle.loads(pickled_transcript), number=20),
+        measure(lambda: serialization.loads(pickle.loads(pickled_binary)), number=20),
+    )
+
+
+if __name__ == "__main__":
+    main()
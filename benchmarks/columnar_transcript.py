@@ -0,0 +1,70 @@
+"""
+Compares a transcript storing its snippets in a list of `FetchedTranscriptSnippet`s
+with one storing them in `SnippetColumns`, regarding the memory they use and how long
+it takes to sum up the durations of all snippets.
+
+Run from the repository root: `python -m benchmarks.columnar_transcript`
+"""
+
+import tracemalloc
+
+from youtube_transcript_api import FetchedTranscriptSnippet, SnippetColumns
+
+from ._utils import measure, report
+
+SNIPPET_COUNT = 100_000
+
+
+def measure_memory(build) -> int:
+    tracemalloc.start()
+    snippets = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del snippets
+    return size
+
+
+def main():
+    def build_list():
+        return [
+            FetchedTranscriptSnippet(
+                text="snippet {index}".format(index=i), start=i * 1.5, duration=1.5
+            )
+            for i in range(SNIPPET_COUNT)
+        ]
+
+    snippets = build_list()
+    columns = SnippetColumns.from_snippets(snippets)
+
+    print("{count} snippets".format(count=SNIPPET_COUNT))
+    print(
+        "memory: list {list_size:.1f} MB, columns {columns_size:.1f} MB".format(
+            list_size=measure_memory(build_list) / 1024 / 1024,
+            columns_size=measure_memory(lambda: SnippetColumns.from_snippets(snippets))
+            / 1024
+            / 1024,
+        )
+    )
+    report(
+        "sum of durations (list vs. memoryview)",
+        measure(lambda: sum(snippet.duration for snippet in snippets), number=5),
+        measure(lambda: sum(columns.durations), number=5),
+    )
+    report(
+        "slice of 10k snippets (list vs. columns)",
+        measure(lambda: snippets[40_000:50_000], number=100),
+        measure(lambda: columns[40_000:50_000], number=100),
+    )
+    try:
+        starts, durations = columns.to_numpy()
+    except ImportError:
+        return
+    report(
+        "sum of durations (list vs. numpy)",
+        measure(lambda: sum(snippet.duration for snippet in snippets), number=5),
+        measure(lambda: durations.sum(), number=5),
+    )
+
+
+if __name__ == "__main__":
+    main()
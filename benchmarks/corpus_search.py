@@ -0,0 +1,108 @@
+"""
+Compares answering "which videos mention X, and when" for a corpus of transcripts
+stored as JSON files (loading every file and scanning its snippets) with querying a
+`CorpusIndex`.
+
+Run from the repository root: `python -m benchmarks.corpus_search`
+"""
+
+import json
+import os
+import random
+import time
+from itertools import accumulate
+from tempfile import TemporaryDirectory
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+from youtube_transcript_api.corpus import CorpusIndex
+from youtube_transcript_api.formatters import JSONFormatter
+
+from ._utils import measure, report
+
+TRANSCRIPT_COUNT = 1_000
+SNIPPETS_PER_TRANSCRIPT = 300
+# word frequencies in natural language roughly follow Zipf's law
+WORDS = ["word{rank}".format(rank=rank) for rank in range(1, 20_001)]
+CUMULATIVE_WEIGHTS = list(accumulate(1 / rank for rank in range(1, 20_001)))
+QUERIES = ("word300", "word5000", "word10 word11")
+
+
+def build_transcripts():
+    generator = random.Random(0)
+    for index in range(TRANSCRIPT_COUNT):
+        yield FetchedTranscript(
+            snippets=[
+                FetchedTranscriptSnippet(
+                    text=" ".join(
+                        generator.choices(WORDS, cum_weights=CUMULATIVE_WEIGHTS, k=8)
+                    ),
+                    start=i * 2.0,
+                    duration=2.0,
+                )
+                for i in range(SNIPPETS_PER_TRANSCRIPT)
+            ],
+            video_id="video{index}".format(index=index),
+            language="English",
+            language_code="en",
+            is_generated=True,
+        )
+
+
+def scan_json_files(directory: str, query: str):
+    matches = []
+    for name in os.listdir(directory):
+        with open(os.path.join(directory, name), encoding="utf-8") as file:
+            snippets = json.load(file)
+        matches.extend(
+            (name, snippet["start"])
+            for snippet in snippets
+            if query in snippet["text"].lower()
+        )
+    return matches
+
+
+def main():
+    with (
+        TemporaryDirectory() as json_directory,
+        TemporaryDirectory() as index_directory,
+    ):
+        formatter = JSONFormatter()
+        index = CorpusIndex(index_directory)
+        indexing_time = 0.0
+        for transcript in build_transcripts():
+            with open(
+                os.path.join(json_directory, transcript.video_id + ".json"),
+                "w",
+                encoding="utf-8",
+            ) as file:
+                file.write(formatter.format_transcript(transcript))
+            start = time.perf_counter()
+            index.add(transcript)
+            indexing_time += time.perf_counter() - start
+        start = time.perf_counter()
+        index.flush()
+        index.wait_for_merges()
+        indexing_time += time.perf_counter() - start
+
+        print(
+            "{count} transcripts with {snippets} snippets each, indexed in {seconds:.1f} s "
+            "({segments} segments)".format(
+                count=TRANSCRIPT_COUNT,
+                snippets=SNIPPETS_PER_TRANSCRIPT,
+                seconds=indexing_time,
+                segments=index.segment_count,
+            )
+        )
+        for query in QUERIES:
+            report(
+                "search {query!r}".format(query=query),
+                measure(
+                    lambda: scan_json_files(json_directory, query), number=1, repeat=3
+                ),
+                measure(lambda: index.search(query), number=1, repeat=3),
+            )
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Compares answering "is this transcript a near-copy of one we already hold" by computing
+the exact Jaccard similarity of its shingles with the shingles of every stored
+transcript (kept in memory), with querying a `DuplicateIndex`.
+
+Run from the repository root: `python -m benchmarks.duplicate_detection`
+"""
+
+import os
+import random
+import time
+from tempfile import TemporaryDirectory
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+from youtube_transcript_api._search import _split_terms
+from youtube_transcript_api.duplicates import DuplicateIndex
+
+from ._utils import measure, report
+
+TRANSCRIPT_COUNT = 2_000
+WORDS_PER_TRANSCRIPT = 1_000
+WORDS = ["word{index}".format(index=index) for index in range(20_000)]
+
+
+def build_transcript(words, video_id):
+    return FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(
+                text=" ".join(words[index : index + 8]), start=index * 0.5, duration=4.0
+            )
+            for index in range(0, len(words), 8)
+        ],
+        video_id=video_id,
+        language="English",
+        language_code="en",
+        is_generated=True,
+    )
+
+
+def shingle(transcript: FetchedTranscript) -> set:
+    terms = [term for snippet in transcript for term in _split_terms(snippet.text)]
+    return {" ".join(terms[index : index + 5]) for index in range(len(terms) - 4)}
+
+
+def scan_shingle_sets(shingle_sets, transcript: FetchedTranscript):
+    shingles = shingle(transcript)
+    return [
+        video_id
+        for video_id, other in shingle_sets.items()
+        if len(shingles & other) / len(shingles | other) >= 0.8
+    ]
+
+
+def main():
+    generator = random.Random(0)
+    word_lists = [
+        generator.choices(WORDS, k=WORDS_PER_TRANSCRIPT)
+        for _ in range(TRANSCRIPT_COUNT)
+    ]
+    transcripts = [
+        build_transcript(words, "video{index}".format(index=index))
+        for index, words in enumerate(word_lists)
+    ]
+    # a copy of the first transcript with every 100th word changed
+    words = list(word_lists[0])
+    for index in range(0, len(words), 100):
+        words[index] = "edited"
+    query = build_transcript(words, "copy")
+
+    shingle_sets = {
+        transcript.video_id: shingle(transcript) for transcript in transcripts
+    }
+    with TemporaryDirectory() as directory:
+        index = DuplicateIndex(os.path.join(directory, "duplicates.db"))
+        start = time.perf_counter()
+        for transcript in transcripts:
+            index.add(transcript)
+        index.commit()
+        print(
+            "{count} transcripts with {words} words each, indexed in {seconds:.1f} s".format(
+                count=TRANSCRIPT_COUNT,
+                words=WORDS_PER_TRANSCRIPT,
+                seconds=time.perf_counter() - start,
+            )
+        )
+        assert scan_shingle_sets(shingle_sets, query) == ["video0"]
+        assert [match.video_id for match in index.query(query)] == ["video0"]
+        report(
+            "near-duplicate query (scan vs. DuplicateIndex)",
+            measure(lambda: scan_shingle_sets(shingle_sets, query), number=1, repeat=3),
+            measure(lambda: index.query(query), number=10, repeat=3),
+        )
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Compares fetching the transcripts of many videos one after another, like a loop calling
+`YouTubeTranscriptApi.fetch` does, with `YouTubeTranscriptApi.fetch_many`, which keeps
+up to 16 of them in flight at the same time. Both use an HTTP adapter, which answers
+every request with a static asset after a simulated network latency, so no requests are
+sent to YouTube.
+
+Run from the repository root: `python -m benchmarks.fetch_many`
+"""
+
+import io
+import time
+
+from requests import Response, Session
+from requests.adapters import BaseAdapter
+
+from youtube_transcript_api import YouTubeTranscriptApi
+
+from ._utils import load_asset, report
+
+FETCH_COUNT = 200
+MAX_IN_FLIGHT = 16
+LATENCY = 0.05
+ASSETS = {
+    "https://www.youtube.com/watch": load_asset("youtube.html.static"),
+    "https://www.youtube.com/youtubei/v1/player": load_asset(
+        "youtube.innertube.json.static"
+    ),
+    "https://www.youtube.com/api/timedtext": load_asset("transcript.xml.static"),
+}
+
+
+class SimulatedAdapter(BaseAdapter):
+    def send(self, request, **kwargs):
+        time.sleep(LATENCY)
+        response = Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(
+            next(
+                content
+                for prefix, content in ASSETS.items()
+                if request.url.startswith(prefix)
+            )
+        )
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def create_api() -> YouTubeTranscriptApi:
+    http_client = Session()
+    http_client.mount("https://", SimulatedAdapter())
+    return YouTubeTranscriptApi(http_client=http_client)
+
+
+def fetch_sequentially():
+    ytt_api = create_api()
+    return [ytt_api.fetch(video_id) for video_id in ["GJLlxj_dtq8"] * FETCH_COUNT]
+
+
+def fetch_many():
+    ytt_api = create_api()
+    return list(
+        ytt_api.fetch_many(["GJLlxj_dtq8"] * FETCH_COUNT, max_in_flight=MAX_IN_FLIGHT)
+    )
+
+
+def measure_once(function) -> float:
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1e6
+
+
+def main():
+    print(
+        "{count} fetches of 3 requests each, {latency:.0f} ms latency per request".format(
+            count=FETCH_COUNT, latency=LATENCY * 1000
+        )
+    )
+    report(
+        "fetch (loop vs. fetch_many, max_in_flight={max_in_flight})".format(
+            max_in_flight=MAX_IN_FLIGHT
+        ),
+        measure_once(fetch_sequentially),
+        measure_once(fetch_many),
+    )
+
+
+if __name__ == "__main__":
+    main()
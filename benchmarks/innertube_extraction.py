@@ -0,0 +1,38 @@
+"""
+Compares decoding the whole innertube response with only extracting the
+`playabilityStatus` and `captions` subtrees, for all innertube responses which are
+bundled as test assets.
+
+Run from the repository root: `python -m benchmarks.innertube_extraction`
+"""
+
+import json
+import os
+
+from youtube_transcript_api._transcripts import _InnertubeDataExtractor
+
+from ._utils import ASSETS_DIR, load_asset, measure, report
+
+
+def main():
+    for filename in sorted(os.listdir(ASSETS_DIR)):
+        if not filename.endswith(".innertube.json.static"):
+            continue
+        content = load_asset(filename)
+        report(
+            "{filename} ({size} KB)".format(
+                filename=filename.replace(".innertube.json.static", ""),
+                size=len(content) // 1024,
+            ),
+            measure(lambda: json.loads(content.decode("utf-8")), number=200),
+            measure(
+                lambda: _InnertubeDataExtractor.extract_from_text(
+                    content.decode("utf-8")
+                ),
+                number=200,
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Compares the CPU time spent per fetched transcript, if the transcript is only pickled
+(as an archival worker would do) and never inspected, for eagerly and lazily parsed
+transcripts with 10k snippets. The HTTP request is left out.
+
+Run from the repository root: `python -m benchmarks.lazy_fetch`
+"""
+
+import pickle
+
+from youtube_transcript_api._transcripts import (
+    CaptionWireFormat,
+    _LazySnippets,
+    _TranscriptParser,
+)
+
+from ._utils import measure, report
+from .transcript_parsing import build_xml
+
+SNIPPET_COUNT = 10_000
+
+
+def main():
+    raw_data = build_xml(SNIPPET_COUNT).encode("utf-8")
+    print("fetching and pickling {count} snippets".format(count=SNIPPET_COUNT))
+    report(
+        "eager vs. lazy",
+        measure(lambda: pickle.dumps(_TranscriptParser().parse(raw_data)), number=10),
+        measure(
+            lambda: pickle.dumps(_LazySnippets(raw_data, CaptionWireFormat.XML, False)),
+            number=10,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
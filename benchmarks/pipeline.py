@@ -0,0 +1,129 @@
+"""
+Compares fetching, formatting and writing the transcripts of many videos to a directory
+in three ways:
+
+- a loop doing all steps for one video after another
+- `YouTubeTranscriptApi.fetch_many`, with the results being formatted and written by
+  the thread consuming them
+- a `TranscriptPipeline`, which runs every step in its own stage
+
+`fetch_many` uses as many threads as the two network stages of the pipeline together,
+which are split by the number of requests of each stage (two for listing, one for
+downloading). All of them use an HTTP adapter, which answers every request with a static
+asset after a simulated network latency, so no requests are sent to YouTube. The
+transcripts have 1500 snippets each, roughly as many as a 40 minute video.
+
+Run from the repository root: `python -m benchmarks.pipeline`
+"""
+
+import io
+import time
+from tempfile import TemporaryDirectory
+
+from requests import Response, Session
+from requests.adapters import BaseAdapter
+
+from youtube_transcript_api import YouTubeTranscriptApi
+from youtube_transcript_api.formatters import WebVTTFormatter
+from youtube_transcript_api.pipeline import DirectoryWriter, TranscriptPipeline
+
+from ._utils import load_asset, report
+from .transcript_parsing import build_xml
+
+FETCH_COUNT = 200
+LIST_THREAD_COUNT = 8
+DOWNLOAD_THREAD_COUNT = 4
+LATENCY = 0.02
+ASSETS = {
+    "https://www.youtube.com/watch": load_asset("youtube.html.static"),
+    "https://www.youtube.com/youtubei/v1/player": load_asset(
+        "youtube.innertube.json.static"
+    ),
+    "https://www.youtube.com/api/timedtext": build_xml(1500).encode("utf-8"),
+}
+VIDEO_IDS = ["GJLlxj_dtq8"] * FETCH_COUNT
+
+
+class SimulatedAdapter(BaseAdapter):
+    def send(self, request, **kwargs):
+        time.sleep(LATENCY)
+        response = Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(
+            next(
+                content
+                for prefix, content in ASSETS.items()
+                if request.url.startswith(prefix)
+            )
+        )
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def create_api() -> YouTubeTranscriptApi:
+    http_client = Session()
+    http_client.mount("https://", SimulatedAdapter())
+    return YouTubeTranscriptApi(http_client=http_client)
+
+
+def run_loop(directory: str) -> None:
+    ytt_api = create_api()
+    formatter = WebVTTFormatter()
+    write = DirectoryWriter(directory, extension="vtt")
+    for video_id in VIDEO_IDS:
+        transcript = ytt_api.fetch(video_id)
+        write(transcript, formatter.format_transcript(transcript))
+
+
+def run_fetch_many(directory: str) -> None:
+    formatter = WebVTTFormatter()
+    write = DirectoryWriter(directory, extension="vtt")
+    for result in create_api().fetch_many(
+        VIDEO_IDS, max_in_flight=LIST_THREAD_COUNT + DOWNLOAD_THREAD_COUNT
+    ):
+        write(result.transcript, formatter.format_transcript(result.transcript))
+
+
+def run_pipeline(directory: str) -> None:
+    pipeline = TranscriptPipeline(
+        DirectoryWriter(directory, extension="vtt"),
+        ytt_api=create_api(),
+        formatter="webvtt",
+        workers={"list": LIST_THREAD_COUNT, "download": DOWNLOAD_THREAD_COUNT},
+    )
+    for _ in pipeline.run(VIDEO_IDS):
+        pass
+
+
+def measure_once(function) -> float:
+    with TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        function(directory)
+        return (time.perf_counter() - start) * 1e6
+
+
+def main():
+    print(
+        "{count} videos of 3 requests each, {latency:.0f} ms latency per request".format(
+            count=FETCH_COUNT, latency=LATENCY * 1000
+        )
+    )
+    loop = measure_once(run_loop)
+    fetch_many = measure_once(run_fetch_many)
+    pipeline = measure_once(run_pipeline)
+    report("loop vs. pipeline", loop, pipeline)
+    report(
+        "fetch_many ({threads} threads) vs. pipeline".format(
+            threads=LIST_THREAD_COUNT + DOWNLOAD_THREAD_COUNT
+        ),
+        fetch_many,
+        pipeline,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Compares exporting a transcript with 10k snippets using `dataclasses.asdict` for every
+snippet (as `FetchedTranscript.to_raw_data` did before) with the current
+`to_raw_data`, `iter_tuples` and the formatters building on them.
+
+Run from the repository root: `python -m benchmarks.raw_data_export`
+"""
+
+import json
+import pprint
+from dataclasses import asdict
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+from youtube_transcript_api.formatters import JSONFormatter, PrettyPrintFormatter
+
+from ._utils import measure, report
+
+SNIPPET_COUNT = 10_000
+
+
+def to_raw_data_asdict(transcript: FetchedTranscript):
+    return [asdict(snippet) for snippet in transcript]
+
+
+def main():
+    transcript = FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(
+                text="snippet {index}".format(index=i), start=i * 1.5, duration=1.5
+            )
+            for i in range(SNIPPET_COUNT)
+        ],
+        video_id="video_id",
+        language="English",
+        language_code="en",
+        is_generated=False,
+    )
+    columnar_transcript = transcript.to_columnar()
+    assert to_raw_data_asdict(transcript) == transcript.to_raw_data()
+
+    print("exporting {count} snippets".format(count=SNIPPET_COUNT))
+    baseline = measure(lambda: to_raw_data_asdict(transcript), number=10)
+    report("to_raw_data", baseline, measure(transcript.to_raw_data, number=10))
+    report(
+        "to_raw_data (columnar)",
+        baseline,
+        measure(columnar_transcript.to_raw_data, number=10),
+    )
+    report(
+        "iter_tuples",
+        baseline,
+        measure(lambda: list(transcript.iter_tuples()), number=10),
+    )
+    report(
+        "JSONFormatter",
+        measure(lambda: json.dumps(to_raw_data_asdict(transcript)), number=10),
+        measure(lambda: JSONFormatter().format_transcript(transcript), number=10),
+    )
+    report(
+        "PrettyPrintFormatter",
+        measure(lambda: pprint.pformat(to_raw_data_asdict(transcript)), number=2),
+        measure(lambda: PrettyPrintFormatter().format_transcript(transcript), number=2),
+    )
+
+
+if __name__ == "__main__":
+    main()
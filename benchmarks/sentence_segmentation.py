@@ -0,0 +1,82 @@
+"""
+Compares reconstructing sentences by first collecting all words of a transcript, along
+with their timestamps, and splitting them afterwards, with the streaming segmenter of
+`FetchedTranscript.sentences`, regarding their speed and peak memory usage. Unlike the
+segmenter, the baseline doesn't resolve overlapping snippets.
+
+Run from the repository root: `python -m benchmarks.sentence_segmentation`
+"""
+
+import tracemalloc
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+
+from ._utils import measure, report
+
+SNIPPET_COUNT = 100_000
+
+
+def collect_and_split(transcript: FetchedTranscript):
+    words = []
+    for snippet in transcript:
+        snippet_words = snippet.text.split()
+        for index, word in enumerate(snippet_words):
+            words.append(
+                (word, snippet.start + snippet.duration * index / len(snippet_words))
+            )
+    sentences = []
+    current = []
+    for word, time in words:
+        current.append((word, time))
+        if word.endswith((".", "!", "?")):
+            sentences.append((" ".join(w for w, _ in current), current[0][1], time))
+            current = []
+    return sentences
+
+
+def measure_peak_memory(function) -> int:
+    tracemalloc.start()
+    for _ in function():
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    transcript = FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(
+                text="and this is snippet {index}{end}".format(
+                    index=i, end="." if i % 4 == 3 else ""
+                ),
+                start=i * 1.5,
+                duration=3.0,
+            )
+            for i in range(SNIPPET_COUNT)
+        ],
+        video_id="video_id",
+        language="English (auto-generated)",
+        language_code="en",
+        is_generated=True,
+    )
+
+    print("{count} snippets".format(count=SNIPPET_COUNT))
+    print(
+        "peak memory: collect and split {baseline:.1f} MB, "
+        "streaming {optimized:.1f} MB".format(
+            baseline=measure_peak_memory(lambda: collect_and_split(transcript))
+            / 1024
+            / 1024,
+            optimized=measure_peak_memory(transcript.sentences) / 1024 / 1024,
+        )
+    )
+    report(
+        "sentences (collect and split vs. streaming)",
+        measure(lambda: collect_and_split(transcript), number=1),
+        measure(lambda: list(transcript.sentences()), number=1),
+    )
+
+
+if __name__ == "__main__":
+    main()
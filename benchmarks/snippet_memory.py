@@ -0,0 +1,60 @@
+"""
+Compares the memory used by the snippets of a transcript, when they are stored as plain
+dataclasses with a per-instance `__dict__` (as `FetchedTranscriptSnippet` was before)
+and as the slotted `FetchedTranscriptSnippet`.
+
+Run from the repository root: `python -m benchmarks.snippet_memory`
+"""
+
+import tracemalloc
+from dataclasses import dataclass
+
+from youtube_transcript_api import FetchedTranscriptSnippet
+
+SNIPPET_COUNT = 100_000
+
+
+@dataclass
+class DictSnippet:
+    text: str
+    start: float
+    duration: float
+
+
+def measure_memory(snippet_type: type) -> int:
+    """
+    :return: the number of bytes allocated for the snippets, excluding their texts
+    """
+    texts = ["snippet {index}".format(index=i) for i in range(SNIPPET_COUNT)]
+    tracemalloc.start()
+    snippets = [
+        snippet_type(text=text, start=i * 1.5, duration=1.5)
+        for i, text in enumerate(texts)
+    ]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del snippets
+    return size
+
+
+def main():
+    baseline = measure_memory(DictSnippet)
+    optimized = measure_memory(FetchedTranscriptSnippet)
+    print("memory of {count} snippets".format(count=SNIPPET_COUNT))
+    for name, size in (("dataclass", baseline), ("slotted dataclass", optimized)):
+        print(
+            "{name:<20} {total:>8.1f} MB {per_snippet:>6.1f} bytes per snippet".format(
+                name=name,
+                total=size / 1024 / 1024,
+                per_snippet=size / SNIPPET_COUNT,
+            )
+        )
+    print(
+        "saved {saved:.1f} bytes per snippet".format(
+            saved=(baseline - optimized) / SNIPPET_COUNT
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Compares cleaning the text of the snippets the way it was done before (compiling the
+HTML regex for every parser and always running both `unescape` and the tag regex) with
+`_TextCleaner`, which skips the steps that can't change the text.
+
+Run from the repository root: `python -m benchmarks.text_cleaning`
+"""
+
+import re
+from html import unescape
+
+from youtube_transcript_api._transcripts import _TextCleaner
+
+from ._utils import measure, report
+
+SNIPPET_COUNT = 100_000
+TEXTS = {
+    "plain": "Hey, this is just a test",
+    "tags": "this is <i>not</i> the <b>original</b> transcript",
+    "entities": "Tom &amp; Jerry &quot;made&quot; this up for testing",
+    "tags and entities": '<font color="#E5E5E5">Tom &amp; Jerry</font> &#39;made&#39;',
+}
+
+
+def clean_always(texts, preserve_formatting):
+    if preserve_formatting:
+        html_regex = re.compile(
+            r"<\/?(?!\/?(strong|em|b|i|mark|small|del|ins|sub|sup)\b).*?\b>",
+            re.IGNORECASE,
+        )
+    else:
+        html_regex = re.compile(r"<[^>]*>", re.IGNORECASE)
+    return [re.sub(html_regex, "", unescape(text)) for text in texts]
+
+
+def clean_if_needed(texts, preserve_formatting):
+    clean = _TextCleaner(preserve_formatting).clean
+    return [clean(text) for text in texts]
+
+
+def main():
+    print("cleaning {count} snippets".format(count=SNIPPET_COUNT))
+    for preserve_formatting in (False, True):
+        for name, text in TEXTS.items():
+            texts = [text] * SNIPPET_COUNT
+            assert clean_always(texts, preserve_formatting) == clean_if_needed(
+                texts, preserve_formatting
+            )
+            report(
+                "{name} (preserve_formatting={preserve_formatting})".format(
+                    name=name, preserve_formatting=preserve_formatting
+                ),
+                measure(lambda: clean_always(texts, preserve_formatting), number=1),
+                measure(lambda: clean_if_needed(texts, preserve_formatting), number=1),
+            )
+
+
+if __name__ == "__main__":
+    main()
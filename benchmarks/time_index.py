@@ -0,0 +1,79 @@
+"""
+Compares looking up the snippets shown at a given time and between two timestamps by
+scanning all snippets with the time index of `FetchedTranscript`, on a transcript with
+10k overlapping snippets.
+
+Run from the repository root: `python -m benchmarks.time_index`
+"""
+
+import random
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+from youtube_transcript_api._transcripts import _TimeIndex
+
+from ._utils import measure, report
+
+SNIPPET_COUNT = 10_000
+QUERY_COUNT = 1_000
+
+
+def main():
+    transcript = FetchedTranscript(
+        snippets=[
+            # like generated transcripts, every snippet overlaps with the next one
+            FetchedTranscriptSnippet(text="snippet", start=i * 2.0, duration=3.5)
+            for i in range(SNIPPET_COUNT)
+        ],
+        video_id="video_id",
+        language="English",
+        language_code="en",
+        is_generated=True,
+    )
+    generator = random.Random(0)
+    times = [generator.uniform(0, SNIPPET_COUNT * 2.0) for _ in range(QUERY_COUNT)]
+
+    def scan_at():
+        for time in times:
+            [
+                snippet
+                for snippet in transcript
+                if snippet.start <= time < snippet.start + snippet.duration
+            ]
+
+    def scan_between():
+        for time in times:
+            [
+                snippet
+                for snippet in transcript
+                if snippet.start < time + 60
+                and (snippet.start >= time or snippet.start + snippet.duration > time)
+            ]
+
+    def index_at():
+        for time in times:
+            transcript.at(time)
+
+    def index_between():
+        for time in times:
+            transcript.between(time, time + 60)
+
+    print(
+        "{queries} queries on {count} snippets".format(
+            queries=QUERY_COUNT, count=SNIPPET_COUNT
+        )
+    )
+    report(
+        "single scan vs. building the index",
+        measure(scan_at, number=1) / QUERY_COUNT,
+        measure(lambda: _TimeIndex(transcript.snippets), number=1),
+    )
+    report("at", measure(scan_at, number=1), measure(index_at, number=1))
+    report(
+        "between (1 minute)",
+        measure(scan_between, number=1),
+        measure(index_between, number=1),
+    )
+
+
+if __name__ == "__main__":
+    main()
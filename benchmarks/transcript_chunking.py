@@ -0,0 +1,91 @@
+"""
+Compares joining a transcript using the `TextFormatter`, splitting the resulting string
+into chunks of 1000 characters and looking up the timestamps of each chunk afterwards,
+with `FetchedTranscript.chunks`, regarding their speed and peak memory usage.
+
+Run from the repository root: `python -m benchmarks.transcript_chunking`
+"""
+
+import tracemalloc
+from bisect import bisect_right
+from itertools import accumulate
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+from youtube_transcript_api.formatters import TextFormatter
+
+from ._utils import measure, report
+
+SNIPPET_COUNT = 100_000
+CHUNK_SIZE = 1000
+
+
+def join_and_split(transcript: FetchedTranscript):
+    text = TextFormatter().format_transcript(transcript)
+    # the offset at which the text of each snippet starts in the joined text
+    snippet_offsets = list(
+        accumulate((len(snippet.text) + 1 for snippet in transcript), initial=0)
+    )
+    for offset in range(0, len(text), CHUNK_SIZE):
+        first = bisect_right(snippet_offsets, offset) - 1
+        last = min(
+            bisect_right(snippet_offsets, offset + CHUNK_SIZE - 1) - 1,
+            len(transcript) - 1,
+        )
+        yield (
+            text[offset : offset + CHUNK_SIZE],
+            transcript[first].start,
+            transcript[last].start + transcript[last].duration,
+        )
+
+
+def measure_peak_memory(function) -> int:
+    tracemalloc.start()
+    for _ in function():
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    transcript = FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(
+                text="this is the text of snippet {index}".format(index=i),
+                start=i * 1.5,
+                duration=1.5,
+            )
+            for i in range(SNIPPET_COUNT)
+        ],
+        video_id="video_id",
+        language="English",
+        language_code="en",
+        is_generated=True,
+    )
+
+    print("{count} snippets".format(count=SNIPPET_COUNT))
+    print(
+        "peak memory: join and split {baseline:.1f} MB, "
+        "chunks {optimized:.1f} MB".format(
+            baseline=measure_peak_memory(lambda: join_and_split(transcript))
+            / 1024
+            / 1024,
+            optimized=measure_peak_memory(
+                lambda: transcript.chunks(max_size=CHUNK_SIZE, overlap=100)
+            )
+            / 1024
+            / 1024,
+        )
+    )
+    report(
+        "chunking (join and split vs. chunks)",
+        measure(lambda: list(join_and_split(transcript)), number=1),
+        measure(
+            lambda: list(transcript.chunks(max_size=CHUNK_SIZE, overlap=100)),
+            number=1,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
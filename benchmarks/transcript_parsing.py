@@ -0,0 +1,90 @@
+"""
+Compares how long it takes to parse the same transcript, delivered in the different
+`CaptionWireFormat`s. The transcript is built by repeating the snippets of the bundled
+`transcript.xml.static` asset.
+
+Run from the repository root: `python -m benchmarks.transcript_parsing`
+"""
+
+import json
+from html import escape
+
+from youtube_transcript_api._transcripts import (
+    CaptionWireFormat,
+    _TRANSCRIPT_PARSERS,
+)
+
+from ._utils import measure
+
+SNIPPET_COUNT = 10_000
+TEXTS = (
+    "Hey, this is just a test",
+    "this is <i>not</i> the original transcript",
+    "just something shorter, I made up for testing",
+)
+
+
+def build_xml(count: int) -> str:
+    return (
+        '<?xml version="1.0" encoding="utf-8" ?><transcript>'
+        + "".join(
+            '<text start="{start}" dur="1.5">{text}</text>'.format(
+                start=i * 1.5, text=escape(TEXTS[i % 3], quote=False)
+            )
+            for i in range(count)
+        )
+        + "</transcript>"
+    )
+
+
+def build_srv3(count: int) -> str:
+    return (
+        '<?xml version="1.0" encoding="utf-8" ?><timedtext format="3"><body>'
+        + "".join(
+            '<p t="{start}" d="1500">{text}</p>'.format(
+                start=i * 1500, text=escape(TEXTS[i % 3], quote=False)
+            )
+            for i in range(count)
+        )
+        + "</body></timedtext>"
+    )
+
+
+def build_json3(count: int) -> str:
+    return json.dumps(
+        {
+            "events": [
+                {
+                    "tStartMs": i * 1500,
+                    "dDurationMs": 1500,
+                    "segs": [{"utf8": TEXTS[i % 3]}],
+                }
+                for i in range(count)
+            ]
+        }
+    )
+
+
+def main():
+    xml = build_xml(SNIPPET_COUNT)
+    cases = (
+        # passing a str skips the bytes tokenizer and builds an ElementTree instead
+        ("xml (ElementTree)", CaptionWireFormat.XML, xml),
+        ("xml", CaptionWireFormat.XML, xml.encode("utf-8")),
+        ("srv3", CaptionWireFormat.SRV3, build_srv3(SNIPPET_COUNT).encode("utf-8")),
+        ("json3", CaptionWireFormat.JSON3, build_json3(SNIPPET_COUNT).encode("utf-8")),
+    )
+    print("parsing {count} snippets".format(count=SNIPPET_COUNT))
+    for name, wire_format, data in cases:
+        parser = _TRANSCRIPT_PARSERS[wire_format]()
+        print(
+            "{name:<20} {size:>6} KB {duration:>10.1f} ms".format(
+                name=name,
+                size=len(data) // 1024,
+                duration=measure(lambda: parser.parse(data), number=5) / 1000,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
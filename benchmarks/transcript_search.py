@@ -0,0 +1,62 @@
+"""
+Compares searching a transcript with 30k snippets (about a 12 hour video) by checking
+every snippet with `in` against `FetchedTranscript.search`, which uses an inverted
+index. Note that `in` also matches parts of words and phrases can't span snippets.
+
+Run from the repository root: `python -m benchmarks.transcript_search`
+"""
+
+import random
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+from youtube_transcript_api._search import _TranscriptSearchIndex
+
+from ._utils import measure, report
+
+SNIPPET_COUNT = 30_000
+# word frequencies in natural language roughly follow Zipf's law
+WORDS = ["word{rank}".format(rank=rank) for rank in range(1, 5001)]
+WEIGHTS = [1 / rank for rank in range(1, 5001)]
+QUERIES = ("word120", "word7 word8", "word2000", "word4999 word1 word2")
+
+
+def main():
+    generator = random.Random(0)
+    transcript = FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(
+                text=" ".join(generator.choices(WORDS, WEIGHTS, k=8)),
+                start=i * 1.5,
+                duration=1.5,
+            )
+            for i in range(SNIPPET_COUNT)
+        ],
+        video_id="video_id",
+        language="English",
+        language_code="en",
+        is_generated=True,
+    )
+
+    def scan():
+        for query in QUERIES:
+            [snippet for snippet in transcript if query in snippet.text.lower()]
+
+    def search():
+        for query in QUERIES:
+            transcript.search(query)
+
+    print(
+        "{queries} queries on {count} snippets".format(
+            queries=len(QUERIES), count=SNIPPET_COUNT
+        )
+    )
+    report(
+        "single scan vs. building the index",
+        measure(scan, number=1) / len(QUERIES),
+        measure(lambda: _TranscriptSearchIndex(transcript.snippets), number=1),
+    )
+    report("search", measure(scan, number=3), measure(search, number=3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Compares rebuilding a transcript in a Python loop, creating a new
+`FetchedTranscriptSnippet` per snippet, with the transformations of
+`FetchedTranscript`, which operate on the columns of a columnar transcript.
+
+Run from the repository root: `python -m benchmarks.transcript_transforms`
+"""
+
+from dataclasses import replace
+from math import floor
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+
+from ._utils import measure, report
+
+SNIPPET_COUNT = 100_000
+
+
+def shift_in_loop(transcript: FetchedTranscript, offset: float) -> FetchedTranscript:
+    return replace(
+        transcript,
+        snippets=[
+            FetchedTranscriptSnippet(
+                text=snippet.text,
+                start=snippet.start + offset,
+                duration=snippet.duration,
+            )
+            for snippet in transcript
+        ],
+    )
+
+
+def bucket_in_loop(transcript: FetchedTranscript, window: float) -> FetchedTranscript:
+    buckets = {}
+    for snippet in transcript:
+        buckets.setdefault(floor(snippet.start / window), []).append(snippet.text)
+    return replace(
+        transcript,
+        snippets=[
+            FetchedTranscriptSnippet(
+                text=" ".join(buckets[key]), start=key * window, duration=window
+            )
+            for key in sorted(buckets)
+        ],
+    )
+
+
+def main():
+    transcript = FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(
+                text="snippet {index}".format(index=i), start=i * 1.5, duration=1.5
+            )
+            for i in range(SNIPPET_COUNT)
+        ],
+        video_id="video_id",
+        language="English",
+        language_code="en",
+        is_generated=True,
+    )
+    columnar_transcript = transcript.to_columnar()
+
+    print("{count} snippets".format(count=SNIPPET_COUNT))
+    report(
+        "shift (loop vs. columns)",
+        measure(lambda: shift_in_loop(transcript, 10.0), number=5),
+        measure(lambda: columnar_transcript.shift(10.0), number=5),
+    )
+    report(
+        "shift twice (loop vs. columns)",
+        measure(
+            lambda: shift_in_loop(shift_in_loop(transcript, 10.0), -10.0), number=5
+        ),
+        measure(lambda: columnar_transcript.shift(10.0).shift(-10.0), number=5),
+    )
+    report(
+        "30 second buckets (loop vs. columns)",
+        measure(lambda: bucket_in_loop(transcript, 30.0), number=5),
+        measure(lambda: columnar_transcript.bucket(30.0), number=5),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -162,27 +162,29 @@ def example_batch_processing():
     
     api = YouTubeTranscriptApi()
     
-    for i, video_id in enumerate(video_ids, 1):
-        try:
-            print(f"📹 Processing video {i}/{len(video_ids)}: {video_id}")
-            transcript = api.fetch(video_id)
-            
-            # Save each transcript
-            filename = f"batch_transcript_{video_id}.txt"
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(f"Video ID: {transcript.video_id}\n")
-                f.write(f"Language: {transcript.language}\n")
-                f.write("=" * 50 + "\n\n")
-                
-                for snippet in transcript:
-                    minutes = int(snippet.start // 60)
-                    seconds = int(snippet.start % 60)
-                    f.write(f"[{minutes:02d}:{seconds:02d}] {snippet.text}\n")
-            
-            print(f"✅ Saved: {filename}")
+    # fetch_many fetches up to 8 videos at the same time and yields each result as
+    # soon as it is available, so a failing video doesn't stop the others
+    for i, result in enumerate(api.fetch_many(video_ids, max_in_flight=8), 1):
+        video_id = result.video_id
+        print(f"📹 Processed video {i}/{len(video_ids)}: {video_id}")
+        if not result.is_successful:
+            print(f"❌ Failed for {video_id}: {result.error}")
+            continue
+        transcript = result.transcript
+        
+        # Save each transcript
+        filename = f"batch_transcript_{video_id}.txt"
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(f"Video ID: {transcript.video_id}\n")
+            f.write(f"Language: {transcript.language}\n")
+            f.write("=" * 50 + "\n\n")
             
-        except Exception as e:
-            print(f"❌ Failed for {video_id}: {e}")
+            for snippet in transcript:
+                minutes = int(snippet.start // 60)
+                seconds = int(snippet.start % 60)
+                f.write(f"[{minutes:02d}:{seconds:02d}] {snippet.text}\n")
+        
+        print(f"✅ Saved: {filename}")
 
 
 def example_error_handling():
@@ -1,11 +1,20 @@
 # ruff: noqa: F401
-from ._api import YouTubeTranscriptApi
+from ._api import YouTubeTranscriptApi, FetchResult
+from ._async_api import AsyncYouTubeTranscriptApi
+from ._async_http import AsyncHttpClient, AsyncHttpResponse, HttpxAsyncClient
+from ._async_transcripts import AsyncTranscript
 from ._transcripts import (
     TranscriptList,
     Transcript,
     FetchedTranscript,
     FetchedTranscriptSnippet,
+    SnippetColumns,
+    InnertubeApiKeyCache,
+    CaptionWireFormat,
 )
+from ._search import SearchMatch
+from ._sentences import Sentence
+from ._chunks import Chunk
 from ._errors import (
     YouTubeTranscriptApiException,
     CookieError,
@@ -30,10 +39,22 @@ from ._errors import (
 
 __all__ = [
     "YouTubeTranscriptApi",
+    "FetchResult",
+    "AsyncYouTubeTranscriptApi",
+    "AsyncHttpClient",
+    "AsyncHttpResponse",
+    "HttpxAsyncClient",
     "TranscriptList",
     "Transcript",
+    "AsyncTranscript",
     "FetchedTranscript",
     "FetchedTranscriptSnippet",
+    "SnippetColumns",
+    "SearchMatch",
+    "Sentence",
+    "Chunk",
+    "InnertubeApiKeyCache",
+    "CaptionWireFormat",
     "YouTubeTranscriptApiException",
     "CookieError",
     "CookiePathInvalid",
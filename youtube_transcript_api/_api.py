@@ -1,12 +1,101 @@
-from typing import Optional, Iterable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable, Dict, Generator, Optional, Iterable, Iterator, Tuple
 
 from requests import Session
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_POOLSIZE, DEFAULT_RETRIES, HTTPAdapter
 from urllib3 import Retry
 
 from .proxies import ProxyConfig
 
-from ._transcripts import TranscriptListFetcher, FetchedTranscript, TranscriptList
+from ._transcripts import (
+    TranscriptListFetcher,
+    FetchedTranscript,
+    TranscriptList,
+    InnertubeApiKeyCache,
+    CaptionWireFormat,
+)
+
+
+@dataclass(frozen=True)
+class FetchResult:
+    """
+    The result of fetching the transcript of a single video, as returned by
+    `YouTubeTranscriptApi.fetch_many`. Exactly one of `transcript` and `error` is set.
+    """
+
+    video_id: str
+    index: int
+    """
+    The position of the video ID in the video IDs passed to `fetch_many`.
+    """
+    transcript: Optional[FetchedTranscript] = None
+    error: Optional[Exception] = None
+    """
+    The exception fetching the transcript failed with. This usually is one of the
+    subclasses of `CouldNotRetrieveTranscript`, but can also be a network error.
+    """
+
+    @property
+    def is_successful(self) -> bool:
+        return self.error is None
+
+
+def _map_concurrently(
+    function: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_in_flight: int,
+    ordered: bool,
+    executor: Optional[Executor] = None,
+) -> Generator[Tuple[int, Any, Future], None, None]:
+    """
+    Calls `function` for every item in a pool of `max_in_flight` threads and yields the
+    index, the item and the completed future of each call. Items are only taken from
+    `items` once a thread is available, so the iterable is consumed lazily. If an
+    `executor` is given, the calls are submitted to it instead, without shutting it
+    down afterwards.
+
+    If `ordered` is set, the calls are yielded in the order of `items`, otherwise as
+    soon as they have completed. Either way, there are never more than `max_in_flight`
+    calls running or waiting to be yielded. So if the results are ordered, a slow call
+    holds back the following ones, instead of letting their results pile up.
+    """
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            yield from _map_concurrently(
+                function, items, max_in_flight, ordered, executor
+            )
+        return
+
+    items = enumerate(items)
+    # ordered by submission
+    in_flight: Dict[Future, Tuple[int, Any]] = {}
+    try:
+        while True:
+            for index, item in islice(items, max_in_flight - len(in_flight)):
+                in_flight[executor.submit(function, item)] = (index, item)
+            if not in_flight:
+                return
+            if ordered:
+                done = [next(iter(in_flight))]
+                wait(done)
+            else:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, item = in_flight.pop(future)
+                yield index, item, future
+    finally:
+        # if iterating is stopped early, the calls which haven't started yet are
+        # dropped
+        for future in in_flight:
+            future.cancel()
 
 
 class YouTubeTranscriptApi:
@@ -14,11 +103,16 @@ class YouTubeTranscriptApi:
         self,
         proxy_config: Optional[ProxyConfig] = None,
         http_client: Optional[Session] = None,
+        api_key_cache: Optional[InnertubeApiKeyCache] = None,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
     ):
         """
-        Note on thread-safety: As this class will initialize a `requests.Session`
-        object, it is not thread-safe. Make sure to initialize an instance of
-        `YouTubeTranscriptApi` per thread, if used in a multi-threading scenario!
+        Note on thread-safety: An instance of this class can be shared between
+        multiple threads, which then share its `requests.Session` and reuse the
+        connections of its connection pool. Make sure that `pool_maxsize` is at least
+        the number of threads making requests at the same time, as connections which
+        don't fit into the pool are closed after being used once.
 
         :param proxy_config: an optional ProxyConfig object, defining proxies used for
             all network requests. This can be used to work around your IP being blocked
@@ -28,36 +122,65 @@ class YouTubeTranscriptApi:
         :param http_client: You can optionally pass in a requests.Session object, if you
             manually want to share cookies between different instances of
             `YouTubeTranscriptApi`, overwrite defaults, specify SSL certificates, etc.
+        :param api_key_cache: an optional InnertubeApiKeyCache. If provided, the
+            innertube API key is only extracted from a video's watch page once and
+            then reused for all following videos, until it expires or stops working.
+            This saves downloading the watch page for every video. The same cache can
+            be shared between multiple instances of `YouTubeTranscriptApi`, even if
+            they are used in different threads.
+        :param pool_connections: the number of connection pools to cache, one for each
+            host requests are made to. This is passed on to the `HTTPAdapter` of
+            `requests`.
+        :param pool_maxsize: the maximum number of connections kept alive per host,
+            which is passed on to the `HTTPAdapter` of `requests`. When passing in an
+            `http_client`, its adapters are only replaced if `retries_when_blocked` is
+            set in the `proxy_config`.
         """
+        is_own_http_client = http_client is None
         http_client = Session() if http_client is None else http_client
         http_client.headers.update({"Accept-Language": "en-US"})
         # Cookie auth has been temporarily disabled, as it is not working properly with
         # YouTube's most recent changes.
         # if cookie_path is not None:
         #     http_client.cookies = _load_cookie_jar(cookie_path)
+        max_retries = DEFAULT_RETRIES
         if proxy_config is not None:
             http_client.proxies = proxy_config.to_requests_dict()
             if proxy_config.prevent_keeping_connections_alive:
                 http_client.headers.update({"Connection": "close"})
             if proxy_config.retries_when_blocked > 0:
-                retry_config = Retry(
+                max_retries = Retry(
                     total=proxy_config.retries_when_blocked,
                     status_forcelist=[429],
                 )
-                http_client.mount("http://", HTTPAdapter(max_retries=retry_config))
-                http_client.mount("https://", HTTPAdapter(max_retries=retry_config))
-        self._fetcher = TranscriptListFetcher(http_client, proxy_config=proxy_config)
+        if is_own_http_client or max_retries is not DEFAULT_RETRIES:
+            for prefix in ("http://", "https://"):
+                http_client.mount(
+                    prefix,
+                    HTTPAdapter(
+                        pool_connections=pool_connections,
+                        pool_maxsize=pool_maxsize,
+                        max_retries=max_retries,
+                    ),
+                )
+        self._fetcher = TranscriptListFetcher(
+            http_client,
+            proxy_config=proxy_config,
+            api_key_cache=api_key_cache,
+        )
 
     def fetch(
         self,
         video_id: str,
         languages: Iterable[str] = ("en",),
         preserve_formatting: bool = False,
+        wire_format: CaptionWireFormat = CaptionWireFormat.XML,
+        lazy: bool = False,
     ) -> FetchedTranscript:
         """
         Retrieves the transcript for a single video. This is just a shortcut for
         calling:
-        `YouTubeTranscriptApi().list(video_id).find_transcript(languages).fetch(preserve_formatting=preserve_formatting)`
+        `YouTubeTranscriptApi().list(video_id).find_transcript(languages).fetch(preserve_formatting=preserve_formatting, wire_format=wire_format, lazy=lazy)`
 
         :param video_id: the ID of the video you want to retrieve the transcript for.
             Make sure that this is the actual ID, NOT the full URL to the video!
@@ -66,13 +189,88 @@ class YouTubeTranscriptApi:
             german transcript (de) and then fetch the english transcript (en) if
             it fails to do so. This defaults to ["en"].
         :param preserve_formatting: whether to keep select HTML text formatting
+        :param wire_format: the format in which the transcript is downloaded from
+            YouTube. `CaptionWireFormat.JSON3` is the cheapest one to parse.
+        :param lazy: whether parsing the transcript is deferred until its snippets are
+            accessed for the first time
         """
         return (
             self.list(video_id)
             .find_transcript(languages)
-            .fetch(preserve_formatting=preserve_formatting)
+            .fetch(
+                preserve_formatting=preserve_formatting,
+                wire_format=wire_format,
+                lazy=lazy,
+            )
         )
 
+    def fetch_many(
+        self,
+        video_ids: Iterable[str],
+        languages: Iterable[str] = ("en",),
+        preserve_formatting: bool = False,
+        wire_format: CaptionWireFormat = CaptionWireFormat.XML,
+        lazy: bool = False,
+        max_in_flight: int = 8,
+        ordered: bool = False,
+    ) -> Iterator[FetchResult]:
+        """
+        Retrieves the transcripts of many videos concurrently, using a pool of
+        `max_in_flight` threads, and yields a `FetchResult` for each video, as soon as
+        it has been fetched. A video whose transcript can't be fetched doesn't stop
+        the others, instead the exception is returned as the `error` of its result.
+
+        `video_ids` is consumed lazily, so it can be a generator producing more IDs
+        than would fit into memory. Make sure that the `pool_maxsize` of this instance
+        is at least `max_in_flight`, so all threads can reuse their connections. If
+        you stop iterating early, no further transcripts are fetched.
+
+        :param video_ids: the IDs of the videos you want to retrieve the transcripts
+            for
+        :param languages: the language codes in a descending priority, just like for
+            `fetch`
+        :param preserve_formatting: whether to keep select HTML text formatting
+        :param wire_format: the format in which the transcripts are downloaded from
+            YouTube
+        :param lazy: whether parsing the transcripts is deferred until their snippets
+            are accessed for the first time
+        :param max_in_flight: the maximum number of videos fetched at the same time
+        :param ordered: whether the results are yielded in the order of `video_ids`,
+            instead of as soon as they are available
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight has to be at least 1")
+        languages = tuple(languages)
+
+        def fetch(video_id: str) -> FetchedTranscript:
+            return self.fetch(
+                video_id,
+                languages=languages,
+                preserve_formatting=preserve_formatting,
+                wire_format=wire_format,
+                lazy=lazy,
+            )
+
+        return self._iter_fetch_results(
+            _map_concurrently(fetch, video_ids, max_in_flight, ordered)
+        )
+
+    @staticmethod
+    def _iter_fetch_results(
+        completed_calls: Generator[Tuple[int, str, Future], None, None],
+    ) -> Iterator[FetchResult]:
+        try:
+            for index, video_id, future in completed_calls:
+                error = future.exception()
+                yield FetchResult(
+                    video_id=video_id,
+                    index=index,
+                    transcript=future.result() if error is None else None,
+                    error=error,
+                )
+        finally:
+            completed_calls.close()
+
     def list(
         self,
         video_id: str,
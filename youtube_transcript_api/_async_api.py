@@ -0,0 +1,96 @@
+from typing import Optional, Iterable
+
+from .proxies import ProxyConfig
+
+from ._async_http import AsyncHttpClient, HttpxAsyncClient
+from ._async_transcripts import _AsyncTranscriptListFetcher
+from ._transcripts import (
+    FetchedTranscript,
+    TranscriptList,
+    InnertubeApiKeyCache,
+    CaptionWireFormat,
+)
+
+
+class AsyncYouTubeTranscriptApi:
+    def __init__(
+        self,
+        proxy_config: Optional[ProxyConfig] = None,
+        http_client: Optional[AsyncHttpClient] = None,
+        api_key_cache: Optional[InnertubeApiKeyCache] = None,
+    ):
+        """
+        The asyncio counterpart of `YouTubeTranscriptApi`. A single instance can be
+        used to run any number of requests concurrently, on the same event loop. Make
+        sure to `await aclose()` it, or to use it as an async context manager, once
+        you are done.
+
+        :param proxy_config: an optional ProxyConfig object, defining proxies used for
+            all network requests. Unlike `YouTubeTranscriptApi`, requests aren't
+            retried on a 429 response, but retrying listing transcripts after a
+            `RequestBlocked` error is supported.
+        :param http_client: an optional `AsyncHttpClient`, which sends the requests. If
+            this isn't given, an `HttpxAsyncClient` is created, which requires `httpx`
+            to be installed. A client passed in is not closed by `aclose`.
+        :param api_key_cache: an optional InnertubeApiKeyCache, which is used just like
+            in `YouTubeTranscriptApi`
+        """
+        self._is_own_http_client = http_client is None
+        if http_client is None:
+            http_client = HttpxAsyncClient(proxy_config=proxy_config)
+        self._http_client = http_client
+        self._fetcher = _AsyncTranscriptListFetcher(
+            http_client,
+            proxy_config=proxy_config,
+            api_key_cache=api_key_cache,
+        )
+
+    async def __aenter__(self) -> "AsyncYouTubeTranscriptApi":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def fetch(
+        self,
+        video_id: str,
+        languages: Iterable[str] = ("en",),
+        preserve_formatting: bool = False,
+        wire_format: CaptionWireFormat = CaptionWireFormat.XML,
+        lazy: bool = False,
+    ) -> FetchedTranscript:
+        """
+        Retrieves the transcript for a single video. The parameters are the same as
+        the ones of `YouTubeTranscriptApi.fetch`.
+        """
+        transcript_list = await self.list(video_id)
+        return await transcript_list.find_transcript(languages).fetch(
+            preserve_formatting=preserve_formatting,
+            wire_format=wire_format,
+            lazy=lazy,
+        )
+
+    async def list(
+        self,
+        video_id: str,
+    ) -> TranscriptList:
+        """
+        Retrieves the list of transcripts which are available for a given video, just
+        like `YouTubeTranscriptApi.list`. The transcripts of the returned list are
+        `AsyncTranscript` objects, whose `fetch` method is a coroutine:
+
+        ```
+        transcript_list = await ytt_api.list('video_id')
+        transcript = transcript_list.find_transcript(['de', 'en'])
+        print(await transcript.fetch())
+        print(await transcript.translate('en').fetch())
+        ```
+        """
+        return await self._fetcher.fetch(video_id)
+
+    async def aclose(self) -> None:
+        """
+        Closes the HTTP client, if it has been created by this instance.
+        """
+        if self._is_own_http_client:
+            await self._http_client.aclose()
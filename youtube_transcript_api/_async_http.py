@@ -0,0 +1,147 @@
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from .proxies import ProxyConfig
+
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
+
+
+@dataclass(frozen=True)
+class AsyncHttpResponse:
+    """
+    A response, as returned by an `AsyncHttpClient`.
+    """
+
+    url: str
+    status_code: int
+    content: bytes = b""
+    """
+    The body of the response. This is empty, if the body has been passed to the
+    `consume` callback of `AsyncHttpClient.get` instead.
+    """
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class AsyncHttpClient(ABC):
+    """
+    The HTTP layer used by `AsyncYouTubeTranscriptApi`. By default, `HttpxAsyncClient`
+    is used, but you can implement this interface to use any other asyncio-based HTTP
+    library instead.
+
+    All requests have to send the cookies set using `set_cookie`, as well as the
+    header `Accept-Language: en-US`.
+    """
+
+    @abstractmethod
+    async def get(
+        self, url: str, consume: Optional[Callable[[bytes], bool]] = None
+    ) -> AsyncHttpResponse:
+        """
+        Sends a GET request to `url`.
+
+        :param consume: if this is given and the request succeeded (meaning its status
+            code is below 400), the body isn't returned as part of the response, but
+            passed to `consume` chunk by chunk, while it is received. As soon as
+            `consume` returns True, the rest of the body is discarded without reading
+            it.
+        """
+
+    @abstractmethod
+    async def post(self, url: str, json: Any) -> AsyncHttpResponse:
+        """
+        Sends a POST request to `url`, with `json` as its JSON encoded body.
+        """
+
+    @abstractmethod
+    def get_cookie(self, name: str, domain: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def set_cookie(self, name: str, value: str, domain: str) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        """
+        Releases the resources held by this client, like its open connections.
+        """
+
+
+class HttpxAsyncClient(AsyncHttpClient):
+    """
+    The default `AsyncHttpClient`, which is based on `httpx.AsyncClient`. This requires
+    `httpx` to be installed (`pip install httpx`).
+    """
+
+    CHUNK_SIZE = 16 * 1024
+
+    def __init__(
+        self,
+        client: Optional["httpx.AsyncClient"] = None,
+        proxy_config: Optional[ProxyConfig] = None,
+        max_connections: int = 100,
+    ):
+        """
+        :param client: an optional `httpx.AsyncClient`, if you want to configure
+            timeouts, SSL certificates, etc. yourself. If this isn't given, a new
+            client is created, which is closed by `aclose`.
+        :param proxy_config: an optional ProxyConfig object, defining proxies used for
+            all network requests of the created client. This can't be combined with
+            `client`, in which case the proxies have to be configured on the passed in
+            client.
+        :param max_connections: the maximum number of connections the created client
+            opens at the same time. Further requests wait until a connection becomes
+            available.
+        """
+        import httpx
+
+        if client is not None and proxy_config is not None:
+            raise ValueError("proxy_config can't be applied to an existing client")
+        self._is_own_client = client is None
+        if client is None:
+            limits = httpx.Limits(max_connections=max_connections)
+            headers = {}
+            mounts = None
+            if proxy_config is not None:
+                mounts = {
+                    "{scheme}://".format(scheme=scheme): httpx.AsyncHTTPTransport(
+                        proxy=url, limits=limits
+                    )
+                    for scheme, url in proxy_config.to_requests_dict().items()
+                }
+                if proxy_config.prevent_keeping_connections_alive:
+                    headers["Connection"] = "close"
+            client = httpx.AsyncClient(headers=headers, limits=limits, mounts=mounts)
+        client.headers.update({"Accept-Language": "en-US"})
+        self._client = client
+
+    async def get(
+        self, url: str, consume: Optional[Callable[[bytes], bool]] = None
+    ) -> AsyncHttpResponse:
+        if consume is None:
+            response = await self._client.get(url)
+            return AsyncHttpResponse(url, response.status_code, response.content)
+        async with self._client.stream("GET", url) as response:
+            if response.status_code < 400:
+                async for chunk in response.aiter_bytes(self.CHUNK_SIZE):
+                    if consume(chunk):
+                        break
+            return AsyncHttpResponse(url, response.status_code)
+
+    async def post(self, url: str, json: Any) -> AsyncHttpResponse:
+        response = await self._client.post(url, json=json)
+        return AsyncHttpResponse(url, response.status_code, response.content)
+
+    def get_cookie(self, name: str, domain: str) -> Optional[str]:
+        return self._client.cookies.get(name, domain=domain)
+
+    def set_cookie(self, name: str, value: str, domain: str) -> None:
+        self._client.cookies.set(name, value, domain=domain)
+
+    async def aclose(self) -> None:
+        if self._is_own_client:
+            await self._client.aclose()
@@ -0,0 +1,165 @@
+from typing import Dict, Optional
+
+from requests import HTTPError
+
+from .proxies import ProxyConfig
+from ._async_http import AsyncHttpClient, AsyncHttpResponse
+from ._errors import (
+    FailedToCreateConsentCookie,
+    IpBlocked,
+    RequestBlocked,
+    YouTubeRequestFailed,
+)
+from ._settings import WATCH_URL, INNERTUBE_CONTEXT, INNERTUBE_API_URL
+from ._transcripts import (
+    CaptionWireFormat,
+    FetchedTranscript,
+    InnertubeApiKeyCache,
+    TranscriptList,
+    TranscriptListFetcher,
+    _BaseTranscript,
+    _InnertubeDataExtractor,
+    _WatchPage,
+    _WatchPageScanner,
+)
+
+
+def _raise_http_errors(response: AsyncHttpResponse, video_id: str) -> AsyncHttpResponse:
+    if response.status_code == 429:
+        raise IpBlocked(video_id)
+    if response.status_code >= 400:
+        # the same error requests raises for the synchronous API
+        raise YouTubeRequestFailed(
+            video_id,
+            HTTPError(
+                "{status_code} {kind} Error for url: {url}".format(
+                    status_code=response.status_code,
+                    kind="Client" if response.status_code < 500 else "Server",
+                    url=response.url,
+                )
+            ),
+        )
+    return response
+
+
+class AsyncTranscript(_BaseTranscript):
+    """
+    The asynchronous counterpart of `Transcript`, as listed by
+    `AsyncYouTubeTranscriptApi.list`.
+    """
+
+    async def fetch(
+        self,
+        preserve_formatting: bool = False,
+        wire_format: CaptionWireFormat = CaptionWireFormat.XML,
+        lazy: bool = False,
+    ) -> FetchedTranscript:
+        """
+        Loads the actual transcript data. The parameters are the same as the ones of
+        `Transcript.fetch`.
+        """
+        wire_format = CaptionWireFormat(wire_format)
+        response = _raise_http_errors(
+            await self._http_client.get(self._get_url(wire_format)), self.video_id
+        )
+        return self._parse(response.content, wire_format, preserve_formatting, lazy)
+
+    def translate(self, language_code: str) -> "AsyncTranscript":
+        return self._translate(language_code)
+
+
+class _AsyncTranscriptListFetcher:
+    """
+    The asynchronous counterpart of `TranscriptListFetcher`, which shares its parsing
+    and error handling.
+    """
+
+    def __init__(
+        self,
+        http_client: AsyncHttpClient,
+        proxy_config: Optional[ProxyConfig],
+        api_key_cache: Optional[InnertubeApiKeyCache] = None,
+    ):
+        self._http_client = http_client
+        self._proxy_config = proxy_config
+        self._api_key_cache = api_key_cache
+
+    async def fetch(self, video_id: str) -> TranscriptList:
+        return TranscriptList.build(
+            self._http_client,
+            video_id,
+            await self._fetch_captions_json(video_id),
+            transcript_type=AsyncTranscript,
+        )
+
+    async def _fetch_captions_json(self, video_id: str, try_number: int = 0) -> Dict:
+        try:
+            innertube_data = await self._fetch_innertube_data_for_video(video_id)
+            return TranscriptListFetcher._extract_captions_json(
+                innertube_data, video_id
+            )
+        except RequestBlocked as exception:
+            retries = (
+                0
+                if self._proxy_config is None
+                else self._proxy_config.retries_when_blocked
+            )
+            if try_number + 1 < retries:
+                return await self._fetch_captions_json(
+                    video_id, try_number=try_number + 1
+                )
+            raise exception.with_proxy_config(self._proxy_config)
+
+    async def _fetch_innertube_data_for_video(self, video_id: str) -> Dict:
+        if self._api_key_cache is not None:
+            api_key = self._api_key_cache.get()
+            if api_key is not None:
+                try:
+                    return await self._fetch_innertube_data(video_id, api_key)
+                except YouTubeRequestFailed:
+                    self._api_key_cache.invalidate(api_key)
+
+        watch_page = await self._fetch_watch_page(video_id)
+        api_key = TranscriptListFetcher._extract_innertube_api_key(watch_page, video_id)
+        if self._api_key_cache is not None:
+            self._api_key_cache.set(api_key)
+        return await self._fetch_innertube_data(video_id, api_key)
+
+    async def _fetch_watch_page(self, video_id: str) -> _WatchPage:
+        consent_cookie = self._get_consent_cookie()
+        watch_page = await self._scan_html(video_id)
+        if watch_page.requires_consent:
+            # another task might have created a consent cookie, since the watch page
+            # has been requested. As there is no `await` in between, no lock is needed
+            # to check and create the cookie.
+            if self._get_consent_cookie() == consent_cookie:
+                if watch_page.consent_value is None:
+                    raise FailedToCreateConsentCookie(video_id)
+                self._http_client.set_cookie(
+                    "CONSENT", "YES+" + watch_page.consent_value, domain=".youtube.com"
+                )
+            watch_page = await self._scan_html(video_id)
+            if watch_page.requires_consent:
+                raise FailedToCreateConsentCookie(video_id)
+        return watch_page
+
+    def _get_consent_cookie(self) -> Optional[str]:
+        return self._http_client.get_cookie("CONSENT", domain=".youtube.com")
+
+    async def _scan_html(self, video_id: str) -> _WatchPage:
+        scanner = _WatchPageScanner()
+        response = await self._http_client.get(
+            WATCH_URL.format(video_id=video_id), consume=scanner.feed
+        )
+        _raise_http_errors(response, video_id)
+        return scanner.watch_page
+
+    async def _fetch_innertube_data(self, video_id: str, api_key: str) -> Dict:
+        response = await self._http_client.post(
+            INNERTUBE_API_URL.format(api_key=api_key),
+            json={
+                "context": INNERTUBE_CONTEXT,
+                "videoId": video_id,
+            },
+        )
+        return _InnertubeDataExtractor.extract(_raise_http_errors(response, video_id))
@@ -0,0 +1,111 @@
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from itertools import accumulate, islice, repeat
+from operator import add
+from typing import Callable, Iterable, Iterator, List, Tuple
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """
+    A chunk of consecutive snippets of a transcript, as returned by
+    `FetchedTranscript.chunks`.
+    """
+
+    text: str
+    start: float
+    """
+    The start time of the first snippet of the chunk, in seconds.
+    """
+    end: float
+    """
+    The time at which the last snippet of the chunk has disappeared from the screen, in
+    seconds.
+    """
+    snippets: range
+    """
+    The indices of the snippets this chunk consists of.
+    """
+
+
+# the number of snippets read at once
+_BATCH_SIZE = 1024
+
+
+def _chunk_snippets(
+    rows: Iterable[Tuple[str, float, float]],
+    max_size: int,
+    overlap: int,
+    length_function: Callable[[str], int],
+    separator: str,
+) -> Iterator[Chunk]:
+    """
+    Splits the snippets into chunks, reading them in batches. Instead of adding one
+    snippet after another to a chunk, the sizes of the snippets are summed up for each
+    batch, so the boundaries of the chunks can be found using binary search.
+    """
+    separator_size = length_function(separator)
+    rows = iter(rows)
+    # the buffered snippets, starting with the first one of the current chunk
+    texts: List[str] = []
+    starts: List[float] = []
+    ends: List[float] = []
+    # the total size of the buffered snippets before each snippet, including a
+    # separator after every snippet
+    offsets = [0]
+    # the index of the first buffered snippet in the transcript
+    buffer_index = 0
+    first = 0
+    is_exhausted = False
+    while True:
+        # the chunk ends before the first snippet, which doesn't fit into it anymore
+        stop = (
+            bisect_right(offsets, offsets[first] + max_size + separator_size, first + 1)
+            - 1
+        )
+        if stop == len(texts) and not is_exhausted:
+            # it's unknown whether the following snippet still fits into the chunk
+            batch = list(islice(rows, _BATCH_SIZE))
+            if not batch:
+                is_exhausted = True
+                continue
+            batch_texts, batch_starts, batch_durations = zip(*batch)
+            texts.extend(batch_texts)
+            starts.extend(batch_starts)
+            ends.extend(map(add, batch_starts, batch_durations))
+            offsets.extend(
+                accumulate(
+                    map(add, map(length_function, batch_texts), repeat(separator_size)),
+                    initial=offsets[-1],
+                )
+            )
+            # the initial value has already been part of the offsets
+            del offsets[-len(batch) - 1]
+            continue
+        if first == len(texts):
+            return
+        # a snippet exceeding `max_size` becomes a chunk of its own
+        stop = max(stop, first + 1)
+        yield Chunk(
+            text=separator.join(filter(None, texts[first:stop])),
+            start=starts[first],
+            end=max(ends[first:stop]),
+            snippets=range(buffer_index + first, buffer_index + stop),
+        )
+        if stop == len(texts):
+            # either all snippets have been chunked, or the chunk consists of a single
+            # snippet exceeding `max_size`, which can't be part of an overlap
+            first = stop
+            continue
+        # the next chunk starts with the last snippets of this chunk, which fit into
+        # the overlap and leave room for the next snippet
+        first = max(
+            bisect_left(offsets, offsets[stop] - separator_size - overlap, first, stop),
+            bisect_left(
+                offsets, offsets[stop + 1] - separator_size - max_size, first, stop
+            ),
+        )
+        if first >= _BATCH_SIZE:
+            del texts[:first], starts[:first], ends[:first], offsets[:first]
+            buffer_index += first
+            first = 0
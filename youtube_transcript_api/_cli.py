@@ -1,10 +1,28 @@
 import argparse
 from typing import List
 
+from requests.adapters import DEFAULT_POOLSIZE
+
 from .proxies import GenericProxyConfig, WebshareProxyConfig
 from .formatters import FormatterLoader
+from .pipeline import DirectoryWriter, StageMetrics, TranscriptPipeline
+
+from ._api import (
+    YouTubeTranscriptApi,
+    FetchedTranscript,
+    TranscriptList,
+    _map_concurrently,
+)
+from ._transcripts import Transcript
+
 
-from ._api import YouTubeTranscriptApi, FetchedTranscript, TranscriptList
+FILE_EXTENSIONS = {
+    "json": "json",
+    "pretty": "txt",
+    "text": "txt",
+    "webvtt": "vtt",
+    "srt": "srt",
+}
 
 
 class YouTubeTranscriptCli:
@@ -38,22 +56,29 @@ class YouTubeTranscriptCli:
 
         ytt_api = YouTubeTranscriptApi(
             proxy_config=proxy_config,
+            pool_maxsize=max(parsed_args.max_in_flight, DEFAULT_POOLSIZE),
         )
 
-        for video_id in parsed_args.video_ids:
-            try:
-                transcript_list = ytt_api.list(video_id)
-                if parsed_args.list_transcripts:
-                    transcripts.append(transcript_list)
-                else:
-                    transcripts.append(
-                        self._fetch_transcript(
-                            parsed_args,
-                            transcript_list,
-                        )
-                    )
-            except Exception as exception:
+        if parsed_args.output_dir is not None and not parsed_args.list_transcripts:
+            return self._run_pipeline(parsed_args, ytt_api)
+
+        def process_video(video_id: str):
+            transcript_list = ytt_api.list(video_id)
+            if parsed_args.list_transcripts:
+                return transcript_list
+            return self._fetch_transcript(parsed_args, transcript_list)
+
+        for _, _, future in _map_concurrently(
+            process_video,
+            parsed_args.video_ids,
+            max_in_flight=parsed_args.max_in_flight,
+            ordered=True,
+        ):
+            exception = future.exception()
+            if exception is not None:
                 exceptions.append(exception)
+            else:
+                transcripts.append(future.result())
 
         print_sections = [str(exception) for exception in exceptions]
         if transcripts:
@@ -70,11 +95,81 @@ class YouTubeTranscriptCli:
 
         return "\n\n".join(print_sections)
 
+    def _run_pipeline(self, parsed_args, ytt_api: YouTubeTranscriptApi) -> str:
+        pipeline = TranscriptPipeline(
+            DirectoryWriter(
+                parsed_args.output_dir, extension=FILE_EXTENSIONS[parsed_args.format]
+            ),
+            ytt_api=ytt_api,
+            find_transcript=lambda transcript_list: self._find_transcript(
+                parsed_args, transcript_list
+            ),
+            formatter=parsed_args.format,
+            workers={
+                "list": parsed_args.max_in_flight,
+                "download": parsed_args.max_in_flight,
+            },
+        )
+        exceptions = []
+        written_count = 0
+        for result in pipeline.run(parsed_args.video_ids):
+            if result.is_successful:
+                written_count += 1
+            else:
+                exceptions.append(result.error)
+
+        print_sections = [str(exception) for exception in exceptions]
+        print_sections.append(
+            "Wrote {count} transcript(s) to {output_dir}".format(
+                count=written_count, output_dir=parsed_args.output_dir
+            )
+        )
+        if parsed_args.print_metrics:
+            print_sections.append(self._format_metrics(pipeline.metrics()))
+        return "\n\n".join(print_sections)
+
+    @staticmethod
+    def _format_metrics(metrics: List[StageMetrics]) -> str:
+        row = "{:<10}{:>8}{:>11}{:>8}{:>10}{:>10}{:>11}{:>11}"
+        lines = [
+            row.format(
+                "stage",
+                "workers",
+                "processed",
+                "failed",
+                "busy s",
+                "idle s",
+                "blocked s",
+                "max queue",
+            )
+        ]
+        for stage in metrics:
+            lines.append(
+                row.format(
+                    stage.name,
+                    stage.workers,
+                    stage.processed,
+                    stage.failed,
+                    "{:.2f}".format(stage.busy_seconds),
+                    "{:.2f}".format(stage.idle_seconds),
+                    "{:.2f}".format(stage.blocked_seconds),
+                    "{}/{}".format(stage.max_queue_depth, stage.queue_size),
+                )
+            )
+        return "\n".join(lines)
+
     def _fetch_transcript(
         self,
         parsed_args,
         transcript_list: TranscriptList,
     ) -> FetchedTranscript:
+        return self._find_transcript(parsed_args, transcript_list).fetch()
+
+    def _find_transcript(
+        self,
+        parsed_args,
+        transcript_list: TranscriptList,
+    ) -> Transcript:
         if parsed_args.exclude_manually_created:
             transcript = transcript_list.find_generated_transcript(
                 parsed_args.languages
@@ -89,7 +184,7 @@ class YouTubeTranscriptCli:
         if parsed_args.translate:
             transcript = transcript.translate(parsed_args.translate)
 
-        return transcript.fetch()
+        return transcript
 
     def _parse_args(self):
         parser = argparse.ArgumentParser(
@@ -152,6 +247,32 @@ class YouTubeTranscriptCli:
                 "languages are available."
             ),
         )
+        parser.add_argument(
+            "--max-in-flight",
+            default=1,
+            type=self._positive_int,
+            metavar="N",
+            help=(
+                "The number of videos which are fetched at the same time. The output is in the order the video IDs "
+                "are given in, regardless of this."
+            ),
+        )
+        parser.add_argument(
+            "--output-dir",
+            default=None,
+            metavar="DIR",
+            help=(
+                "Write each transcript to its own file in this directory, instead of printing them. The transcripts "
+                "are listed, downloaded, parsed, formatted and written in a pipeline, in which these steps overlap."
+            ),
+        )
+        parser.add_argument(
+            "--print-metrics",
+            action="store_const",
+            const=True,
+            default=False,
+            help="Print the metrics of each step of the pipeline used with --output-dir.",
+        )
         parser.add_argument(
             "--webshare-proxy-username",
             default=None,
@@ -186,6 +307,15 @@ class YouTubeTranscriptCli:
 
         return self._sanitize_video_ids(parser.parse_args(self._args))
 
+    @staticmethod
+    def _positive_int(value: str) -> int:
+        number = int(value)
+        if number < 1:
+            raise argparse.ArgumentTypeError(
+                "{value} is not a positive integer".format(value=value)
+            )
+        return number
+
     def _sanitize_video_ids(self, args):
         args.video_ids = [video_id.replace("\\", "") for video_id in args.video_ids]
         return args
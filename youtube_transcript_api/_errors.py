@@ -1,3 +1,4 @@
+import copyreg
 from pathlib import Path
 from typing import Iterable, Optional, List
 
@@ -52,6 +53,11 @@ class CouldNotRetrieveTranscript(YouTubeTranscriptApiException):
         self.video_id = video_id
         super().__init__()
 
+    def __reduce__(self):
+        # the subclasses take different arguments, which aren't stored in `args`, so
+        # the exception is unpickled from its attributes instead of being constructed
+        return copyreg.__newobj__, (type(self),), self.__dict__
+
     def _build_error_message(self) -> str:
         error_message = self.ERROR_MESSAGE.format(
             video_url=WATCH_URL.format(video_id=self.video_id)
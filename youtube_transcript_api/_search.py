@@ -0,0 +1,182 @@
+import re
+import unicodedata
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._transcripts import FetchedTranscriptSnippet
+
+
+_WORD_REGEX = re.compile(r"\w+")
+
+
+def _split_words(text: str) -> List[str]:
+    """
+    Splits `text` into words, after applying NFKC normalization, so that different
+    representations of the same character are treated the same.
+    """
+    return _WORD_REGEX.findall(unicodedata.normalize("NFKC", text))
+
+
+def _split_terms(text: str) -> List[str]:
+    """
+    Splits `text` into the normalized words used for matching. In addition to
+    `_split_words`, the words are case folded, to make matching case-insensitive.
+    Every word is folded on its own, as folding can turn a single word into multiple
+    ones (e.g. "İ" into "i̇").
+    """
+    return [word.casefold() for word in _split_words(text)]
+
+
+@dataclass(frozen=True)
+class SearchMatch:
+    """
+    An occurrence of a search query in a transcript.
+    """
+
+    start: float
+    """
+    The start time of the snippet the match begins in, in seconds.
+    """
+    snippets: Tuple["FetchedTranscriptSnippet", ...]
+    """
+    The snippets the match spans. A phrase can start in one snippet and end in one of
+    the following ones.
+    """
+    context: Optional[str] = None
+    """
+    The matched words, along with the words surrounding them, if a context has been
+    requested.
+    """
+
+
+class _TranscriptSearchIndex:
+    """
+    An inverted index of the words in a transcript. The words of all snippets are
+    numbered consecutively, so that phrases can be found across snippet boundaries,
+    and the index maps every normalized word to the positions it occurs at.
+    """
+
+    def __init__(self, snippets: Sequence["FetchedTranscriptSnippet"]):
+        self._snippets = snippets
+        self._terms: List[str] = []
+        # the position of the first word of each snippet, followed by the word count
+        self._snippet_offsets = array("i", [0])
+        for snippet in snippets:
+            self._terms.extend(_split_terms(snippet.text))
+            self._snippet_offsets.append(len(self._terms))
+        postings: Dict[str, List[int]] = {}
+        for position, term in enumerate(self._terms):
+            positions = postings.get(term)
+            if positions is None:
+                postings[term] = [position]
+            else:
+                positions.append(position)
+        self._postings = {
+            term: array("i", positions) for term, positions in postings.items()
+        }
+
+    def search(
+        self,
+        query: str,
+        context: Optional[int] = None,
+        highlight: Tuple[str, str] = ("**", "**"),
+    ) -> List[SearchMatch]:
+        terms = _split_terms(query)
+        return [
+            self._build_match(position, len(terms), context, highlight)
+            for position in self._find_phrase(terms)
+        ]
+
+    def _find_phrase(self, terms: List[str]) -> List[int]:
+        if not terms:
+            return []
+        # only the positions of the rarest term have to be checked
+        rarest_offset = min(
+            range(len(terms)),
+            key=lambda offset: len(self._postings.get(terms[offset], ())),
+        )
+        word_count = len(terms)
+        positions = []
+        for rarest_position in self._postings.get(terms[rarest_offset], ()):
+            position = rarest_position - rarest_offset
+            if position >= 0 and self._terms[position : position + word_count] == terms:
+                positions.append(position)
+        return positions
+
+    def _build_match(
+        self,
+        position: int,
+        word_count: int,
+        context: Optional[int],
+        highlight: Tuple[str, str],
+    ) -> SearchMatch:
+        end = position + word_count
+        first_snippet = self._get_snippet_index(position)
+        last_snippet = self._get_snippet_index(end - 1)
+        snippets = tuple(
+            self._snippets[index] for index in range(first_snippet, last_snippet + 1)
+        )
+        return SearchMatch(
+            start=snippets[0].start,
+            snippets=snippets,
+            context=(
+                None
+                if context is None
+                else _build_context(
+                    lambda index: self._snippets[index].text,
+                    self._snippet_offsets,
+                    (position, end),
+                    (0, len(self._terms)),
+                    context,
+                    highlight,
+                )
+            ),
+        )
+
+    def _get_snippet_index(self, position: int) -> int:
+        return bisect_right(self._snippet_offsets, position) - 1
+
+
+def _build_context(
+    get_text: Callable[[int], str],
+    snippet_offsets: Sequence[int],
+    match: Tuple[int, int],
+    bounds: Tuple[int, int],
+    context: int,
+    highlight: Tuple[str, str],
+) -> str:
+    """
+    Returns the words of a match, enclosed in `highlight` and surrounded by `context`
+    words. The original words aren't kept in the indexes, so the snippets around the
+    match are split again.
+
+    :param get_text: returns the text of the snippet with the given index
+    :param snippet_offsets: the position of the first word of each snippet
+    :param match: the position of the first word of the match and the position after
+        its last word
+    :param bounds: the range of positions the context may be taken from
+    """
+    position, end = match
+    context_start = max(position - context, bounds[0])
+    context_end = min(end + context, bounds[1])
+    first_snippet = bisect_right(snippet_offsets, context_start) - 1
+    last_snippet = bisect_right(snippet_offsets, context_end - 1) - 1
+    words = [
+        word
+        for index in range(first_snippet, last_snippet + 1)
+        for word in _split_words(get_text(index))
+    ]
+    offset = snippet_offsets[first_snippet]
+    matched = "{opening}{words}{closing}".format(
+        opening=highlight[0],
+        words=" ".join(words[position - offset : end - offset]),
+        closing=highlight[1],
+    )
+    return " ".join(
+        words[context_start - offset : position - offset]
+        + [matched]
+        + words[end - offset : context_end - offset]
+    )
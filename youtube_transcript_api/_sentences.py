@@ -0,0 +1,132 @@
+import re
+from itertools import chain, islice
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+_WORD_REGEX = re.compile(r"\S+")
+# the end of a word ending a sentence, which may be followed by closing quotes or
+# brackets
+_SENTENCE_END_REGEX = re.compile(r"[.!?…。！？]['\"”’)\]]*(?=\s|$)")
+# repeated words are only removed from overlapping snippets, if there are at least two
+# of them, as a single repeated word ("that that") is common in speech
+_MIN_REPEATED_WORDS = 2
+_MAX_REPEATED_WORDS = 8
+
+
+@dataclass(frozen=True)
+class Sentence:
+    """
+    A sentence reconstructed from the snippets of a transcript.
+    """
+
+    text: str
+    start: float
+    """
+    The time at which the first word of the sentence is spoken, in seconds.
+    """
+    end: float
+    """
+    The time at which the last word of the sentence has been spoken, in seconds.
+    """
+
+
+def _resolve_overlaps(
+    rows: Iterable[Tuple[str, float, float]],
+) -> Iterator[Tuple[str, float, float, int]]:
+    """
+    Yields the text, start and end of every snippet, along with the offset of the first
+    character in the text, which hasn't been part of the previous snippet.
+
+    Snippets of generated transcripts stay on screen until the following ones have
+    appeared, so the end of every snippet is moved to the start of the next one, if
+    they overlap. If the next snippet starts with words the overlapping snippet has
+    ended with, those are skipped.
+    """
+    previous: Optional[Tuple[str, float, float]] = None
+    previous_offset = 0
+    previous_words: List[str] = []
+    for text, start, duration in rows:
+        offset = 0
+        if previous is not None:
+            previous_text, previous_start, previous_end = previous
+            if previous_start <= start < previous_end:
+                previous_end = start
+                offset = _find_repeated_words(previous_words, text)
+            yield previous_text, previous_start, previous_end, previous_offset
+        previous = (text, start, start + duration)
+        previous_offset = offset
+        previous_words = text.casefold().split()[-_MAX_REPEATED_WORDS:]
+    if previous is not None:
+        yield (*previous, previous_offset)
+
+
+def _find_repeated_words(previous_words: List[str], text: str) -> int:
+    """
+    Returns the offset in `text` after the longest sequence of words it starts with,
+    which `previous_words` (case folded) ends with, or 0, if there is none.
+    """
+    first_word = text.split(None, 1)[:1]
+    if not first_word:
+        return 0
+    first_word_folded = first_word[0].casefold()
+    if first_word_folded not in previous_words:
+        return 0
+    # the number of words the sequence could consist of, in descending order
+    counts = [
+        len(previous_words) - index
+        for index, word in enumerate(previous_words)
+        if word == first_word_folded
+        and len(previous_words) - index >= _MIN_REPEATED_WORDS
+    ]
+    if not counts:
+        return 0
+    words = text.casefold().split(None, counts[0])[: counts[0]]
+    for count in counts:
+        if previous_words[-count:] == words[:count]:
+            *_, last_match = islice(_WORD_REGEX.finditer(text), count)
+            return last_match.end()
+    return 0
+
+
+def _segment_sentences(
+    rows: Iterable[Tuple[str, float, float]],
+    max_pause: float,
+    max_duration: Optional[float],
+) -> Iterator[Sentence]:
+    words: List[str] = []
+    sentence_start = sentence_end = 0.0
+    for text, start, end, offset in _resolve_overlaps(rows):
+        if words and (
+            start - sentence_end >= max_pause
+            or (max_duration is not None and end - sentence_start > max_duration)
+        ):
+            yield Sentence(text=" ".join(words), start=sentence_start, end=sentence_end)
+            words = []
+        # the time at which a word is spoken is estimated from its position in the text
+        seconds_per_character = (end - start) / len(text) if text else 0.0
+        position = offset
+        # the text is split at the ends of sentences, instead of checking every word
+        for stop in chain(
+            (match.end() for match in _SENTENCE_END_REGEX.finditer(text, offset)),
+            (None,),
+        ):
+            part = text[position:stop]
+            part_words = part.split()
+            if part_words:
+                if not words:
+                    sentence_start = start + seconds_per_character * (
+                        position + len(part) - len(part.lstrip())
+                    )
+                words.extend(part_words)
+                sentence_end = start + seconds_per_character * (
+                    position + len(part.rstrip())
+                )
+                if stop is not None:
+                    yield Sentence(
+                        text=" ".join(words), start=sentence_start, end=sentence_end
+                    )
+                    words = []
+            position = stop
+    if words:
+        yield Sentence(text=" ".join(words), start=sentence_start, end=sentence_end)
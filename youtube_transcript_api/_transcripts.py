@@ -1,17 +1,42 @@
-from dataclasses import dataclass, asdict
+import json
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, replace
 from enum import Enum
-from itertools import chain
+from itertools import chain, islice
+from operator import add, gt
+from threading import Lock
+from time import monotonic
 
 from html import unescape
-from typing import List, Dict, Iterator, Iterable, Pattern, Optional
+from typing import (
+    List,
+    Dict,
+    Iterator,
+    Iterable,
+    Pattern,
+    Optional,
+    BinaryIO,
+    Union,
+    Tuple,
+    Sequence,
+    Any,
+    Callable,
+    Type,
+)
 
 from defusedxml import ElementTree
 
 import re
 
 from requests import HTTPError, Session, Response
+from requests.utils import guess_json_utf
 
 from .proxies import ProxyConfig
+from ._chunks import Chunk, _chunk_snippets
+from ._search import SearchMatch, _TranscriptSearchIndex
+from ._sentences import Sentence, _segment_sentences
+from ._transforms import _bucket, _clip, _merge, _scale, _shift
 from ._settings import WATCH_URL, INNERTUBE_CONTEXT, INNERTUBE_API_URL
 from ._errors import (
     VideoUnavailable,
@@ -31,8 +56,42 @@ from ._errors import (
 )
 
 
-@dataclass
+class CaptionWireFormat(str, Enum):
+    """
+    The formats in which YouTube can deliver transcripts. They all contain the same
+    snippets, but differ in how expensive they are to parse.
+    """
+
+    XML = "xml"
+    """
+    The legacy timedtext XML format, which is used by default.
+    """
+    SRV3 = "srv3"
+    """
+    YouTube's own XML based timedtext format, with times in milliseconds.
+    """
+    JSON3 = "json3"
+    """
+    A JSON representation of the timedtext format, which is the cheapest to parse.
+    """
+
+    @property
+    def url_parameter(self) -> str:
+        if self == CaptionWireFormat.XML:
+            return ""
+        return "&fmt={wire_format}".format(wire_format=self.value)
+
+
+@dataclass(frozen=True)
 class FetchedTranscriptSnippet:
+    """
+    A single snippet of a transcript. Snippets are immutable and, since a transcript can
+    consist of tens of thousands of them, they are stored in slots instead of a
+    per-instance `__dict__`. Use `dataclasses.replace` to get a modified copy.
+    """
+
+    __slots__ = ("text", "start", "duration")
+
     text: str
     start: float
     """
@@ -45,6 +104,341 @@ class FetchedTranscriptSnippet:
     Therefore, there can be overlaps between snippets!
     """
 
+    # frozen dataclasses can't be unpickled with the default slots state, as it is
+    # restored using `setattr`
+    def __getstate__(self) -> Tuple[str, float, float]:
+        return self.text, self.start, self.duration
+
+    def __setstate__(self, state: Tuple[str, float, float]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+class SnippetColumns(Sequence[FetchedTranscriptSnippet]):
+    """
+    A column-oriented storage for the snippets of a transcript. Instead of keeping a
+    Python object per snippet, the start times and durations are stored in two
+    `array("d")` buffers and the texts in a single UTF-8 encoded buffer, which is
+    indexed by an array of offsets. Instead of arrays, any buffer of the same layout
+    can be used, like a `memoryview` on a memory-mapped file.
+
+    It behaves like a read-only list of `FetchedTranscriptSnippet`s, which are created
+    when they are accessed. Slicing (without a step) doesn't copy any data, but returns
+    a view on the same buffers.
+    """
+
+    __slots__ = (
+        "_starts",
+        "_durations",
+        "_text_buffer",
+        "_text_offsets",
+        "_first",
+        "_stop",
+    )
+
+    def __init__(
+        self,
+        starts: Union[array, memoryview],
+        durations: Union[array, memoryview],
+        text_buffer: Union[bytes, memoryview],
+        text_offsets: Union[array, memoryview],
+        first: int = 0,
+        stop: Optional[int] = None,
+    ):
+        """
+        You probably don't want to initialize this directly. Use `from_snippets` or
+        `FetchedTranscript.to_columnar()` instead.
+
+        :param text_offsets: the offset at which the text of each snippet starts in
+            `text_buffer`, followed by the offset at which the last one ends
+        :param first: the index of the first snippet of this view
+        :param stop: the index after the last snippet of this view
+        """
+        self._starts = starts
+        self._durations = durations
+        self._text_buffer = text_buffer
+        self._text_offsets = text_offsets
+        self._first = first
+        self._stop = len(starts) if stop is None else stop
+
+    @classmethod
+    def from_snippets(
+        cls, snippets: Iterable[FetchedTranscriptSnippet]
+    ) -> "SnippetColumns":
+        starts = array("d")
+        durations = array("d")
+        text_offsets = array("q", [0])
+        texts = []
+        offset = 0
+        for snippet in snippets:
+            starts.append(snippet.start)
+            durations.append(snippet.duration)
+            text = snippet.text.encode("utf-8")
+            texts.append(text)
+            offset += len(text)
+            text_offsets.append(offset)
+        return cls(starts, durations, b"".join(texts), text_offsets)
+
+    @property
+    def starts(self) -> memoryview:
+        """
+        The start times of the snippets, without copying them.
+        """
+        return memoryview(self._starts)[self._first : self._stop]
+
+    @property
+    def durations(self) -> memoryview:
+        """
+        The durations of the snippets, without copying them.
+        """
+        return memoryview(self._durations)[self._first : self._stop]
+
+    def to_numpy(self) -> Tuple[Any, Any]:
+        """
+        Returns the start times and the durations as two float64 NumPy arrays, which
+        share their memory with this object. This requires `numpy` to be installed.
+        """
+        import numpy
+
+        return (
+            numpy.frombuffer(self.starts, dtype=numpy.float64),
+            numpy.frombuffer(self.durations, dtype=numpy.float64),
+        )
+
+    def __len__(self) -> int:
+        return self._stop - self._first
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            first, stop, step = index.indices(len(self))
+            if step != 1:
+                return SnippetColumns.from_snippets(
+                    self[position] for position in range(first, stop, step)
+                )
+            return SnippetColumns(
+                self._starts,
+                self._durations,
+                self._text_buffer,
+                self._text_offsets,
+                self._first + first,
+                self._first + max(first, stop),
+            )
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("snippet index out of range")
+        return self._get_snippet(self._first + index)
+
+    def __iter__(self) -> Iterator[FetchedTranscriptSnippet]:
+        for position in range(self._first, self._stop):
+            yield self._get_snippet(position)
+
+    def iter_tuples(self) -> Iterator[Tuple[str, float, float]]:
+        """
+        Iterates over the text, start and duration of the snippets, without creating
+        `FetchedTranscriptSnippet`s.
+        """
+        buffer = self._text_buffer
+        offsets = self._text_offsets
+        texts = (
+            str(buffer[offsets[position] : offsets[position + 1]], "utf-8")
+            for position in range(self._first, self._stop)
+        )
+        return zip(texts, self.starts, self.durations)
+
+    def _get_text_columns(self) -> Tuple[Union[bytes, memoryview], memoryview]:
+        """
+        Returns the text buffer and the text offsets of the snippets of this view,
+        without copying them. The offsets still refer to the whole buffer.
+        """
+        return (
+            self._text_buffer,
+            memoryview(self._text_offsets)[self._first : self._stop + 1],
+        )
+
+    def _get_snippet(self, position: int) -> FetchedTranscriptSnippet:
+        text = self._text_buffer[
+            self._text_offsets[position] : self._text_offsets[position + 1]
+        ]
+        return FetchedTranscriptSnippet(
+            text=str(text, "utf-8"),
+            start=self._starts[position],
+            duration=self._durations[position],
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            snippet == other_snippet for snippet, other_snippet in zip(self, other)
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return "SnippetColumns({snippets})".format(snippets=list(self))
+
+    def __reduce__(self):
+        # only the snippets of this view are pickled, which also allows pickling views
+        # on buffers that can't be pickled themselves
+        text_start = self._text_offsets[self._first]
+        text_offsets = array(
+            "q",
+            (
+                self._text_offsets[position] - text_start
+                for position in range(self._first, self._stop + 1)
+            ),
+        )
+        return (
+            SnippetColumns,
+            (
+                array("d", self.starts),
+                array("d", self.durations),
+                bytes(self._text_buffer[text_start : text_offsets[-1] + text_start]),
+                text_offsets,
+            ),
+        )
+
+
+class _LazySnippets(Sequence[FetchedTranscriptSnippet]):
+    """
+    The snippets of a transcript fetched with `lazy=True`. The raw transcript is only
+    parsed once the snippets are accessed for the first time and the parsed snippets
+    are cached afterwards. Parsing is done at most once, even if multiple threads
+    access the snippets at the same time.
+    """
+
+    def __init__(
+        self,
+        raw_data: bytes,
+        wire_format: CaptionWireFormat,
+        preserve_formatting: bool,
+    ):
+        self._raw_data = raw_data
+        self._wire_format = wire_format
+        self._preserve_formatting = preserve_formatting
+        self._snippets: Optional[List[FetchedTranscriptSnippet]] = None
+        self._lock = Lock()
+
+    @property
+    def is_parsed(self) -> bool:
+        return self._snippets is not None
+
+    def _get_snippets(self) -> List[FetchedTranscriptSnippet]:
+        snippets = self._snippets
+        if snippets is None:
+            with self._lock:
+                if self._snippets is None:
+                    parser = _TRANSCRIPT_PARSERS[self._wire_format](
+                        preserve_formatting=self._preserve_formatting
+                    )
+                    self._snippets = parser.parse(self._raw_data)
+                    # the raw data isn't needed anymore once it has been parsed
+                    self._raw_data = None
+                snippets = self._snippets
+        return snippets
+
+    def __len__(self) -> int:
+        return len(self._get_snippets())
+
+    def __getitem__(self, index):
+        return self._get_snippets()[index]
+
+    def __iter__(self) -> Iterator[FetchedTranscriptSnippet]:
+        return iter(self._get_snippets())
+
+    def __eq__(self, other) -> bool:
+        return self._get_snippets() == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        raw_data = self._raw_data
+        if raw_data is not None:
+            return "<unparsed snippets ({size} bytes)>".format(size=len(raw_data))
+        return repr(self._snippets)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+
+class _TimeIndex:
+    """
+    Indexes the snippets of a transcript by time. The start times are kept sorted,
+    along with the running maximum of the end times of all snippets starting before
+    them. As snippets can overlap, the latter is needed to find the first snippet,
+    which is still shown at a given time, using binary search.
+    """
+
+    def __init__(self, snippets: Sequence[FetchedTranscriptSnippet]):
+        self._snippets = snippets
+        if isinstance(snippets, SnippetColumns):
+            starts = snippets.starts.tolist()
+            durations = snippets.durations.tolist()
+        else:
+            starts = [snippet.start for snippet in snippets]
+            durations = [snippet.duration for snippet in snippets]
+        ends = list(map(add, starts, durations))
+        self._order: Optional[List[int]] = None
+        if any(map(gt, starts, islice(starts, 1, None))):
+            self._order = sorted(range(len(starts)), key=starts.__getitem__)
+            starts = list(map(starts.__getitem__, self._order))
+            ends = list(map(ends.__getitem__, self._order))
+        max_ends = []
+        max_end = float("-inf")
+        for end in ends:
+            if end > max_end:
+                max_end = end
+            max_ends.append(max_end)
+        self._starts = array("d", starts)
+        self._ends = array("d", ends)
+        self._max_ends = array("d", max_ends)
+
+    def _get_snippet(self, position: int) -> FetchedTranscriptSnippet:
+        if self._order is not None:
+            position = self._order[position]
+        return self._snippets[position]
+
+    def at(self, time: float) -> List[FetchedTranscriptSnippet]:
+        first = bisect_right(self._max_ends, time)
+        stop = bisect_right(self._starts, time)
+        return [
+            self._get_snippet(position)
+            for position in range(first, stop)
+            if self._ends[position] > time
+        ]
+
+    def between(self, start: float, end: float) -> List[FetchedTranscriptSnippet]:
+        first = min(
+            bisect_right(self._max_ends, start), bisect_left(self._starts, start)
+        )
+        stop = bisect_left(self._starts, end)
+        return [
+            self._get_snippet(position)
+            for position in range(first, stop)
+            if self._starts[position] >= start or self._ends[position] > start
+        ]
+
+    def nearest(self, time: float) -> Optional[FetchedTranscriptSnippet]:
+        following = bisect_right(self._starts, time)
+        candidates = []
+        if following > 0:
+            # of all snippets starting before `time`, the one ending last is closest
+            preceding = bisect_left(self._max_ends, self._max_ends[following - 1])
+            candidates.append((max(time - self._ends[preceding], 0.0), preceding))
+        if following < len(self._starts):
+            candidates.append((self._starts[following] - time, following))
+        if not candidates:
+            return None
+        _, position = min(candidates)
+        return self._get_snippet(position)
+
 
 @dataclass
 class FetchedTranscript:
@@ -53,15 +447,202 @@ class FetchedTranscript:
     iterate over the transcript snippets.
     """
 
-    snippets: List[FetchedTranscriptSnippet]
+    snippets: Sequence[FetchedTranscriptSnippet]
+    """
+    The snippets of the transcript. This is a list, unless the transcript has been
+    fetched with `lazy=True` or converted using `to_columnar()`.
+    """
     video_id: str
     language: str
     language_code: str
     is_generated: bool
+    wire_format: CaptionWireFormat = CaptionWireFormat.XML
+    """
+    The format the transcript has been downloaded in from YouTube.
+    """
 
     def __iter__(self) -> Iterator[FetchedTranscriptSnippet]:
         return iter(self.snippets)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # the lookup indexes are set lazily, outside of the dataclass fields, and are
+        # rebuilt on demand after unpickling
+        state = self.__dict__.copy()
+        state.pop("_time_index", None)
+        state.pop("_search_index", None)
+        return state
+
+    def at(self, time: float) -> List[FetchedTranscriptSnippet]:
+        """
+        Returns all snippets shown on screen at `time` (in seconds), ordered by their
+        start time. As snippets can overlap, there can be more than one.
+
+        The first time one of `at`, `between` and `nearest` is called, an index of the
+        snippets is built, which allows for looking up snippets in logarithmic time.
+        The index isn't updated if the snippets are modified afterwards.
+        """
+        return self._get_time_index().at(time)
+
+    def between(self, start: float, end: float) -> List[FetchedTranscriptSnippet]:
+        """
+        Returns all snippets shown on screen between `start` and `end` (in seconds),
+        ordered by their start time. This includes snippets starting before `start`,
+        which are still shown at `start`, but no snippets starting at `end`.
+        """
+        return self._get_time_index().between(start, end)
+
+    def nearest(self, time: float) -> Optional[FetchedTranscriptSnippet]:
+        """
+        Returns the snippet closest to `time` (in seconds). This is a snippet shown at
+        `time`, if there is one, otherwise the snippet ending last before `time` or the
+        first one starting after it, whichever is closer. Returns `None` if the
+        transcript has no snippets.
+        """
+        return self._get_time_index().nearest(time)
+
+    def search(
+        self,
+        query: str,
+        context: Optional[int] = None,
+        highlight: Tuple[str, str] = ("**", "**"),
+    ) -> List[SearchMatch]:
+        """
+        Finds all occurrences of the words in `query`, as a phrase, in this transcript.
+        Matching ignores case and punctuation and a phrase can span multiple snippets.
+
+        The first search builds an index of the words in the transcript, which is used
+        by all following searches. The index isn't updated if the snippets are
+        modified afterwards.
+
+        :param query: the word or phrase to search for
+        :param context: if this is set, every match contains its words, surrounded by
+            this number of words before and after it
+        :param highlight: the strings the matched words are enclosed in, in the context
+        :return: the matches, ordered by their position in the transcript
+        """
+        search_index = getattr(self, "_search_index", None)
+        if search_index is None:
+            search_index = self._search_index = _TranscriptSearchIndex(self.snippets)
+        return search_index.search(query, context=context, highlight=highlight)
+
+    def sentences(
+        self, max_pause: float = 1.0, max_duration: Optional[float] = None
+    ) -> Iterator[Sentence]:
+        """
+        Reconstructs the sentences spoken in this transcript. This is mostly useful for
+        generated transcripts, which consist of short, overlapping fragments of speech.
+
+        Sentences end at words ending with punctuation (".", "!", "?" or "…") and at
+        pauses of at least `max_pause` seconds between two snippets. Overlapping
+        snippets are cut at the start of the following snippet and words repeated at
+        the start of the following snippet are skipped. The start and end times of
+        sentences beginning or ending within a snippet are estimated from the position
+        of their words in the text of the snippet.
+
+        The sentences are generated while iterating over the snippets, which are
+        expected to be ordered by their start time, so only a single sentence is kept
+        in memory.
+
+        :param max_duration: if this is set, a sentence is ended before a snippet,
+            which would make it last longer than this number of seconds
+        """
+        return _segment_sentences(self.iter_tuples(), max_pause, max_duration)
+
+    def chunks(
+        self,
+        max_size: int = 1000,
+        overlap: int = 0,
+        length_function: Callable[[str], int] = len,
+        separator: str = " ",
+    ) -> Iterator[Chunk]:
+        """
+        Splits this transcript into chunks of consecutive snippets, e.g. to feed them
+        into an embedding model or an LLM. Every chunk contains the texts of its
+        snippets, joined by `separator`, the time range it covers and the indices of
+        its snippets.
+
+        The chunks are generated while iterating over the snippets, so the whole text
+        of the transcript is never built. Snippets aren't split, so a chunk consisting
+        of a single snippet can exceed `max_size`.
+
+        :param max_size: the maximum size of the text of a chunk, in the units of
+            `length_function`
+        :param overlap: the maximum size of the snippets at the end of a chunk, which
+            are repeated at the start of the next chunk
+        :param length_function: returns the size of a text. This is the number of
+            characters by default, but can be replaced by a function counting tokens.
+            The size of a chunk is the sum of the sizes of its snippets and separators.
+        """
+        if not 0 <= overlap < max_size:
+            raise ValueError("overlap has to be at least 0 and less than max_size")
+        return _chunk_snippets(
+            self.iter_tuples(), max_size, overlap, length_function, separator
+        )
+
+    def shift(self, offset: float) -> "FetchedTranscript":
+        """
+        Returns a copy of this transcript, with all snippets moved by `offset` seconds.
+
+        This and the other transformations (`scale`, `clip`, `merge` and `bucket`)
+        operate on the columns of `SnippetColumns` and return transcripts storing
+        their snippets in `SnippetColumns`, so no `FetchedTranscriptSnippet`s are
+        created, until the snippets of the result are accessed.
+        """
+        return self._transform(_shift, offset)
+
+    def scale(self, factor: float) -> "FetchedTranscript":
+        """
+        Returns a copy of this transcript, with the start times and durations of all
+        snippets multiplied by `factor`. To adjust a transcript to a playback speed,
+        scale it by `1 / speed`.
+        """
+        return self._transform(_scale, factor)
+
+    def clip(self, start: float, end: float) -> "FetchedTranscript":
+        """
+        Returns a copy of this transcript, which only contains the snippets shown
+        between `start` and `end` (the same ones `between` returns). Snippets
+        extending beyond the range are shortened to fit into it.
+        """
+        return self._transform(_clip, start, end)
+
+    def merge(
+        self,
+        max_gap: float = 0.0,
+        max_duration: Optional[float] = None,
+        separator: str = " ",
+    ) -> "FetchedTranscript":
+        """
+        Returns a copy of this transcript, in which adjacent snippets are merged into
+        a single snippet, if there are at most `max_gap` seconds between them.
+        Overlapping snippets are always merged.
+
+        :param max_duration: if this is set, snippets aren't merged into a snippet
+            longer than this number of seconds
+        :param separator: the texts of merged snippets are joined by this string
+        """
+        return self._transform(_merge, max_gap, max_duration, separator)
+
+    def bucket(self, window: float, separator: str = " ") -> "FetchedTranscript":
+        """
+        Returns a copy of this transcript, in which the snippets are grouped into
+        fixed windows of `window` seconds, by their start time. Every window
+        containing at least one snippet becomes a snippet, starting at the start of
+        the window, lasting `window` seconds and containing the texts of its snippets,
+        joined by `separator`.
+        """
+        return self._transform(_bucket, window, separator)
+
+    def _transform(self, transform: Callable, *args) -> "FetchedTranscript":
+        columns = transform(self.to_columnar().snippets, *args)
+        return replace(self, snippets=SnippetColumns(*columns))
+
+    def _get_time_index(self) -> _TimeIndex:
+        time_index = getattr(self, "_time_index", None)
+        if time_index is None:
+            time_index = self._time_index = _TimeIndex(self.snippets)
+        return time_index
+
     def __getitem__(self, index) -> FetchedTranscriptSnippet:
         return self.snippets[index]
 
@@ -69,7 +650,44 @@ class FetchedTranscript:
         return len(self.snippets)
 
     def to_raw_data(self) -> List[Dict]:
-        return [asdict(snippet) for snippet in self]
+        if isinstance(self.snippets, SnippetColumns):
+            return [
+                {"text": text, "start": start, "duration": duration}
+                for text, start, duration in self.snippets.iter_tuples()
+            ]
+        # building the dicts directly is a lot faster than `asdict`, which deep copies
+        return [
+            {"text": snippet.text, "start": snippet.start, "duration": snippet.duration}
+            for snippet in self.snippets
+        ]
+
+    def iter_tuples(self) -> Iterator[Tuple[str, float, float]]:
+        """
+        Iterates over the text, start and duration of each snippet. This is the
+        cheapest way to hand the snippets to a serializer.
+        """
+        if isinstance(self.snippets, SnippetColumns):
+            return self.snippets.iter_tuples()
+        return (
+            (snippet.text, snippet.start, snippet.duration) for snippet in self.snippets
+        )
+
+    def to_columnar(self) -> "FetchedTranscript":
+        """
+        Returns a copy of this transcript, which stores its snippets in
+        `SnippetColumns` instead of a list of `FetchedTranscriptSnippet`s. This needs
+        a lot less memory for long transcripts.
+        """
+        if isinstance(self.snippets, SnippetColumns):
+            return self
+        return replace(self, snippets=SnippetColumns.from_snippets(self.snippets))
+
+    def to_numpy(self) -> Tuple[Any, Any]:
+        """
+        Returns the start times and the durations of the snippets as two float64
+        NumPy arrays. This requires `numpy` to be installed.
+        """
+        return self.to_columnar().snippets.to_numpy()
 
 
 @dataclass
@@ -100,10 +718,16 @@ def _raise_http_errors(response: Response, video_id: str) -> Response:
         raise YouTubeRequestFailed(video_id, error)
 
 
-class Transcript:
+class _BaseTranscript:
+    """
+    The parts of a transcript, which don't depend on how it is downloaded. They are
+    shared by `Transcript` and `AsyncTranscript`, which only differ in their
+    `http_client` and in whether their requests are blocking or coroutines.
+    """
+
     def __init__(
         self,
-        http_client: Session,
+        http_client: Any,
         video_id: str,
         url: str,
         language: str,
@@ -127,23 +751,38 @@ class Transcript:
             for translation_language in translation_languages
         }
 
-    def fetch(self, preserve_formatting: bool = False) -> FetchedTranscript:
-        """
-        Loads the actual transcript data.
-        :param preserve_formatting: whether to keep select HTML text formatting
-        """
+    def _get_url(self, wire_format: CaptionWireFormat) -> str:
         if "&exp=xpe" in self._url:
             raise PoTokenRequired(self.video_id)
-        response = self._http_client.get(self._url)
-        snippets = _TranscriptParser(preserve_formatting=preserve_formatting).parse(
-            _raise_http_errors(response, self.video_id).text,
+        return self._url + wire_format.url_parameter
+
+    def _parse(
+        self,
+        raw_data: bytes,
+        wire_format: CaptionWireFormat,
+        preserve_formatting: bool,
+        lazy: bool,
+    ) -> FetchedTranscript:
+        if lazy:
+            snippets = _LazySnippets(raw_data, wire_format, preserve_formatting)
+            return self._build_fetched_transcript(snippets, wire_format)
+        parser = _TRANSCRIPT_PARSERS[wire_format](
+            preserve_formatting=preserve_formatting
         )
+        return self._build_fetched_transcript(parser.parse(raw_data), wire_format)
+
+    def _build_fetched_transcript(
+        self,
+        snippets: Sequence[FetchedTranscriptSnippet],
+        wire_format: CaptionWireFormat,
+    ) -> FetchedTranscript:
         return FetchedTranscript(
             snippets=snippets,
             video_id=self.video_id,
             language=self.language,
             language_code=self.language_code,
             is_generated=self.is_generated,
+            wire_format=wire_format,
         )
 
     def __str__(self) -> str:
@@ -157,14 +796,14 @@ class Transcript:
     def is_translatable(self) -> bool:
         return len(self.translation_languages) > 0
 
-    def translate(self, language_code: str) -> "Transcript":
+    def _translate(self, language_code: str):
         if not self.is_translatable:
             raise NotTranslatable(self.video_id)
 
         if language_code not in self._translation_languages_dict:
             raise TranslationLanguageNotAvailable(self.video_id)
 
-        return Transcript(
+        return type(self)(
             self._http_client,
             self.video_id,
             "{url}&tlang={language_code}".format(
@@ -177,6 +816,115 @@ class Transcript:
         )
 
 
+class Transcript(_BaseTranscript):
+    def fetch(
+        self,
+        preserve_formatting: bool = False,
+        wire_format: CaptionWireFormat = CaptionWireFormat.XML,
+        lazy: bool = False,
+    ) -> FetchedTranscript:
+        """
+        Loads the actual transcript data.
+        :param preserve_formatting: whether to keep select HTML text formatting
+        :param wire_format: the format in which the transcript is downloaded from
+            YouTube. This does not change the returned snippets, but
+            `CaptionWireFormat.JSON3` is a lot cheaper to parse than the default XML.
+        :param lazy: if this is set, the transcript isn't parsed right away. Instead,
+            the raw response is kept and parsed when the snippets are accessed for the
+            first time. This saves the parsing entirely, if the snippets are never
+            accessed. Note that errors in the transcript data will only be raised at
+            that point.
+        """
+        wire_format = CaptionWireFormat(wire_format)
+        response = self._request(wire_format)
+        return self._parse(response.content, wire_format, preserve_formatting, lazy)
+
+    def iter_snippets(
+        self,
+        preserve_formatting: bool = False,
+        wire_format: CaptionWireFormat = CaptionWireFormat.XML,
+    ) -> Iterator[FetchedTranscriptSnippet]:
+        """
+        Loads the transcript data incrementally. Instead of downloading and parsing the
+        whole transcript first, the transcript is parsed while it is downloaded and
+        every snippet is yielded as soon as it has been received. If you stop iterating
+        early, the rest of the transcript won't be downloaded. Make sure to either
+        exhaust the returned iterator or to `close()` it, to release the connection.
+
+        Note that `CaptionWireFormat.JSON3` can't be parsed incrementally, so the whole
+        transcript will be downloaded before the first snippet is yielded.
+
+        :param preserve_formatting: whether to keep select HTML text formatting
+        :param wire_format: the format in which the transcript is downloaded from
+            YouTube
+        """
+        wire_format = CaptionWireFormat(wire_format)
+        response = self._request(wire_format, stream=True)
+        parser = _TRANSCRIPT_PARSERS[wire_format](
+            preserve_formatting=preserve_formatting
+        )
+        return self._iter_response(parser, response)
+
+    def fetch_window(
+        self,
+        start: float,
+        end: float,
+        preserve_formatting: bool = False,
+        wire_format: CaptionWireFormat = CaptionWireFormat.XML,
+    ) -> FetchedTranscript:
+        """
+        Loads only the snippets which are shown on screen between `start` and `end`.
+        As the transcript is parsed while it is downloaded, the download is stopped as
+        soon as the first snippet starting after `end` has been received. This makes
+        retrieving a couple of minutes of a very long transcript a lot cheaper than
+        fetching all of it.
+
+        :param start: the start of the time window in seconds
+        :param end: the end of the time window in seconds
+        :param preserve_formatting: whether to keep select HTML text formatting
+        :param wire_format: the format in which the transcript is downloaded from
+            YouTube
+        """
+        snippets = []
+        snippet_iterator = self.iter_snippets(
+            preserve_formatting=preserve_formatting, wire_format=wire_format
+        )
+        try:
+            for snippet in snippet_iterator:
+                if snippet.start >= end:
+                    break
+                if snippet.start >= start or snippet.start + snippet.duration > start:
+                    snippets.append(snippet)
+        finally:
+            snippet_iterator.close()
+        return self._build_fetched_transcript(snippets, CaptionWireFormat(wire_format))
+
+    def _request(
+        self, wire_format: CaptionWireFormat, stream: bool = False
+    ) -> Response:
+        response = self._http_client.get(self._get_url(wire_format), stream=stream)
+        try:
+            return _raise_http_errors(response, self.video_id)
+        except Exception:
+            # the body of a streamed response is never read in this case, so its
+            # connection has to be released explicitly
+            response.close()
+            raise
+
+    @staticmethod
+    def _iter_response(
+        parser: "_TranscriptParser", response: Response
+    ) -> Iterator[FetchedTranscriptSnippet]:
+        try:
+            response.raw.decode_content = True
+            yield from parser.iter_parse(response.raw)
+        finally:
+            response.close()
+
+    def translate(self, language_code: str) -> "Transcript":
+        return self._translate(language_code)
+
+
 class TranscriptList:
     """
     This object represents a list of transcripts. It can be iterated over to list all transcripts which are available
@@ -205,7 +953,10 @@ class TranscriptList:
 
     @staticmethod
     def build(
-        http_client: Session, video_id: str, captions_json: Dict
+        http_client: Any,
+        video_id: str,
+        captions_json: Dict,
+        transcript_type: Type[_BaseTranscript] = Transcript,
     ) -> "TranscriptList":
         """
         Factory method for TranscriptList.
@@ -213,6 +964,7 @@ class TranscriptList:
         :param http_client: http client which is used to make the transcript retrieving http calls
         :param video_id: the id of the video this TranscriptList is for
         :param captions_json: the JSON parsed from the YouTube pages static HTML
+        :param transcript_type: the class of the listed transcripts
         :return: the created TranscriptList
         """
         translation_languages = [
@@ -232,7 +984,7 @@ class TranscriptList:
             else:
                 transcript_dict = manually_created_transcripts
 
-            transcript_dict[caption["languageCode"]] = Transcript(
+            transcript_dict[caption["languageCode"]] = transcript_type(
                 http_client,
                 video_id,
                 caption["baseUrl"].replace("&fmt=srv3", ""),
@@ -344,10 +1096,71 @@ class TranscriptList:
         return description if description else "None"
 
 
+class InnertubeApiKeyCache:
+    """
+    Caches the `INNERTUBE_API_KEY`, which otherwise has to be extracted from the watch
+    page of every video before its innertube data can be requested. Since this key is
+    the same for all videos, it only has to be learned once. While a valid key is
+    cached, listing the transcripts of a video only requires the innertube request,
+    instead of also downloading the (roughly 1 MB large) watch page.
+
+    A cached key expires after `ttl` seconds and is dropped as soon as a request using
+    it fails, which will cause the next request to learn it again from a watch page.
+
+    This class is thread-safe, so a single instance can be shared between multiple
+    `YouTubeTranscriptApi` instances, running in different threads.
+    """
+
+    DEFAULT_TTL = 6 * 60 * 60
+
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        """
+        :param ttl: the number of seconds a learned API key is used, before it is
+            learned again from a watch page. Defaults to 6 hours.
+        """
+        self.ttl = ttl
+        self._api_key: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock = Lock()
+
+    def get(self) -> Optional[str]:
+        """
+        Returns the cached API key or None, if no key has been learned yet or if the
+        learned key has expired.
+        """
+        with self._lock:
+            if self._api_key is not None and monotonic() < self._expires_at:
+                return self._api_key
+            return None
+
+    def set(self, api_key: str) -> None:
+        with self._lock:
+            self._api_key = api_key
+            self._expires_at = monotonic() + self.ttl
+
+    def invalidate(self, api_key: str) -> None:
+        """
+        Drops the given API key from the cache. If another thread has already replaced
+        it with a newly learned key in the meantime, that key is kept.
+        """
+        with self._lock:
+            if self._api_key == api_key:
+                self._api_key = None
+
+
 class TranscriptListFetcher:
-    def __init__(self, http_client: Session, proxy_config: Optional[ProxyConfig]):
+    def __init__(
+        self,
+        http_client: Session,
+        proxy_config: Optional[ProxyConfig],
+        api_key_cache: Optional[InnertubeApiKeyCache] = None,
+    ):
         self._http_client = http_client
         self._proxy_config = proxy_config
+        self._api_key_cache = api_key_cache
+        # makes sure that threads, which are all asked for consent at the same time,
+        # only create the consent cookie once
+        self._consent_lock = Lock()
 
     def fetch(self, video_id: str) -> TranscriptList:
         return TranscriptList.build(
@@ -358,9 +1171,7 @@ class TranscriptListFetcher:
 
     def _fetch_captions_json(self, video_id: str, try_number: int = 0) -> Dict:
         try:
-            html = self._fetch_video_html(video_id)
-            api_key = self._extract_innertube_api_key(html, video_id)
-            innertube_data = self._fetch_innertube_data(video_id, api_key)
+            innertube_data = self._fetch_innertube_data_for_video(video_id)
             return self._extract_captions_json(innertube_data, video_id)
         except RequestBlocked as exception:
             retries = (
@@ -372,17 +1183,36 @@ class TranscriptListFetcher:
                 return self._fetch_captions_json(video_id, try_number=try_number + 1)
             raise exception.with_proxy_config(self._proxy_config)
 
-    def _extract_innertube_api_key(self, html: str, video_id: str) -> str:
-        pattern = r'"INNERTUBE_API_KEY":\s*"([a-zA-Z0-9_-]+)"'
-        match = re.search(pattern, html)
-        if match and len(match.groups()) == 1:
-            return match.group(1)
-        if 'class="g-recaptcha"' in html:
+    def _fetch_innertube_data_for_video(self, video_id: str) -> Dict:
+        if self._api_key_cache is not None:
+            api_key = self._api_key_cache.get()
+            if api_key is not None:
+                try:
+                    return self._fetch_innertube_data(video_id, api_key)
+                except YouTubeRequestFailed:
+                    # the cached key might have been rotated, so we fall back to
+                    # learning it again from the watch page
+                    self._api_key_cache.invalidate(api_key)
+
+        watch_page = self._fetch_watch_page(video_id)
+        api_key = self._extract_innertube_api_key(watch_page, video_id)
+        if self._api_key_cache is not None:
+            self._api_key_cache.set(api_key)
+        return self._fetch_innertube_data(video_id, api_key)
+
+    @staticmethod
+    def _extract_innertube_api_key(watch_page: "_WatchPage", video_id: str) -> str:
+        if watch_page.api_key is not None:
+            return watch_page.api_key
+        if watch_page.has_recaptcha:
             raise IpBlocked(video_id)
         raise YouTubeDataUnparsable(video_id)  # pragma: no cover
 
-    def _extract_captions_json(self, innertube_data: Dict, video_id: str) -> Dict:
-        self._assert_playability(innertube_data.get("playabilityStatus"), video_id)
+    @staticmethod
+    def _extract_captions_json(innertube_data: Dict, video_id: str) -> Dict:
+        TranscriptListFetcher._assert_playability(
+            innertube_data.get("playabilityStatus"), video_id
+        )
 
         captions_json = innertube_data.get("captions", {}).get(
             "playerCaptionsTracklistRenderer"
@@ -392,7 +1222,8 @@ class TranscriptListFetcher:
 
         return captions_json
 
-    def _assert_playability(self, playability_status_data: Dict, video_id: str) -> None:
+    @staticmethod
+    def _assert_playability(playability_status_data: Dict, video_id: str) -> None:
         playability_status = playability_status_data.get("status")
         if (
             playability_status != _PlayabilityStatus.OK.value
@@ -421,26 +1252,44 @@ class TranscriptListFetcher:
                 video_id, reason, [run.get("text", "") for run in subreasons]
             )
 
-    def _create_consent_cookie(self, html: str, video_id: str) -> None:
-        match = re.search('name="v" value="(.*?)"', html)
-        if match is None:
+    def _get_consent_cookie(self) -> Optional[str]:
+        return self._http_client.cookies.get("CONSENT", domain=".youtube.com")
+
+    def _create_consent_cookie(self, watch_page: "_WatchPage", video_id: str) -> None:
+        if watch_page.consent_value is None:
             raise FailedToCreateConsentCookie(video_id)
         self._http_client.cookies.set(
-            "CONSENT", "YES+" + match.group(1), domain=".youtube.com"
+            "CONSENT", "YES+" + watch_page.consent_value, domain=".youtube.com"
         )
 
-    def _fetch_video_html(self, video_id: str) -> str:
-        html = self._fetch_html(video_id)
-        if 'action="https://consent.youtube.com/s"' in html:
-            self._create_consent_cookie(html, video_id)
-            html = self._fetch_html(video_id)
-            if 'action="https://consent.youtube.com/s"' in html:
+    def _fetch_watch_page(self, video_id: str) -> "_WatchPage":
+        consent_cookie = self._get_consent_cookie()
+        watch_page = self._scan_html(video_id)
+        if watch_page.requires_consent:
+            with self._consent_lock:
+                # another thread might have created a consent cookie, since the watch
+                # page has been requested
+                if self._get_consent_cookie() == consent_cookie:
+                    self._create_consent_cookie(watch_page, video_id)
+            watch_page = self._scan_html(video_id)
+            if watch_page.requires_consent:
                 raise FailedToCreateConsentCookie(video_id)
-        return html
+        return watch_page
 
-    def _fetch_html(self, video_id: str) -> str:
-        response = self._http_client.get(WATCH_URL.format(video_id=video_id))
-        return unescape(_raise_http_errors(response, video_id).text)
+    def _scan_html(self, video_id: str) -> "_WatchPage":
+        response = self._http_client.get(
+            WATCH_URL.format(video_id=video_id), stream=True
+        )
+        try:
+            _raise_http_errors(response, video_id)
+            scanner = _WatchPageScanner()
+            for chunk in response.iter_content(_WatchPageScanner.CHUNK_SIZE):
+                if scanner.feed(chunk):
+                    break
+            return scanner.watch_page
+        finally:
+            # if scanning finished early, this drops the rest of the page unread
+            response.close()
 
     def _fetch_innertube_data(self, video_id: str, api_key: str) -> Dict:
         response = self._http_client.post(
@@ -450,11 +1299,272 @@ class TranscriptListFetcher:
                 "videoId": video_id,
             },
         )
-        data = _raise_http_errors(response, video_id).json()
+        return _InnertubeDataExtractor.extract(_raise_http_errors(response, video_id))
+
+
+@dataclass
+class _WatchPage:
+    """
+    The parts of a video's watch page, which are relevant for retrieving its
+    transcripts.
+    """
+
+    api_key: Optional[str] = None
+    consent_value: Optional[str] = None
+    requires_consent: bool = False
+    has_recaptcha: bool = False
+
+
+class _WatchPageScanner:
+    """
+    Scans the raw bytes of a watch page chunk by chunk, for the markers we are
+    interested in. This allows us to stop reading the (roughly 1 MB large) page, as soon
+    as we have found what we need, instead of downloading and unescaping all of it.
+    Only the matched values are unescaped.
+    """
+
+    CHUNK_SIZE = 16 * 1024
+    # number of bytes kept from the previous chunk, so that markers split between two
+    # chunks are still found
+    _OVERLAP_SIZE = 1024
+
+    _API_KEY_REGEX = re.compile(
+        rb'(?:"|&quot;)INNERTUBE_API_KEY(?:"|&quot;):'
+        rb'\s*(?:"|&quot;)([a-zA-Z0-9_-]+)(?:"|&quot;)'
+    )
+    _CONSENT_FORM_MARKER = b'action="https://consent.youtube.com/s"'
+    _CONSENT_VALUE_REGEX = re.compile(rb'name="v" value="(.*?)"')
+    _RECAPTCHA_MARKER = b'class="g-recaptcha"'
+
+    def __init__(self):
+        self.watch_page = _WatchPage()
+        self._tail = b""
+
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Scans the next chunk of the page.
+
+        :return: whether everything that is needed has been found, which means that
+            the rest of the page doesn't have to be read
+        """
+        window = self._tail + chunk
+        self._tail = window[-self._OVERLAP_SIZE :]
+        watch_page = self.watch_page
+
+        if watch_page.consent_value is None:
+            match = self._CONSENT_VALUE_REGEX.search(window)
+            if match is not None:
+                watch_page.consent_value = unescape(match.group(1).decode("utf-8"))
+        if not watch_page.requires_consent and self._CONSENT_FORM_MARKER in window:
+            watch_page.requires_consent = True
+        if watch_page.requires_consent:
+            return watch_page.consent_value is not None
+
+        match = self._API_KEY_REGEX.search(window)
+        if match is not None:
+            watch_page.api_key = match.group(1).decode("ascii")
+            return True
+        if self._RECAPTCHA_MARKER in window:
+            watch_page.has_recaptcha = True
+            return True
+        return False
+
+
+class _InnertubeDataExtractor:
+    """
+    The innertube response is a 100-200 KB JSON document, of which we only need the
+    `playabilityStatus` and `captions` objects. Instead of decoding the whole document,
+    this slices out these subtrees and only decodes them. If the response doesn't look
+    like we expect it to, the whole document is decoded as a fallback.
+    """
+
+    KEYS = ("playabilityStatus", "captions")
+    _DECODER = json.JSONDecoder()
+    _WHITESPACE_REGEX = re.compile(r"\s*")
+    _ESCAPE_SEQUENCE_REGEX = re.compile(r"\\.", re.DOTALL)
+
+    @classmethod
+    def extract(cls, response: Response) -> Dict:
+        data = None
+        content = response.content
+        if guess_json_utf(content) == "utf-8":
+            try:
+                data = cls.extract_from_text(content.decode("utf-8"))
+            except UnicodeDecodeError:
+                pass
+        return response.json() if data is None else data
+
+    @classmethod
+    def extract_from_text(cls, raw_data: str) -> Optional[Dict]:
+        """
+        :return: a dict only containing the subtrees of `KEYS` which are present in
+            the given document, or None if they can't be extracted safely
+        """
+        if not raw_data.lstrip().startswith("{"):
+            return None
+        data = {}
+        for key in cls.KEYS:
+            quoted_key = '"{key}"'.format(key=key)
+            index = raw_data.find(quoted_key)
+            if index == -1:
+                continue
+            # if the key occurs more than once, we can't tell which one is top-level
+            if raw_data.find(quoted_key, index + 1) != -1:
+                return None
+            if not cls._is_top_level(raw_data, index):
+                return None
+            index = cls._WHITESPACE_REGEX.match(raw_data, index + len(quoted_key)).end()
+            if raw_data[index : index + 1] != ":":
+                return None
+            index = cls._WHITESPACE_REGEX.match(raw_data, index + 1).end()
+            try:
+                value, _ = cls._DECODER.raw_decode(raw_data, index)
+            except ValueError:
+                return None
+            if not isinstance(value, dict):
+                return None
+            data[key] = value
         return data
 
+    @classmethod
+    def _is_top_level(cls, raw_data: str, index: int) -> bool:
+        # the brackets before `index`, which aren't part of a string, determine its
+        # nesting depth. Once all escape sequences have been removed, every quote
+        # delimits a string, so the parts between them alternate between the outside
+        # and the inside of strings.
+        parts = cls._ESCAPE_SEQUENCE_REGEX.sub("", raw_data[:index]).split('"')
+        if len(parts) % 2 == 0:
+            # `index` is within a string itself
+            return False
+        outside = "".join(parts[::2])
+        depth = (
+            outside.count("{")
+            + outside.count("[")
+            - outside.count("}")
+            - outside.count("]")
+        )
+        return depth == 1
+
+
+class _TimedTextTokenizer:
+    """
+    A tokenizer for the legacy timedtext format, which is a flat document of the
+    shape `<transcript><text start="..." dur="...">...</text>...</transcript>`. It
+    works directly on the raw bytes and produces the snippets in a single pass, without
+    building an intermediate tree.
+
+    It only accepts documents which strictly follow this shape (including the order of
+    the attributes) and only contain the predefined XML entities and character
+    references. Anything else, including
+    doctype declarations, entity declarations, comments and CDATA sections, is
+    rejected, in which case the document has to be parsed with defusedxml instead.
+    """
+
+    _DOCUMENT_REGEX = re.compile(
+        rb'[ \t\r\n]*(?:<\?xml(?:[ \t\r\n]+[a-z]+="[^"<>]*")*[ \t\r\n]*\?>)?'
+        rb"[ \t\r\n]*<transcript>(.*)</transcript>[ \t\r\n]*\Z",
+        re.DOTALL,
+    )
+    _ENCODING_REGEX = re.compile(rb'[^>]*[ \t\r\n]encoding="([^"]*)"')
+    # the whole element is captured as well, which allows us to verify that the
+    # elements make up the whole document, without any gaps in between. The duration
+    # is captured with its quotes, to tell a missing duration from an empty one.
+    _ELEMENT_REGEX = re.compile(
+        rb'([ \t\r\n]*<text start="([^"<&]*)"(?: dur=("[^"<&]*"))?[ \t\r\n]*'
+        rb"(?:/>|>([^<]*)</text>))"
+    )
+    # characters which are not allowed in XML documents and carriage returns, which
+    # XML parsers have to normalize
+    _INVALID_CHARACTERS = bytes(range(0x00, 0x09)) + bytes(range(0x0B, 0x20))
+    _REFERENCE_REGEX = re.compile(
+        r"&(?:(lt|gt|amp|quot|apos)|#([0-9]+)|#x([0-9a-fA-F]+));"
+    )
+    _BYTES_REFERENCE_REGEX = re.compile(
+        rb"&(?:lt|gt|amp|quot|apos|#[0-9]+|#x[0-9a-fA-F]+);"
+    )
+    _ENTITIES = {"lt": "<", "gt": ">", "quot": '"', "apos": "'", "amp": "&"}
+    # `&amp;` has to be replaced last, so that its result isn't decoded again
+    _ENTITY_REPLACEMENTS = tuple(
+        ("&{entity};".format(entity=entity), character)
+        for entity, character in _ENTITIES.items()
+    )
+
+    @classmethod
+    def tokenize(cls, raw_data: bytes) -> Optional[List[Tuple[str, float, float]]]:
+        """
+        :return: a list of (text, start, duration) tuples, for all snippets which
+            contain text, or None if the document can't be tokenized safely
+        """
+        document_match = cls._DOCUMENT_REGEX.match(raw_data)
+        if document_match is None:
+            return None
+        encoding_match = cls._ENCODING_REGEX.match(raw_data, 0, document_match.start(1))
+        if encoding_match is not None and encoding_match.group(1).lower() not in (
+            b"utf-8",
+            b"utf8",
+        ):
+            return None
+
+        body = document_match.group(1).rstrip(b" \t\r\n")
+        if (
+            len(body.translate(None, cls._INVALID_CHARACTERS)) != len(body)
+            or b"]]>" in body
+        ):
+            return None
+
+        # every `&` has to start one of the references we are able to decode
+        if body.count(b"&") != len(cls._BYTES_REFERENCE_REGEX.findall(body)):
+            return None
+
+        elements = cls._ELEMENT_REGEX.findall(body)
+        if sum(len(element[0]) for element in elements) != len(body):
+            return None
+        try:
+            return [
+                (
+                    cls._decode_text(text) if b"&" in text else text.decode("utf-8"),
+                    float(start),
+                    float(duration[1:-1]) if duration else 0.0,
+                )
+                for _, start, duration, text in elements
+                if text
+            ]
+        except ValueError:
+            return None
+
+    @classmethod
+    def _decode_text(cls, raw_text: bytes) -> str:
+        text = raw_text.decode("utf-8")
+        if "&#" in text:
+            return cls._REFERENCE_REGEX.sub(cls._replace_reference, text)
+        for entity, character in cls._ENTITY_REPLACEMENTS:
+            text = text.replace(entity, character)
+        return text
+
+    @classmethod
+    def _replace_reference(cls, match) -> str:
+        entity, decimal, hexadecimal = match.groups()
+        if entity is not None:
+            return cls._ENTITIES[entity]
+        code_point = int(decimal) if decimal is not None else int(hexadecimal, 16)
+        if not (
+            code_point in (0x9, 0xA, 0xD)
+            or 0x20 <= code_point <= 0xD7FF
+            or 0xE000 <= code_point <= 0xFFFD
+            or 0x10000 <= code_point <= 0x10FFFF
+        ):
+            raise ValueError("invalid character reference")
+        return chr(code_point)
+
+
+class _TextCleaner:
+    """
+    Decodes the HTML entities in the text of a snippet and strips its HTML tags. The
+    tag regex is compiled once per process and each step is skipped if the text does
+    not contain the character it is looking for, so that most snippets are returned
+    without running a single regex.
+    """
 
-class _TranscriptParser:
     _FORMATTING_TAGS = [
         "strong",  # important
         "em",  # emphasized
@@ -468,7 +1578,7 @@ class _TranscriptParser:
         "sup",  # superscript
     ]
 
-    def __init__(self, preserve_formatting: bool = False):
+    def __init__(self, preserve_formatting: bool):
         self._html_regex = self._get_html_regex(preserve_formatting)
 
     def _get_html_regex(self, preserve_formatting: bool) -> Pattern[str]:
@@ -480,13 +1590,128 @@ class _TranscriptParser:
             html_regex = re.compile(r"<[^>]*>", re.IGNORECASE)
         return html_regex
 
-    def parse(self, raw_data: str) -> List[FetchedTranscriptSnippet]:
-        return [
-            FetchedTranscriptSnippet(
-                text=re.sub(self._html_regex, "", unescape(xml_element.text)),
-                start=float(xml_element.attrib["start"]),
-                duration=float(xml_element.attrib.get("dur", "0.0")),
+    def clean(self, text: str) -> str:
+        if "&" in text:
+            text = unescape(text)
+        if "<" in text:
+            text = self._html_regex.sub("", text)
+        return text
+
+
+_TEXT_CLEANERS = {
+    preserve_formatting: _TextCleaner(preserve_formatting)
+    for preserve_formatting in (False, True)
+}
+
+
+class _TranscriptParser:
+    _SNIPPET_TAG = "text"
+
+    def __init__(self, preserve_formatting: bool = False):
+        self._clean_text = _TEXT_CLEANERS[preserve_formatting].clean
+
+    def parse(self, raw_data: Union[str, bytes]) -> List[FetchedTranscriptSnippet]:
+        if isinstance(raw_data, bytes):
+            tokens = _TimedTextTokenizer.tokenize(raw_data)
+            if tokens is not None:
+                return [
+                    FetchedTranscriptSnippet(
+                        text=self._clean_text(text), start=start, duration=duration
+                    )
+                    for text, start, duration in tokens
+                ]
+        snippets = map(self._parse_element, ElementTree.fromstring(raw_data))
+        return [snippet for snippet in snippets if snippet is not None]
+
+    def iter_parse(self, source: BinaryIO) -> Iterator[FetchedTranscriptSnippet]:
+        """
+        Parses the transcript while it is read from `source` and yields every snippet
+        as soon as it has been read completely. Snippets are dropped from the parsed
+        tree once they have been yielded, so memory usage doesn't grow with the length
+        of the transcript.
+        """
+        parents = []
+        for event, element in ElementTree.iterparse(source, events=("start", "end")):
+            if event == "start":
+                parents.append(element)
+                continue
+            parents.pop()
+            if element.tag == self._SNIPPET_TAG and parents:
+                parents[-1].remove(element)
+                snippet = self._parse_element(element)
+                if snippet is not None:
+                    yield snippet
+
+    def _parse_element(self, xml_element) -> Optional[FetchedTranscriptSnippet]:
+        if xml_element.text is None:
+            return None
+        return FetchedTranscriptSnippet(
+            text=self._clean_text(xml_element.text),
+            start=float(xml_element.attrib["start"]),
+            duration=float(xml_element.attrib.get("dur", "0.0")),
+        )
+
+
+class _Srv3TranscriptParser(_TranscriptParser):
+    """
+    Parses the srv3 format, which wraps the snippets in `<p t="..." d="...">`
+    elements, with times in milliseconds. Generated transcripts split the text of a
+    snippet into multiple `<s>` elements and contain empty paragraphs, which only
+    move the window the captions are shown in.
+    """
+
+    _SNIPPET_TAG = "p"
+
+    def parse(self, raw_data: Union[str, bytes]) -> List[FetchedTranscriptSnippet]:
+        body = ElementTree.fromstring(raw_data).find("body")
+        if body is None:
+            return []
+        snippets = (self._parse_element(paragraph) for paragraph in body.iter("p"))
+        return [snippet for snippet in snippets if snippet is not None]
+
+    def _parse_element(self, paragraph) -> Optional[FetchedTranscriptSnippet]:
+        text = "".join(paragraph.itertext())
+        if not text.strip():
+            return None
+        return FetchedTranscriptSnippet(
+            text=self._clean_text(text),
+            start=int(paragraph.attrib["t"]) / 1000,
+            duration=int(paragraph.attrib.get("d", "0")) / 1000,
+        )
+
+
+class _Json3TranscriptParser(_TranscriptParser):
+    """
+    Parses the json3 format, which contains the snippets as a list of events, each
+    consisting of segments of text, with times in milliseconds. Just like in srv3,
+    generated transcripts contain events which only carry line breaks.
+    """
+
+    def parse(self, raw_data: Union[str, bytes]) -> List[FetchedTranscriptSnippet]:
+        snippets = []
+        for event in json.loads(raw_data).get("events", []):
+            segments = event.get("segs")
+            if not segments:
+                continue
+            text = "".join(segment.get("utf8", "") for segment in segments)
+            if not text.strip():
+                continue
+            snippets.append(
+                FetchedTranscriptSnippet(
+                    text=self._clean_text(text),
+                    start=event["tStartMs"] / 1000,
+                    duration=event.get("dDurationMs", 0) / 1000,
+                )
             )
-            for xml_element in ElementTree.fromstring(raw_data)
-            if xml_element.text is not None
-        ]
+        return snippets
+
+    def iter_parse(self, source: BinaryIO) -> Iterator[FetchedTranscriptSnippet]:
+        # the standard library can't decode JSON incrementally
+        yield from self.parse(source.read())
+
+
+_TRANSCRIPT_PARSERS = {
+    CaptionWireFormat.XML: _TranscriptParser,
+    CaptionWireFormat.SRV3: _Srv3TranscriptParser,
+    CaptionWireFormat.JSON3: _Json3TranscriptParser,
+}
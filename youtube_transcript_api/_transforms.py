@@ -0,0 +1,145 @@
+from array import array
+from bisect import bisect_left
+from itertools import islice
+from math import floor
+from operator import gt
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Tuple, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._transcripts import SnippetColumns
+
+
+# the start times, durations, text buffer and text offsets of the transformed snippets,
+# which are the arguments needed to create `SnippetColumns`
+_Columns = Tuple[
+    Sequence[float], Sequence[float], Union[bytes, memoryview], Sequence[int]
+]
+
+
+def _shift(columns: "SnippetColumns", offset: float) -> _Columns:
+    # the durations and texts don't change, so they are shared with `columns`
+    return (
+        array("d", map(float(offset).__add__, columns.starts)),
+        columns.durations,
+        *columns._get_text_columns(),
+    )
+
+
+def _scale(columns: "SnippetColumns", factor: float) -> _Columns:
+    if factor <= 0:
+        raise ValueError("factor has to be positive")
+    multiply = float(factor).__mul__
+    return (
+        array("d", map(multiply, columns.starts)),
+        array("d", map(multiply, columns.durations)),
+        *columns._get_text_columns(),
+    )
+
+
+def _clip(columns: "SnippetColumns", start: float, end: float) -> _Columns:
+    starts = array("d")
+    durations = array("d")
+    selected = []
+    for index, (snippet_start, duration) in enumerate(
+        zip(columns.starts, columns.durations)
+    ):
+        snippet_end = snippet_start + duration
+        # the same snippets `FetchedTranscript.between` returns
+        if snippet_start < end and (snippet_start >= start or snippet_end > start):
+            clipped_start = max(snippet_start, start)
+            starts.append(clipped_start)
+            durations.append(min(snippet_end, end) - clipped_start)
+            selected.append((index,))
+    return (starts, durations, *_join_texts(columns, selected, ""))
+
+
+def _merge(
+    columns: "SnippetColumns",
+    max_gap: float,
+    max_duration: Optional[float],
+    separator: str,
+) -> _Columns:
+    starts = array("d")
+    durations = array("d")
+    groups: List[range] = []
+    group_start = group_end = 0.0
+    for index, (snippet_start, duration) in enumerate(
+        zip(columns.starts, columns.durations)
+    ):
+        snippet_end = snippet_start + duration
+        merged_end = max(group_end, snippet_end)
+        if (
+            groups
+            and snippet_start - group_end <= max_gap
+            and (max_duration is None or merged_end - group_start <= max_duration)
+        ):
+            groups[-1] = range(groups[-1].start, index + 1)
+            group_end = merged_end
+            continue
+        if groups:
+            starts.append(group_start)
+            durations.append(group_end - group_start)
+        groups.append(range(index, index + 1))
+        group_start = snippet_start
+        group_end = snippet_end
+    if groups:
+        starts.append(group_start)
+        durations.append(group_end - group_start)
+    return (starts, durations, *_join_texts(columns, groups, separator))
+
+
+def _bucket(columns: "SnippetColumns", window: float, separator: str) -> _Columns:
+    if window <= 0:
+        raise ValueError("window has to be positive")
+    starts = columns.starts.tolist()
+    order: Optional[List[int]] = None
+    if any(map(gt, starts, islice(starts, 1, None))):
+        order = sorted(range(len(starts)), key=starts.__getitem__)
+        starts = [starts[index] for index in order]
+    keys = []
+    groups: List[Sequence[int]] = []
+    position = 0
+    # the snippets are sorted, so the end of each window can be found using binary
+    # search, instead of computing the window of every snippet
+    while position < len(starts):
+        key = floor(starts[position] / window)
+        stop = bisect_left(starts, (key + 1) * window, position + 1)
+        keys.append(key)
+        groups.append(range(position, stop) if order is None else order[position:stop])
+        position = stop
+    return (
+        array("d", [key * window for key in keys]),
+        array("d", [window]) * len(keys),
+        *_join_texts(columns, groups, separator),
+    )
+
+
+def _join_texts(
+    columns: "SnippetColumns", groups: Iterable[Sequence[int]], separator: str
+) -> Tuple[bytes, array]:
+    """
+    Joins the texts of each group of snippets, without decoding them. Empty texts are
+    skipped, so that they don't lead to repeated separators.
+    """
+    text_buffer, text_offsets = columns._get_text_columns()
+    text_offsets = text_offsets.tolist()
+    encoded_separator = separator.encode("utf-8")
+    texts = []
+    offsets = array("q", [0])
+    length = 0
+    for group in groups:
+        if isinstance(group, range):
+            # pairing up the offsets of a range of snippets is cheaper than indexing
+            bounds = zip(
+                text_offsets[group.start : group.stop],
+                text_offsets[group.start + 1 : group.stop + 1],
+            )
+        else:
+            bounds = ((text_offsets[index], text_offsets[index + 1]) for index in group)
+        text = encoded_separator.join(
+            [text_buffer[start:end] for start, end in bounds if end > start]
+        )
+        texts.append(text)
+        length += len(text)
+        offsets.append(length)
+    return b"".join(texts), offsets
@@ -0,0 +1,247 @@
+"""
+Fetching transcripts in bulk, using a pool of processes.
+
+`YouTubeTranscriptApi.fetch_many` overlaps the network requests of many videos, but
+parsing the fetched transcripts still happens on a single CPU core, as all threads share
+the GIL. A `ProcessPoolFetcher` instead spreads the videos over multiple worker
+processes, each of which fetches and parses its share of the videos with its own
+`YouTubeTranscriptApi` and a few threads.
+
+The workers build their `YouTubeTranscriptApi` from an `ApiConfig`, which is picklable
+and can assign a different proxy to each worker. Parsed transcripts are sent back to
+the parent process in the binary format of `youtube_transcript_api.serialization`,
+which is a lot more compact and faster to unpickle than a tree of dataclasses. The
+transcripts are loaded from it without copying the snippets, so their `snippets` are
+`SnippetColumns`.
+"""
+
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from itertools import count, islice
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from requests.adapters import DEFAULT_POOLSIZE
+
+from .proxies import ProxyConfig
+from .serialization import TimeFormat, dumps, loads
+from ._api import FetchResult, YouTubeTranscriptApi, _map_concurrently
+from ._errors import YouTubeTranscriptApiException
+from ._transcripts import CaptionWireFormat, InnertubeApiKeyCache
+
+
+@dataclass(frozen=True)
+class ApiConfig:
+    """
+    The configuration of the `YouTubeTranscriptApi` each worker of a
+    `ProcessPoolFetcher` creates. Unlike a `YouTubeTranscriptApi`, this can be pickled
+    and sent to other processes.
+    """
+
+    proxy_configs: Sequence[ProxyConfig] = ()
+    """
+    The proxy configs which are distributed over the workers. The n-th worker which is
+    started uses `proxy_configs[n % len(proxy_configs)]`, so giving every worker its
+    own proxy only requires passing one config per worker. If this is empty, no proxy
+    is used.
+    """
+    api_key_cache_ttl: Optional[float] = InnertubeApiKeyCache.DEFAULT_TTL
+    """
+    The `ttl` of the `InnertubeApiKeyCache` of each worker, or None to not cache the
+    innertube API key.
+    """
+    pool_maxsize: int = DEFAULT_POOLSIZE
+    """
+    The `pool_maxsize` of each worker's `YouTubeTranscriptApi`. This should be at least
+    the `threads_per_worker` of the `ProcessPoolFetcher`.
+    """
+
+    def build(self, worker_number: int = 0) -> YouTubeTranscriptApi:
+        """
+        Creates the `YouTubeTranscriptApi` of the `worker_number`-th worker.
+        """
+        proxy_config = None
+        if self.proxy_configs:
+            proxy_config = self.proxy_configs[worker_number % len(self.proxy_configs)]
+        return YouTubeTranscriptApi(
+            proxy_config=proxy_config,
+            api_key_cache=(
+                None
+                if self.api_key_cache_ttl is None
+                else InnertubeApiKeyCache(ttl=self.api_key_cache_ttl)
+            ),
+            pool_maxsize=self.pool_maxsize,
+        )
+
+
+# the API of the current worker process, which is created by `_init_worker`
+_worker_api: Optional[YouTubeTranscriptApi] = None
+
+
+def _init_worker(config: ApiConfig, worker_counter) -> None:
+    global _worker_api
+    with worker_counter.get_lock():
+        worker_number = worker_counter.value
+        worker_counter.value += 1
+    _worker_api = config.build(worker_number)
+
+
+def _picklable(error: Exception) -> Exception:
+    # an exception which can't be sent back to the parent process would fail the whole
+    # chunk, so it is replaced by its message
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        return YouTubeTranscriptApiException(
+            "{error_type}: {error}".format(error_type=type(error).__name__, error=error)
+        )
+
+
+def _fetch_chunk(
+    video_ids: List[str],
+    languages: Tuple[str, ...],
+    preserve_formatting: bool,
+    wire_format: CaptionWireFormat,
+    threads: int,
+    time_format: TimeFormat,
+) -> List[Tuple[Optional[bytes], Optional[Exception]]]:
+    """
+    Fetches the transcripts of `video_ids` in a worker process and returns each of them
+    serialized, or the error fetching it failed with, in the order of `video_ids`.
+    """
+    results: List[Tuple[Optional[bytes], Optional[Exception]]] = [(None, None)] * len(
+        video_ids
+    )
+    for result in _worker_api.fetch_many(
+        video_ids,
+        languages=languages,
+        preserve_formatting=preserve_formatting,
+        wire_format=wire_format,
+        max_in_flight=threads,
+    ):
+        if result.is_successful:
+            results[result.index] = (dumps(result.transcript, time_format), None)
+        else:
+            results[result.index] = (None, _picklable(result.error))
+    return results
+
+
+class ProcessPoolFetcher:
+    def __init__(
+        self,
+        config: ApiConfig = ApiConfig(),
+        max_workers: Optional[int] = None,
+        threads_per_worker: int = 8,
+        chunk_size: int = 16,
+        time_format: TimeFormat = TimeFormat.SECONDS,
+        mp_context: Optional[multiprocessing.context.BaseContext] = None,
+    ):
+        """
+        Fetches transcripts in a pool of worker processes. The workers are started
+        once and reused by all calls of `fetch_many`, until `close` is called, or the
+        `with` block this is used in is left.
+
+        :param config: the configuration the workers create their
+            `YouTubeTranscriptApi` from
+        :param max_workers: the number of worker processes. Defaults to the number of
+            CPU cores.
+        :param threads_per_worker: the number of videos each worker fetches at the
+            same time
+        :param chunk_size: the number of videos sent to a worker at once. Larger chunks
+            cause less overhead, but results are only returned once their whole chunk
+            has been fetched.
+        :param time_format: the time format transcripts are sent back to the parent
+            process in. `TimeFormat.MILLISECONDS` makes them smaller, but rounds their
+            times to milliseconds.
+        :param mp_context: the multiprocessing context used to start the workers
+        """
+        if threads_per_worker < 1 or chunk_size < 1:
+            raise ValueError("threads_per_worker and chunk_size have to be at least 1")
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if mp_context is None:
+            mp_context = multiprocessing.get_context()
+        self._threads_per_worker = threads_per_worker
+        self._chunk_size = chunk_size
+        self._time_format = TimeFormat(time_format)
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(config, mp_context.Value("i", 0)),
+        )
+        # keep every worker busy, while the next chunk is sent to it
+        self._max_chunks_in_flight = 2 * max_workers
+
+    def __enter__(self) -> "ProcessPoolFetcher":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def fetch_many(
+        self,
+        video_ids: Iterable[str],
+        languages: Iterable[str] = ("en",),
+        preserve_formatting: bool = False,
+        wire_format: CaptionWireFormat = CaptionWireFormat.XML,
+        ordered: bool = False,
+    ) -> Iterator[FetchResult]:
+        """
+        Works just like `YouTubeTranscriptApi.fetch_many`, but fetches and parses the
+        transcripts in the worker processes. `video_ids` is consumed lazily, one chunk
+        at a time, and the results are yielded as soon as their chunk is done.
+
+        If a worker process dies, an error is returned for every video of the chunks
+        it was working on, and this `ProcessPoolFetcher` can't be used anymore.
+        """
+        fetch_chunk = partial(
+            _fetch_chunk,
+            languages=tuple(languages),
+            preserve_formatting=preserve_formatting,
+            wire_format=CaptionWireFormat(wire_format),
+            threads=self._threads_per_worker,
+            time_format=self._time_format,
+        )
+        video_ids = iter(video_ids)
+        chunks = iter(lambda: list(islice(video_ids, self._chunk_size)), [])
+        completed_chunks = _map_concurrently(
+            fetch_chunk,
+            chunks,
+            self._max_chunks_in_flight,
+            ordered,
+            executor=self._executor,
+        )
+        return self._iter_fetch_results(completed_chunks)
+
+    def _iter_fetch_results(self, completed_chunks) -> Iterator[FetchResult]:
+        try:
+            for chunk_index, chunk, future in completed_chunks:
+                error = future.exception()
+                results = (
+                    [(None, error)] * len(chunk)
+                    if error is not None
+                    else future.result()
+                )
+                for index, video_id, (data, error) in zip(
+                    count(chunk_index * self._chunk_size), chunk, results
+                ):
+                    yield FetchResult(
+                        video_id=video_id,
+                        index=index,
+                        transcript=None if data is None else loads(data),
+                        error=error,
+                    )
+        finally:
+            completed_chunks.close()
+
+    def close(self) -> None:
+        """
+        Shuts down the worker processes, after they have finished the videos they are
+        working on.
+        """
+        self._executor.shutdown()
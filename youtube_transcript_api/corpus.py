@@ -0,0 +1,692 @@
+"""
+A local, on-disk search index over many fetched transcripts.
+
+Transcripts are added to a `CorpusIndex`, which buffers them in memory and writes them
+to immutable segment files once enough snippets have been buffered (or `flush()` is
+called). Queries memory-map the segments, so only the parts of the index needed to
+answer a query are read from disk. Whenever too many segments have accumulated, the
+smallest ones are merged into a single one in a background thread. Merging streams the
+segments into the new one, so it doesn't load their contents into memory.
+"""
+
+import heapq
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import accumulate, groupby
+from operator import itemgetter
+from threading import Lock, RLock, Thread
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from ._search import _build_context, _split_terms
+from ._transcripts import FetchedTranscript
+
+
+@dataclass(frozen=True)
+class CorpusMatch:
+    """
+    An occurrence of a search query in one of the transcripts of a `CorpusIndex`.
+    """
+
+    video_id: str
+    language_code: str
+    start: float
+    """
+    The start time of the snippet the match begins in, in seconds.
+    """
+    context: Optional[str] = None
+    """
+    The matched words, surrounded by the words before and after them. This is only
+    set for the results of `CorpusIndex.kwic`.
+    """
+
+
+# the names of the segment files a `CorpusIndex` writes, and of their temporary files
+_SEGMENT_FILE_NAME = re.compile(r"(\d{8,}\.seg)(\.tmp)?")
+
+
+def _sync_directory(directory: str) -> None:
+    # a rename only survives a crash, once the directory containing it has been synced.
+    # Directories can't be opened on Windows, where this isn't needed.
+    if os.name != "posix":
+        return
+    descriptor = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+# a document is a single transcript, consisting of the text and start time of each of
+# its snippets
+_Document = Tuple[str, str, List[Tuple[str, float]]]
+
+# the number of values which are converted at once, while merging segments
+_CHUNK_SIZE = 65_536
+
+
+def _shift(values: memoryview, shift: int) -> Iterator[bytes]:
+    for chunk_start in range(0, len(values), _CHUNK_SIZE):
+        yield array(
+            "q",
+            (
+                value + shift
+                for value in values[chunk_start : chunk_start + _CHUNK_SIZE]
+            ),
+        ).tobytes()
+
+
+def _remap(values: memoryview, mapping: array) -> Iterator[bytes]:
+    for chunk_start in range(0, len(values), _CHUNK_SIZE):
+        yield array(
+            "q",
+            (
+                mapping[value]
+                for value in values[chunk_start : chunk_start + _CHUNK_SIZE]
+            ),
+        ).tobytes()
+
+
+class _Segment:
+    """
+    An immutable segment file, which is memory-mapped for reading.
+
+    A segment starts with a header, containing the offset and length of each of its
+    sections. The sections are stored in the byte order of the machine which wrote the
+    segment, each starting at a multiple of 8 bytes:
+
+    - documents: a JSON list of the video ID and language code of every document
+    - document offsets (int64): the index of the first snippet of each document
+    - starts (float64): the start time of each snippet
+    - word offsets (int64): the position of the first word of each snippet
+    - text offsets (int64) and texts (UTF-8): the text of each snippet
+    - term IDs (int64): the ID of the term at each position
+    - term offsets (int64) and terms (UTF-8): all terms, ordered by their ID, which is
+      their rank in sorted order
+    - posting offsets (int64) and postings (int64): the positions of each term
+
+    All numbers are 64 bit wide, so that merged segments can grow beyond 2^31 words.
+    """
+
+    MAGIC = b"YTTCSEG\x00"
+    VERSION = 2
+    _SECTIONS = (
+        ("documents", None),
+        ("document_offsets", "q"),
+        ("starts", "d"),
+        ("word_offsets", "q"),
+        ("text_offsets", "q"),
+        ("texts", None),
+        ("term_ids", "q"),
+        ("term_offsets", "q"),
+        ("terms", None),
+        ("posting_offsets", "q"),
+        ("postings", "q"),
+    )
+    _HEADER = struct.Struct("<8sIc3x" + "QQ" * len(_SECTIONS))
+    _BYTE_ORDER = b"L" if sys.byteorder == "little" else b"B"
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views: List[memoryview] = []
+        header = self._HEADER.unpack_from(self._mmap)
+        magic, version, byte_order = header[:3]
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError("{path} is not a corpus segment".format(path=path))
+        if byte_order != self._BYTE_ORDER:
+            self.close()
+            raise ValueError(
+                "{path} has been written on a machine with a different byte "
+                "order".format(path=path)
+            )
+        for index, (name, type_code) in enumerate(self._SECTIONS):
+            offset, length = header[3 + 2 * index : 5 + 2 * index]
+            view = memoryview(self._mmap)[offset : offset + length]
+            if type_code is not None:
+                view = view.cast(type_code)
+            self._views.append(view)
+            setattr(self, "_" + name, view)
+        self._documents = json.loads(bytes(self._documents))
+
+    @classmethod
+    def write(cls, path: str, documents: Sequence[_Document]) -> None:
+        document_offsets = array("q", [0])
+        starts = array("d")
+        word_offsets = array("q", [0])
+        text_offsets = array("q", [0])
+        texts = []
+        snippet_terms = []
+        word_count = 0
+        text_length = 0
+        for _, _, snippets in documents:
+            for text, start in snippets:
+                terms = _split_terms(text)
+                snippet_terms.append(terms)
+                word_count += len(terms)
+                word_offsets.append(word_count)
+                encoded_text = text.encode("utf-8")
+                texts.append(encoded_text)
+                text_length += len(encoded_text)
+                text_offsets.append(text_length)
+                starts.append(start)
+            document_offsets.append(len(starts))
+
+        vocabulary = sorted({term for terms in snippet_terms for term in terms})
+        term_ids = {term: term_id for term_id, term in enumerate(vocabulary)}
+        positions = array(
+            "q", (term_ids[term] for terms in snippet_terms for term in terms)
+        )
+        postings: List[List[int]] = [[] for _ in vocabulary]
+        for position, term_id in enumerate(positions):
+            postings[term_id].append(position)
+        encoded_terms = [term.encode("utf-8") for term in vocabulary]
+        term_offsets = array("q", [0])
+        posting_offsets = array("q", [0])
+        for encoded_term, term_postings in zip(encoded_terms, postings):
+            term_offsets.append(term_offsets[-1] + len(encoded_term))
+            posting_offsets.append(posting_offsets[-1] + len(term_postings))
+
+        sections = (
+            json.dumps(
+                [[video_id, language_code] for video_id, language_code, _ in documents]
+            ).encode("utf-8"),
+            document_offsets.tobytes(),
+            starts.tobytes(),
+            word_offsets.tobytes(),
+            text_offsets.tobytes(),
+            b"".join(texts),
+            positions.tobytes(),
+            term_offsets.tobytes(),
+            b"".join(encoded_terms),
+            posting_offsets.tobytes(),
+            array(
+                "q", (p for term_postings in postings for p in term_postings)
+            ).tobytes(),
+        )
+        cls._write_sections(path, [(section,) for section in sections])
+
+    @classmethod
+    def merge(cls, path: str, segments: Sequence["_Segment"]) -> None:
+        """
+        Writes a segment containing the documents of all `segments`, in their order.
+        This produces the same segment as writing all documents at once, but streams
+        the sections of the segments into the new one, remapping the term IDs and
+        shifting the offsets and positions, instead of loading the documents.
+        """
+        snippet_shifts = [0, *accumulate(len(segment._starts) for segment in segments)]
+        word_shifts = [
+            0,
+            *accumulate(segment._word_offsets[-1] for segment in segments),
+        ]
+        text_shifts = [
+            0,
+            *accumulate(segment._text_offsets[-1] for segment in segments),
+        ]
+
+        def iter_merged_terms() -> Iterator[Tuple[bytes, List[Tuple[int, int]]]]:
+            # a k-way merge of the sorted terms of all segments, which yields every
+            # term once, along with the segments containing it and its IDs in them
+            merged_terms = heapq.merge(
+                *(
+                    segment._iter_terms(segment_number)
+                    for segment_number, segment in enumerate(segments)
+                )
+            )
+            for term, occurrences in groupby(merged_terms, key=itemgetter(0)):
+                yield term, [occurrence[1:] for occurrence in occurrences]
+
+        # the new ID of each term, by segment and old ID
+        term_id_mappings = [
+            array("q", bytes(8 * (len(segment._term_offsets) - 1)))
+            for segment in segments
+        ]
+        term_offsets = array("q", [0])
+        posting_offsets = array("q", [0])
+        for term_id, (term, occurrences) in enumerate(iter_merged_terms()):
+            term_offsets.append(term_offsets[-1] + len(term))
+            posting_count = posting_offsets[-1]
+            for segment_number, old_term_id in occurrences:
+                term_id_mappings[segment_number][old_term_id] = term_id
+                posting_count += segments[segment_number]._get_postings_length(
+                    old_term_id
+                )
+            posting_offsets.append(posting_count)
+
+        def iter_offsets(name: str, shifts: List[int]) -> Iterator[bytes]:
+            yield array("q", [0]).tobytes()
+            for segment, shift in zip(segments, shifts):
+                yield from _shift(getattr(segment, name)[1:], shift)
+
+        def iter_postings() -> Iterator[bytes]:
+            for _, occurrences in iter_merged_terms():
+                for segment_number, term_id in occurrences:
+                    segment = segments[segment_number]
+                    yield from _shift(
+                        segment._postings[
+                            segment._posting_offsets[
+                                term_id
+                            ] : segment._posting_offsets[term_id + 1]
+                        ],
+                        word_shifts[segment_number],
+                    )
+
+        cls._write_sections(
+            path,
+            [
+                (
+                    json.dumps(
+                        [
+                            document
+                            for segment in segments
+                            for document in segment._documents
+                        ]
+                    ).encode("utf-8"),
+                ),
+                iter_offsets("_document_offsets", snippet_shifts),
+                [segment._starts for segment in segments],
+                iter_offsets("_word_offsets", word_shifts),
+                iter_offsets("_text_offsets", text_shifts),
+                [segment._texts for segment in segments],
+                (
+                    chunk
+                    for segment, mapping in zip(segments, term_id_mappings)
+                    for chunk in _remap(segment._term_ids, mapping)
+                ),
+                (term_offsets,),
+                (term for term, _ in iter_merged_terms()),
+                (posting_offsets,),
+                iter_postings(),
+            ],
+        )
+
+    @classmethod
+    def _write_sections(cls, path: str, sections: Sequence[Iterable[Any]]) -> None:
+        """
+        Writes a segment file, consisting of `sections`, each of which is written from
+        an iterable of bytes-like chunks. The chunks of a section are only requested,
+        once the previous section has been written.
+        """
+        # segments are written to a temporary file first, so that a segment file is
+        # either complete or doesn't exist at all
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "wb") as file:
+            # the header is written last, once the locations of the sections are known
+            file.write(b"\x00" * cls._HEADER.size)
+            locations = []
+            for section in sections:
+                file.write(b"\x00" * (-file.tell() % 8))
+                section_offset = file.tell()
+                for chunk in section:
+                    file.write(chunk)
+                locations.extend((section_offset, file.tell() - section_offset))
+            file.seek(0)
+            file.write(
+                cls._HEADER.pack(cls.MAGIC, cls.VERSION, cls._BYTE_ORDER, *locations)
+            )
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+        _sync_directory(os.path.dirname(os.path.abspath(path)))
+
+    def close(self) -> None:
+        for view in self._views:
+            view.release()
+        self._mmap.close()
+
+    @property
+    def snippet_count(self) -> int:
+        return len(self._starts)
+
+    def _iter_terms(self, segment_number: int) -> Iterator[Tuple[bytes, int, int]]:
+        for term_id in range(len(self._term_offsets) - 1):
+            yield self._get_term(term_id), segment_number, term_id
+
+    def search(
+        self,
+        terms: List[str],
+        context: Optional[int],
+        highlight: Tuple[str, str],
+    ) -> List[CorpusMatch]:
+        term_ids = [self._lookup_term(term) for term in terms]
+        if not term_ids or None in term_ids:
+            return []
+        # only the positions of the rarest term have to be checked
+        rarest_offset = min(
+            range(len(term_ids)),
+            key=lambda offset: self._get_postings_length(term_ids[offset]),
+        )
+        rarest_id = term_ids[rarest_offset]
+        matches = []
+        for rarest_position in self._postings[
+            self._posting_offsets[rarest_id] : self._posting_offsets[rarest_id + 1]
+        ]:
+            position = rarest_position - rarest_offset
+            end = position + len(term_ids)
+            if position < 0 or self._term_ids[position:end].tolist() != term_ids:
+                continue
+            match = self._build_match(position, end, context, highlight)
+            if match is not None:
+                matches.append(match)
+        return matches
+
+    def _build_match(
+        self,
+        position: int,
+        end: int,
+        context: Optional[int],
+        highlight: Tuple[str, str],
+    ) -> Optional[CorpusMatch]:
+        snippet_index = bisect_right(self._word_offsets, position) - 1
+        document_index = bisect_right(self._document_offsets, snippet_index) - 1
+        document_end = self._word_offsets[self._document_offsets[document_index + 1]]
+        if end > document_end:
+            # phrases can span snippets, but not documents
+            return None
+        video_id, language_code = self._documents[document_index]
+        return CorpusMatch(
+            video_id=video_id,
+            language_code=language_code,
+            start=self._starts[snippet_index],
+            context=(
+                None
+                if context is None
+                else _build_context(
+                    self._get_text,
+                    self._word_offsets,
+                    (position, end),
+                    (
+                        self._word_offsets[self._document_offsets[document_index]],
+                        document_end,
+                    ),
+                    context,
+                    highlight,
+                )
+            ),
+        )
+
+    def _get_text(self, snippet_index: int) -> str:
+        return str(
+            self._texts[
+                self._text_offsets[snippet_index] : self._text_offsets[
+                    snippet_index + 1
+                ]
+            ],
+            "utf-8",
+        )
+
+    def _get_term(self, term_id: int) -> bytes:
+        return self._terms[
+            self._term_offsets[term_id] : self._term_offsets[term_id + 1]
+        ].tobytes()
+
+    def _get_postings_length(self, term_id: int) -> int:
+        return self._posting_offsets[term_id + 1] - self._posting_offsets[term_id]
+
+    def _lookup_term(self, term: str) -> Optional[int]:
+        # terms are sorted, and UTF-8 preserves the order of code points
+        encoded_term = term.encode("utf-8")
+        low = 0
+        high = len(self._term_offsets) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if self._get_term(middle) < encoded_term:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self._term_offsets) - 1 and self._get_term(low) == encoded_term:
+            return low
+        return None
+
+
+class CorpusIndex:
+    """
+    A search index over many transcripts, stored in `directory`. It can be opened again
+    later on, to add more transcripts or to query it.
+
+    Transcripts added using `add` are buffered in memory and only become searchable,
+    once they have been written to a new segment. This happens automatically, as soon
+    as `max_buffered_snippets` have been buffered, or when calling `flush` or `close`.
+    Once there are `merge_factor` segments, the smallest ones are merged in the
+    background.
+
+    All methods are thread-safe. Adding the same transcript twice will index it twice.
+
+    A directory must only be opened by a single `CorpusIndex` at a time, as there is no
+    locking across processes. When an index is opened, it deletes the leftovers of
+    interrupted flushes and merges, which would also delete the files another
+    `CorpusIndex` on the same directory is just writing. Files, which haven't been
+    created by a `CorpusIndex`, are left untouched.
+    """
+
+    _MANIFEST = "manifest.json"
+
+    def __init__(
+        self,
+        directory: str,
+        max_buffered_snippets: int = 100_000,
+        merge_factor: int = 8,
+    ):
+        if merge_factor < 2:
+            raise ValueError("merge_factor has to be at least 2")
+        self._directory = directory
+        self._max_buffered_snippets = max_buffered_snippets
+        self._merge_factor = merge_factor
+        # guards the buffer, the list of segments and the manifest
+        self._lock = RLock()
+        # only a single merge is running at a time
+        self._merge_lock = Lock()
+        self._merge_thread: Optional[Thread] = None
+        self._is_merging = False
+        self._merge_error: Optional[BaseException] = None
+        self._buffer: List[_Document] = []
+        self._buffered_snippets = 0
+        os.makedirs(directory, exist_ok=True)
+        manifest = self._read_manifest()
+        self._next_generation = manifest["next_generation"]
+        self._segments = [
+            _Segment(os.path.join(directory, name)) for name in manifest["segments"]
+        ]
+        self._remove_unreferenced_files(set(manifest["segments"]))
+
+    def __enter__(self) -> "CorpusIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def segment_count(self) -> int:
+        with self._lock:
+            return len(self._segments)
+
+    def add(self, transcript: FetchedTranscript) -> None:
+        """
+        Adds a transcript to the index. It becomes searchable once it has been
+        flushed.
+        """
+        snippets = [(text, start) for text, start, _ in transcript.iter_tuples()]
+        with self._lock:
+            self._buffer.append(
+                (transcript.video_id, transcript.language_code, snippets)
+            )
+            self._buffered_snippets += len(snippets)
+            if self._buffered_snippets >= self._max_buffered_snippets:
+                self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes all buffered transcripts to a new segment, making them searchable.
+        """
+        with self._lock:
+            if not self._buffer:
+                return
+            name = self._create_segment_name()
+            _Segment.write(os.path.join(self._directory, name), self._buffer)
+            self._segments.append(_Segment(os.path.join(self._directory, name)))
+            self._write_manifest()
+            self._buffer = []
+            self._buffered_snippets = 0
+            if len(self._segments) >= self._merge_factor and not self._is_merging:
+                self._is_merging = True
+                self._merge_thread = Thread(
+                    target=self._merge_in_background, daemon=True
+                )
+                self._merge_thread.start()
+
+    def search(self, query: str) -> List[CorpusMatch]:
+        """
+        Finds all occurrences of the words in `query`, as a phrase, in all flushed
+        transcripts. Matching ignores case and punctuation and a phrase can span
+        multiple snippets of a transcript.
+        """
+        return self._search(query, None, ("", ""))
+
+    def kwic(
+        self,
+        query: str,
+        context: int = 5,
+        highlight: Tuple[str, str] = ("**", "**"),
+    ) -> List[CorpusMatch]:
+        """
+        Finds the same matches as `search`, but returns every match in its context
+        (keyword in context). The context consists of the matched words, enclosed in
+        `highlight`, surrounded by `context` words of the same transcript.
+        """
+        return self._search(query, context, highlight)
+
+    def merge(self) -> None:
+        """
+        Merges all segments into a single one, which makes queries faster.
+        """
+        with self._merge_lock:
+            with self._lock:
+                segments = list(self._segments)
+            if len(segments) > 1:
+                self._merge_segments(segments)
+
+    def wait_for_merges(self) -> None:
+        """
+        Blocks until the running background merge has finished and raises the error
+        it failed with, if any.
+        """
+        merge_thread = self._merge_thread
+        if merge_thread is not None:
+            merge_thread.join()
+        error, self._merge_error = self._merge_error, None
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        """
+        Flushes all buffered transcripts, waits for merges to finish and closes all
+        segment files.
+        """
+        self.flush()
+        self.wait_for_merges()
+        with self._lock:
+            for segment in self._segments:
+                segment.close()
+            self._segments = []
+
+    def _search(
+        self, query: str, context: Optional[int], highlight: Tuple[str, str]
+    ) -> List[CorpusMatch]:
+        terms = _split_terms(query)
+        with self._lock:
+            return [
+                match
+                for segment in self._segments
+                for match in segment.search(terms, context, highlight)
+            ]
+
+    def _merge_in_background(self) -> None:
+        try:
+            with self._merge_lock:
+                while True:
+                    with self._lock:
+                        # checked under the same lock as in `flush`, so that no
+                        # segment is added without being considered for merging
+                        if len(self._segments) < self._merge_factor:
+                            self._is_merging = False
+                            return
+                        smallest = sorted(
+                            self._segments, key=lambda segment: segment.snippet_count
+                        )[: self._merge_factor]
+                    self._merge_segments(smallest)
+        except BaseException as error:
+            self._merge_error = error
+            with self._lock:
+                self._is_merging = False
+
+    def _merge_segments(self, segments: List[_Segment]) -> None:
+        # segments are immutable and only removed by merges, so they can be read
+        # without holding the lock
+        with self._lock:
+            name = self._create_segment_name()
+            segments = [segment for segment in self._segments if segment in segments]
+        path = os.path.join(self._directory, name)
+        _Segment.merge(path, segments)
+        merged_segment = _Segment(path)
+        with self._lock:
+            position = self._segments.index(segments[0])
+            self._segments = [
+                segment for segment in self._segments if segment not in segments
+            ]
+            self._segments.insert(position, merged_segment)
+            # the merged segments are only removed, once the manifest no longer
+            # references them on disk
+            self._write_manifest()
+            for segment in segments:
+                segment.close()
+                os.remove(segment.path)
+
+    def _create_segment_name(self) -> str:
+        name = "{generation:08d}.seg".format(generation=self._next_generation)
+        self._next_generation += 1
+        return name
+
+    def _read_manifest(self) -> Dict:
+        path = os.path.join(self._directory, self._MANIFEST)
+        if not os.path.exists(path):
+            return {"next_generation": 0, "segments": []}
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+
+    def _write_manifest(self) -> None:
+        # the manifest is synced to disk and replaced atomically, so that it always
+        # references a consistent set of segments, even after a crash or power loss
+        path = os.path.join(self._directory, self._MANIFEST)
+        with open(path + ".tmp", "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "next_generation": self._next_generation,
+                    "segments": [
+                        os.path.basename(segment.path) for segment in self._segments
+                    ],
+                },
+                file,
+            )
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(path + ".tmp", path)
+        _sync_directory(self._directory)
+
+    def _remove_unreferenced_files(self, segment_names: set) -> None:
+        # leftovers of flushes or merges, which have been interrupted. Only the names
+        # this class generates are considered, so that unrelated files are kept.
+        for name in os.listdir(self._directory):
+            match = _SEGMENT_FILE_NAME.fullmatch(name)
+            if name == self._MANIFEST + ".tmp" or (
+                match is not None
+                and (match.group(2) is not None or match.group(1) not in segment_names)
+            ):
+                os.remove(os.path.join(self._directory, name))
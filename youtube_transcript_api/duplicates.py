@@ -0,0 +1,267 @@
+"""
+Detection of near-duplicate transcripts, such as re-uploads or slightly edited copies
+of the same video.
+
+Every transcript is summarized by a MinHash signature of the word n-grams (shingles) of
+its text, from which the Jaccard similarity of two transcripts can be estimated. A
+`DuplicateIndex` stores the signatures in an SQLite database, along with a
+locality-sensitive hashing (LSH) index, which maps bands of each signature to the
+transcripts sharing them. This way, a query only has to compare the signatures of the
+few transcripts sharing at least one band with it, instead of all stored ones.
+"""
+
+import sqlite3
+import struct
+from dataclasses import dataclass
+from hashlib import blake2b
+from operator import eq
+from threading import Lock
+from typing import Iterator, List, Optional, Tuple
+
+from ._search import _split_terms
+from ._transcripts import FetchedTranscript
+
+
+@dataclass(frozen=True)
+class DuplicateMatch:
+    """
+    A transcript of a `DuplicateIndex`, which is a near-duplicate of a queried one.
+    """
+
+    video_id: str
+    language_code: str
+    similarity: float
+    """
+    The estimated Jaccard similarity of the shingles of both transcripts, between 0
+    and 1.
+    """
+
+
+def _hash(data: bytes) -> int:
+    # unlike `hash`, this is stable across processes, which is required for hashes
+    # stored on disk
+    return int.from_bytes(blake2b(data, digest_size=8).digest(), "little")
+
+
+def minhash_signature(
+    transcript: FetchedTranscript, num_perm: int = 128, shingle_size: int = 5
+) -> Optional[Tuple[int, ...]]:
+    """
+    Computes the MinHash signature of the text of a transcript, consisting of
+    `num_perm` values. Two signatures agree in a share of their values, which
+    approximates the Jaccard similarity of the sets of `shingle_size` consecutive
+    words of both transcripts. Matching ignores case and punctuation.
+
+    Instead of hashing every shingle `num_perm` times, each one is hashed only once,
+    which splits the shingles into `num_perm` bins, keeping the smallest hash of each
+    bin (one permutation hashing). Empty bins take the value of the next non-empty
+    one. Returns `None` for a transcript without any words.
+    """
+    terms = [
+        term for text, _, _ in transcript.iter_tuples() for term in _split_terms(text)
+    ]
+    if not terms:
+        return None
+    shingles = {
+        " ".join(terms[index : index + shingle_size])
+        for index in range(max(len(terms) - shingle_size + 1, 1))
+    }
+    hashes = sorted(
+        (_hash(shingle.encode("utf-8")) for shingle in shingles), reverse=True
+    )
+    # the hashes are processed in descending order, so the smallest one of each bin
+    # is written last
+    bins = {value % num_perm: value // num_perm for value in hashes}
+    signature = [bins.get(index) for index in range(num_perm)]
+    # rotation: every empty bin takes the value of the next non-empty one, wrapping
+    # around at the end
+    next_value = bins[min(bins)]
+    for index in reversed(range(num_perm)):
+        if signature[index] is None:
+            signature[index] = next_value
+        else:
+            next_value = signature[index]
+    return tuple(signature)
+
+
+class DuplicateIndex:
+    """
+    An index of MinHash signatures, stored in the SQLite database at `path`, which is
+    queried for near-duplicates of transcripts. It can be opened again later on, to add
+    more transcripts or to query it.
+
+    Each signature of `num_perm` values is split into `bands` bands and a transcript is
+    only compared to the ones which agree with it in all values of at least one band.
+    The more bands, the more likely near-duplicates with a low similarity are found,
+    but the more transcripts are compared. A transcript with a similarity of `s` is
+    found with a probability of `1 - (1 - s ** (num_perm / bands)) ** bands`, which,
+    for the default values, is almost 95% for a similarity of 0.8, but only 6% for a
+    similarity of 0.5. `num_perm`, `bands` and `shingle_size` can't be changed, once
+    the index has been created.
+
+    Added transcripts are immediately taken into account by queries, but are only
+    persisted once `commit` or `close` has been called, or `max_uncommitted` transcripts
+    have been added since the last commit.
+
+    All methods are thread-safe. Adding the same transcript twice will index it twice.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 5,
+        threshold: float = 0.8,
+        max_uncommitted: int = 1000,
+    ):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm has to be a multiple of bands")
+        self._threshold = threshold
+        self._max_uncommitted = max_uncommitted
+        self._uncommitted = 0
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS settings (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS documents (
+                id INTEGER PRIMARY KEY,
+                video_id TEXT NOT NULL,
+                language_code TEXT NOT NULL,
+                signature BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS buckets (
+                band INTEGER NOT NULL,
+                key INTEGER NOT NULL,
+                document INTEGER NOT NULL,
+                PRIMARY KEY (band, key, document)
+            ) WITHOUT ROWID;
+            """
+        )
+        settings = {"num_perm": num_perm, "bands": bands, "shingle_size": shingle_size}
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO settings (name, value) VALUES (?, ?)",
+            settings.items(),
+        )
+        self._connection.commit()
+        stored_settings = dict(
+            self._connection.execute("SELECT name, value FROM settings")
+        )
+        if stored_settings != settings:
+            self._connection.close()
+            raise ValueError(
+                "the index has been created with different settings: {settings}".format(
+                    settings=stored_settings
+                )
+            )
+        self._num_perm = num_perm
+        self._bands = bands
+        self._shingle_size = shingle_size
+        self._signature_struct = struct.Struct("<{count}Q".format(count=num_perm))
+
+    def __enter__(self) -> "DuplicateIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM documents"
+            ).fetchone()[0]
+
+    def add(self, transcript: FetchedTranscript) -> None:
+        """
+        Adds a transcript to the index. Transcripts without any words are ignored, as
+        they can't be compared.
+        """
+        signature = minhash_signature(transcript, self._num_perm, self._shingle_size)
+        if signature is None:
+            return
+        data = self._signature_struct.pack(*signature)
+        with self._lock:
+            document = self._connection.execute(
+                "INSERT INTO documents (video_id, language_code, signature) "
+                "VALUES (?, ?, ?)",
+                (transcript.video_id, transcript.language_code, data),
+            ).lastrowid
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO buckets (band, key, document) VALUES (?, ?, ?)",
+                (
+                    (band, key, document)
+                    for band, key in enumerate(self._iter_band_keys(data))
+                ),
+            )
+            self._uncommitted += 1
+            if self._uncommitted >= self._max_uncommitted:
+                self._commit()
+
+    def query(
+        self, transcript: FetchedTranscript, threshold: Optional[float] = None
+    ) -> List[DuplicateMatch]:
+        """
+        Finds the transcripts of the index which are near-duplicates of `transcript`,
+        meaning their estimated similarity is at least `threshold` (defaulting to the
+        threshold of the index). The matches are ordered by descending similarity.
+        """
+        if threshold is None:
+            threshold = self._threshold
+        signature = minhash_signature(transcript, self._num_perm, self._shingle_size)
+        if signature is None:
+            return []
+        data = self._signature_struct.pack(*signature)
+        candidates = {}
+        with self._lock:
+            for band, key in enumerate(self._iter_band_keys(data)):
+                for (
+                    document,
+                    video_id,
+                    language_code,
+                    other,
+                ) in self._connection.execute(
+                    "SELECT id, video_id, language_code, signature FROM buckets "
+                    "JOIN documents ON documents.id = buckets.document "
+                    "WHERE band = ? AND key = ?",
+                    (band, key),
+                ):
+                    candidates[document] = (video_id, language_code, other)
+        matches = []
+        for video_id, language_code, other in candidates.values():
+            similarity = (
+                sum(map(eq, signature, self._signature_struct.unpack(other)))
+                / self._num_perm
+            )
+            if similarity >= threshold:
+                matches.append(DuplicateMatch(video_id, language_code, similarity))
+        matches.sort(key=lambda match: match.similarity, reverse=True)
+        return matches
+
+    def commit(self) -> None:
+        """
+        Persists all transcripts added since the last commit.
+        """
+        with self._lock:
+            self._commit()
+
+    def close(self) -> None:
+        """
+        Commits all added transcripts and closes the database.
+        """
+        with self._lock:
+            self._commit()
+            self._connection.close()
+
+    def _commit(self) -> None:
+        self._connection.commit()
+        self._uncommitted = 0
+
+    def _iter_band_keys(self, data: bytes) -> Iterator[int]:
+        band_size = len(data) // self._bands
+        for offset in range(0, len(data), band_size):
+            # SQLite integers are signed
+            yield _hash(data[offset : offset + band_size]) - (1 << 63)
@@ -0,0 +1,260 @@
+"""
+Exports many fetched transcripts to Parquet or Arrow IPC files, which can be read by
+DataFrame engines like pandas, Polars, DuckDB or Spark.
+
+Every snippet becomes a row with the columns `video_id`, `language_code`,
+`is_generated`, `start`, `duration` and `text`. The rows are partitioned into
+Hive-style directories (e.g. `language_code=en/`), buffered per partition and written
+as row groups (or record batches) of at most `row_group_size` rows, so that the memory
+used while exporting doesn't grow with the number of transcripts.
+
+This requires `pyarrow` to be installed.
+"""
+
+import os
+import uuid
+from array import array
+from collections import OrderedDict
+from enum import Enum
+from itertools import islice
+from typing import Any, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+from ._transcripts import FetchedTranscript
+
+
+class ExportFormat(str, Enum):
+    PARQUET = "parquet"
+    ARROW = "arrow"
+    """
+    The Arrow IPC file format (also known as Feather V2).
+    """
+
+
+# the columns of the exported files, along with the names of their pyarrow types
+_COLUMNS = (
+    ("video_id", "string"),
+    ("language_code", "string"),
+    ("is_generated", "bool_"),
+    ("start", "float64"),
+    ("duration", "float64"),
+    ("text", "string"),
+)
+_PARTITION_COLUMNS = ("video_id", "language_code", "is_generated")
+
+
+class _Partition:
+    """
+    The buffered rows of a single partition and the writer of the file they are
+    written to. The file is only created once the first row group is written.
+    """
+
+    def __init__(self, exporter: "ArrowExporter", directory: str):
+        self._exporter = exporter
+        self._directory = directory
+        self._writer: Optional[Any] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        # the video ID, language code and is_generated flag of each buffered
+        # transcript and the index of the transcript each row belongs to
+        self._transcripts: List[Tuple[str, str, bool]] = []
+        self._transcript_indices = array("i")
+        self._starts = array("d")
+        self._durations = array("d")
+        self._texts: List[str] = []
+
+    def add(self, transcript: FetchedTranscript) -> None:
+        metadata = (
+            transcript.video_id,
+            transcript.language_code,
+            transcript.is_generated,
+        )
+        rows = transcript.iter_tuples()
+        while True:
+            chunk = list(
+                islice(rows, self._exporter._row_group_size - len(self._starts))
+            )
+            if not chunk:
+                return
+            self._transcripts.append(metadata)
+            texts, starts, durations = zip(*chunk)
+            self._texts.extend(texts)
+            self._starts.extend(starts)
+            self._durations.extend(durations)
+            self._transcript_indices.extend(
+                array("i", [len(self._transcripts) - 1]) * len(chunk)
+            )
+            if len(self._starts) >= self._exporter._row_group_size:
+                self.flush()
+
+    def flush(self) -> None:
+        if not self._starts:
+            return
+        if self._writer is None:
+            self._writer = self._exporter._open_writer(self._directory)
+        self._writer.write_batch(self._build_batch())
+        self._reset()
+
+    def close(self) -> None:
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _build_batch(self) -> Any:
+        pyarrow = self._exporter._pyarrow
+        row_count = len(self._starts)
+        indices = _wrap_buffer(
+            pyarrow, pyarrow.int32(), row_count, self._transcript_indices
+        )
+        columns = {
+            "start": _wrap_buffer(pyarrow, pyarrow.float64(), row_count, self._starts),
+            "duration": _wrap_buffer(
+                pyarrow, pyarrow.float64(), row_count, self._durations
+            ),
+            "text": pyarrow.array(self._texts, type=pyarrow.string()),
+        }
+        for field_index, (name, type_name) in enumerate(_COLUMNS[:3]):
+            columns[name] = pyarrow.array(
+                [transcript[field_index] for transcript in self._transcripts],
+                type=getattr(pyarrow, type_name)(),
+            ).take(indices)
+        schema = self._exporter._schema
+        return pyarrow.record_batch(
+            [columns[name] for name in schema.names], schema=schema
+        )
+
+
+def _wrap_buffer(pyarrow: Any, data_type: Any, length: int, values: array) -> Any:
+    # creates an Arrow array sharing its memory with `values`, instead of converting
+    # every value on its own
+    return pyarrow.Array.from_buffers(
+        data_type, length, [None, pyarrow.py_buffer(values)]
+    )
+
+
+class ArrowExporter:
+    """
+    Writes transcripts to a dataset of Parquet or Arrow IPC files in `directory`.
+
+    The rows are partitioned by the values of the columns in `partition_by`. Each
+    partition is written to its own directory, named after the column values (e.g.
+    `language_code=en/is_generated=false/`), and the partition columns are omitted from
+    the files themselves, as DataFrame engines restore them from the directory names.
+    Pass an empty `partition_by` to write all rows to a single file.
+
+    Up to `row_group_size` rows are buffered per partition, before they are written as
+    a row group. At most `max_open_files` partition files are open at a time. If there
+    are more partitions, the least recently used one is closed and further rows of it
+    are written to a new file, so memory usage is bounded by `max_open_files *
+    row_group_size` rows.
+
+    The files are only complete once the exporter has been closed. Every exporter names
+    its files uniquely, so multiple exports can be written to the same directory.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        format: ExportFormat = ExportFormat.PARQUET,
+        partition_by: Sequence[str] = ("language_code",),
+        row_group_size: int = 65_536,
+        max_open_files: int = 32,
+    ):
+        for column in partition_by:
+            if column not in _PARTITION_COLUMNS:
+                raise ValueError(
+                    "transcripts can only be partitioned by {columns}, not by "
+                    '"{column}"'.format(
+                        columns=", ".join(_PARTITION_COLUMNS), column=column
+                    )
+                )
+        if row_group_size < 1 or max_open_files < 1:
+            raise ValueError("row_group_size and max_open_files have to be positive")
+
+        import pyarrow
+
+        self._pyarrow = pyarrow
+        self._format = ExportFormat(format)
+        if self._format == ExportFormat.PARQUET:
+            import pyarrow.parquet
+        else:
+            import pyarrow.ipc
+
+        self._directory = directory
+        self._partition_by = tuple(partition_by)
+        self._row_group_size = row_group_size
+        self._max_open_files = max_open_files
+        self._schema = pyarrow.schema(
+            [
+                (name, getattr(pyarrow, type_name)())
+                for name, type_name in _COLUMNS
+                if name not in self._partition_by
+            ]
+        )
+        self._partitions: "OrderedDict[Tuple, _Partition]" = OrderedDict()
+        self._file_prefix = uuid.uuid4().hex
+        self._file_count = 0
+        self.paths: List[str] = []
+        """
+        The paths of all files that have been created so far.
+        """
+        os.makedirs(directory, exist_ok=True)
+
+    def __enter__(self) -> "ArrowExporter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def add(self, transcript: FetchedTranscript) -> None:
+        """
+        Adds the snippets of `transcript` to the export.
+        """
+        key = tuple(getattr(transcript, column) for column in self._partition_by)
+        partition = self._partitions.get(key)
+        if partition is None:
+            if len(self._partitions) >= self._max_open_files:
+                _, least_recently_used = self._partitions.popitem(last=False)
+                least_recently_used.close()
+            partition = _Partition(self, self._get_partition_directory(key))
+            self._partitions[key] = partition
+        else:
+            self._partitions.move_to_end(key)
+        partition.add(transcript)
+
+    def close(self) -> None:
+        """
+        Writes all buffered rows and closes all files.
+        """
+        while self._partitions:
+            _, partition = self._partitions.popitem(last=False)
+            partition.close()
+
+    def _get_partition_directory(self, key: Tuple) -> str:
+        directory = self._directory
+        for column, value in zip(self._partition_by, key):
+            if isinstance(value, bool):
+                value = "true" if value else "false"
+            directory = os.path.join(
+                directory,
+                "{column}={value}".format(column=column, value=quote(value, safe="")),
+            )
+        return directory
+
+    def _open_writer(self, directory: str) -> Any:
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(
+            directory,
+            "{prefix}-{index}.{extension}".format(
+                prefix=self._file_prefix,
+                index=self._file_count,
+                extension=self._format.value,
+            ),
+        )
+        self._file_count += 1
+        self.paths.append(path)
+        if self._format == ExportFormat.PARQUET:
+            return self._pyarrow.parquet.ParquetWriter(path, self._schema)
+        return self._pyarrow.ipc.new_file(path, self._schema)
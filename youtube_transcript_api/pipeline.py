@@ -0,0 +1,386 @@
+"""
+A staged pipeline, which fetches, formats and writes the transcripts of many videos.
+
+Retrieving a transcript consists of several steps, which each use a different
+resource: listing the transcripts (network), downloading the transcript (network),
+parsing it (CPU), formatting it (CPU) and writing it (disk). A `TranscriptPipeline`
+runs each of these steps as a separate stage, with its own pool of worker threads and
+a bounded queue of videos waiting for it. So while one video is being parsed, the
+transcripts of the following videos are already being listed and downloaded, and the
+one before is being written to disk.
+
+As the queues are bounded, a slow stage holds back the stages in front of it
+(backpressure), instead of letting videos pile up in memory. The `StageMetrics` of
+each stage show where the videos are waiting, which helps to find the stage limiting
+the throughput and to tune the number of workers per stage.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from .formatters import Formatter, FormatterLoader
+from ._api import FetchResult, YouTubeTranscriptApi
+from ._transcripts import (
+    CaptionWireFormat,
+    FetchedTranscript,
+    Transcript,
+    TranscriptList,
+)
+
+
+@dataclass(frozen=True)
+class StageMetrics:
+    """
+    A snapshot of the metrics of a single stage of a `TranscriptPipeline`.
+    """
+
+    name: str
+    workers: int
+    queue_size: int
+    """
+    The number of videos which can wait for this stage, before the previous stage is
+    blocked.
+    """
+    queue_depth: int
+    """
+    The number of videos currently waiting for this stage.
+    """
+    max_queue_depth: int
+    processed: int
+    """
+    The number of videos this stage has completed successfully.
+    """
+    failed: int
+    busy_seconds: float
+    """
+    The time the workers of this stage have spent working, summed up over all
+    workers.
+    """
+    idle_seconds: float
+    """
+    The time the workers of this stage have spent waiting for videos from the previous
+    stage, summed up over all workers.
+    """
+    blocked_seconds: float
+    """
+    The time the previous stage has spent waiting for a free place in the queue of
+    this stage. If this is high, this stage is limiting the throughput (backpressure).
+    """
+
+
+class DirectoryWriter:
+    """
+    Writes every formatted transcript to the file `<video_id>.<extension>` in a
+    directory. This can be used as the `write` function of a `TranscriptPipeline`.
+    """
+
+    def __init__(self, directory: str, extension: str = "txt"):
+        """
+        :param directory: the directory the files are written to, which is created if
+            it doesn't exist
+        :param extension: the file extension, without a leading dot
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.extension = extension
+
+    def __call__(self, transcript: FetchedTranscript, formatted: str) -> None:
+        path = os.path.join(
+            self.directory,
+            "{video_id}.{extension}".format(
+                video_id=transcript.video_id, extension=self.extension
+            ),
+        )
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(formatted)
+
+
+# marks the end of a stage's input
+_END = object()
+
+
+class _Job:
+    __slots__ = ("index", "video_id", "value", "transcript")
+
+    def __init__(self, index: int, video_id: str):
+        self.index = index
+        self.video_id = video_id
+        # the output of the last stage, which is the input of the next one
+        self.value: Any = video_id
+        # the listed `Transcript`, until it has been parsed into a `FetchedTranscript`
+        self.transcript: Any = None
+
+
+class _Stage:
+    def __init__(
+        self, name: str, function: Callable[[_Job], Any], workers: int, queue_size: int
+    ):
+        self.name = name
+        self.function = function
+        self.workers = workers
+        self.queue: "Queue[Any]" = Queue(maxsize=queue_size)
+        self._lock = Lock()
+        self._running_workers = workers
+        self._max_queue_depth = 0
+        self._processed = 0
+        self._failed = 0
+        self._busy_seconds = 0.0
+        self._idle_seconds = 0.0
+        self._blocked_seconds = 0.0
+
+    def put(self, item: Any) -> None:
+        try:
+            self.queue.put_nowait(item)
+        except Full:
+            start = time.perf_counter()
+            self.queue.put(item)
+            with self._lock:
+                self._blocked_seconds += time.perf_counter() - start
+        with self._lock:
+            self._max_queue_depth = max(self._max_queue_depth, self.queue.qsize())
+
+    def get(self) -> Any:
+        try:
+            return self.queue.get_nowait()
+        except Empty:
+            start = time.perf_counter()
+            item = self.queue.get()
+            with self._lock:
+                self._idle_seconds += time.perf_counter() - start
+            return item
+
+    def process(self, job: _Job) -> bool:
+        start = time.perf_counter()
+        try:
+            job.value = self.function(job)
+            succeeded = True
+        except Exception as exception:
+            job.value = exception
+            succeeded = False
+        with self._lock:
+            self._busy_seconds += time.perf_counter() - start
+            if succeeded:
+                self._processed += 1
+            else:
+                self._failed += 1
+        return succeeded
+
+    def finish_worker(self) -> bool:
+        """
+        :return: whether the calling worker was the last one running
+        """
+        with self._lock:
+            self._running_workers -= 1
+            return self._running_workers == 0
+
+    def metrics(self) -> StageMetrics:
+        with self._lock:
+            return StageMetrics(
+                name=self.name,
+                workers=self.workers,
+                queue_size=self.queue.maxsize,
+                queue_depth=self.queue.qsize(),
+                max_queue_depth=self._max_queue_depth,
+                processed=self._processed,
+                failed=self._failed,
+                busy_seconds=self._busy_seconds,
+                idle_seconds=self._idle_seconds,
+                blocked_seconds=self._blocked_seconds,
+            )
+
+
+class TranscriptPipeline:
+    STAGES = ("list", "download", "parse", "format", "write")
+    DEFAULT_WORKERS = {"list": 8, "download": 8, "parse": 1, "format": 1, "write": 1}
+
+    def __init__(
+        self,
+        write: Callable[[FetchedTranscript, str], Any],
+        ytt_api: Optional[YouTubeTranscriptApi] = None,
+        languages: Iterable[str] = ("en",),
+        find_transcript: Optional[Callable[[TranscriptList], Transcript]] = None,
+        formatter: Union[str, Formatter] = "pretty",
+        preserve_formatting: bool = False,
+        wire_format: CaptionWireFormat = CaptionWireFormat.XML,
+        workers: Optional[Dict[str, int]] = None,
+        queue_size: int = 16,
+    ):
+        """
+        Fetches, formats and writes the transcripts of many videos, running each of
+        these steps in a separate stage, so that they overlap. The stages are:
+
+        - `list`: lists the transcripts of a video and picks the one to fetch
+        - `download`: downloads the picked transcript
+        - `parse`: parses the downloaded transcript
+        - `format`: formats the parsed transcript using the `formatter`
+        - `write`: passes the transcript and its formatted text to `write`
+
+        :param write: a function, which is called with every fetched transcript and its
+            formatted text, for example a `DirectoryWriter`
+        :param ytt_api: the `YouTubeTranscriptApi` the transcripts are listed and
+            downloaded with. Make sure that its `pool_maxsize` is at least the number
+            of workers of the `list` and `download` stages.
+        :param languages: the language codes in a descending priority, which are used to
+            pick the transcript to fetch, just like for `YouTubeTranscriptApi.fetch`
+        :param find_transcript: an optional function, which picks the transcript to
+            fetch from a `TranscriptList` instead of `languages`. This can for example
+            return a translation.
+        :param formatter: a `Formatter`, or the name of a formatter, as loaded by the
+            `FormatterLoader`
+        :param preserve_formatting: whether to keep select HTML text formatting
+        :param wire_format: the format in which the transcripts are downloaded from
+            YouTube
+        :param workers: the number of worker threads of each stage, by the name of the
+            stage. Stages which aren't included use their `DEFAULT_WORKERS`.
+        :param queue_size: the number of videos, which can wait for each stage
+        """
+        workers = {**self.DEFAULT_WORKERS, **(workers or {})}
+        if set(workers) != set(self.STAGES):
+            raise ValueError(
+                "unknown stages: {stages}".format(
+                    stages=", ".join(sorted(set(workers) - set(self.STAGES)))
+                )
+            )
+        if min(workers.values()) < 1 or queue_size < 1:
+            raise ValueError("workers and queue_size have to be at least 1")
+        if isinstance(formatter, str):
+            formatter = FormatterLoader().load(formatter)
+        if find_transcript is None:
+            languages = tuple(languages)
+
+            def find_transcript(transcript_list: TranscriptList) -> Transcript:
+                return transcript_list.find_transcript(languages)
+
+        self._write = write
+        self._ytt_api = YouTubeTranscriptApi() if ytt_api is None else ytt_api
+        self._find_transcript = find_transcript
+        self._formatter = formatter
+        self._preserve_formatting = preserve_formatting
+        self._wire_format = CaptionWireFormat(wire_format)
+        self._workers = workers
+        self._queue_size = queue_size
+        self._stages: List[_Stage] = []
+
+    def _list(self, job: _Job) -> Transcript:
+        return self._find_transcript(self._ytt_api.list(job.value))
+
+    def _download(self, job: _Job) -> bytes:
+        transcript = job.value
+        job.transcript = transcript
+        return transcript._request(self._wire_format).content
+
+    def _parse(self, job: _Job) -> FetchedTranscript:
+        transcript = job.transcript._parse(
+            job.value, self._wire_format, self._preserve_formatting, lazy=False
+        )
+        job.transcript = transcript
+        return transcript
+
+    def _format(self, job: _Job) -> str:
+        return self._formatter.format_transcript(job.value)
+
+    def _write_formatted(self, job: _Job) -> None:
+        self._write(job.transcript, job.value)
+
+    def metrics(self) -> List[StageMetrics]:
+        """
+        Returns the current metrics of all stages of the last run, in the order of the
+        stages. This can be called from any thread, while `run` is in progress.
+        """
+        return [stage.metrics() for stage in self._stages]
+
+    def run(self, video_ids: Iterable[str]) -> Iterator[FetchResult]:
+        """
+        Runs all videos through the pipeline and yields a `FetchResult` for each of
+        them, as soon as it has been written or has failed in any of the stages. A
+        video, which fails, doesn't stop the others. Instead, the exception is returned
+        as the `error` of its result.
+
+        `video_ids` is consumed lazily, as the `list` stage has room for more videos. If
+        you stop iterating early, no further videos are started and the videos waiting
+        in the queues of the stages are dropped, without being written. Only the steps,
+        which the workers are running at that moment, are completed, before the
+        iteration ends.
+        """
+        functions = (
+            self._list,
+            self._download,
+            self._parse,
+            self._format,
+            self._write_formatted,
+        )
+        stages = [
+            _Stage(name, function, self._workers[name], self._queue_size)
+            for name, function in zip(self.STAGES, functions)
+        ]
+        self._stages = stages
+        return self._run(stages, video_ids)
+
+    @staticmethod
+    def _run(stages: List[_Stage], video_ids: Iterable[str]) -> Iterator[FetchResult]:
+        # the results are collected in an unbounded queue, so the stages are never
+        # blocked by a slow consumer of the results
+        results: "Queue[Any]" = Queue()
+        stopped = Event()
+        feeder_errors: List[Exception] = []
+
+        def feed() -> None:
+            try:
+                for index, video_id in enumerate(video_ids):
+                    if stopped.is_set():
+                        break
+                    stages[0].put(_Job(index, video_id))
+            except Exception as exception:
+                feeder_errors.append(exception)
+            finally:
+                for _ in range(stages[0].workers):
+                    stages[0].put(_END)
+
+        def work(stage: _Stage, next_stage: Optional[_Stage]) -> None:
+            while True:
+                job = stage.get()
+                if job is _END:
+                    break
+                if stopped.is_set():
+                    # the pipeline is drained without doing any further work
+                    continue
+                if not stage.process(job):
+                    results.put(FetchResult(job.video_id, job.index, error=job.value))
+                elif next_stage is None:
+                    results.put(
+                        FetchResult(job.video_id, job.index, transcript=job.transcript)
+                    )
+                else:
+                    next_stage.put(job)
+            if stage.finish_worker():
+                if next_stage is None:
+                    results.put(_END)
+                else:
+                    for _ in range(next_stage.workers):
+                        next_stage.put(_END)
+
+        threads = [Thread(target=feed, daemon=True)]
+        for stage, next_stage in zip(stages, stages[1:] + [None]):
+            threads.extend(
+                Thread(target=work, args=(stage, next_stage), daemon=True)
+                for _ in range(stage.workers)
+            )
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                result = results.get()
+                if result is _END:
+                    break
+                yield result
+        finally:
+            stopped.set()
+            for thread in threads:
+                thread.join()
+        if feeder_errors:
+            raise feeder_errors[0]
@@ -0,0 +1,218 @@
+"""
+A compact, versioned binary format for storing `FetchedTranscript`s.
+
+A serialized transcript consists of a fixed size header, the metadata of the
+transcript, the start times and durations of all snippets as packed columns and the
+texts of all snippets as a single UTF-8 blob, indexed by an offset column. All numbers
+are stored in little-endian byte order and every column starts at a multiple of 8
+bytes, so that a memory-mapped file can be used as the storage of a transcript
+directly.
+
+Times can either be stored as 64-bit floats (seconds) or as 32-bit integers
+(milliseconds), which halves their size, but rounds them to milliseconds.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from enum import Enum
+from typing import Union
+
+from ._transcripts import CaptionWireFormat, FetchedTranscript, SnippetColumns
+
+
+class TimeFormat(str, Enum):
+    """
+    How the start times and durations of the snippets are stored.
+    """
+
+    SECONDS = "seconds"
+    """
+    64-bit floats in seconds. Transcripts loaded from memory-mapped files use the
+    stored times without copying them.
+    """
+    MILLISECONDS = "milliseconds"
+    """
+    32-bit integers in milliseconds. This takes up half of the space, but the times
+    are rounded to milliseconds and have to be converted when loading them.
+    """
+
+
+MAGIC = b"YTTBIN\x00\x00"
+VERSION = 1
+
+# magic, version, time format, is_generated, snippet count, text blob length and the
+# lengths of video_id, language, language_code and wire_format
+_HEADER = struct.Struct("<8sHBBIQHHHH")
+_TIME_FORMATS = (TimeFormat.SECONDS, TimeFormat.MILLISECONDS)
+_TIME_TYPE_CODES = {TimeFormat.SECONDS: "d", TimeFormat.MILLISECONDS: "i"}
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _pad(offset: int) -> int:
+    return offset + (-offset % 8)
+
+
+def dumps(
+    transcript: FetchedTranscript, time_format: TimeFormat = TimeFormat.SECONDS
+) -> bytes:
+    """
+    Serializes `transcript` into the binary format.
+
+    :param time_format: how the start times and durations are stored
+    """
+    time_format = TimeFormat(time_format)
+    time_type_code = _TIME_TYPE_CODES[time_format]
+    starts = array(time_type_code)
+    durations = array(time_type_code)
+    text_offsets = array("q", [0])
+    texts = []
+    text_length = 0
+    for text, start, duration in transcript.iter_tuples():
+        if time_format == TimeFormat.MILLISECONDS:
+            start = round(start * 1000)
+            duration = round(duration * 1000)
+        starts.append(start)
+        durations.append(duration)
+        encoded_text = text.encode("utf-8")
+        texts.append(encoded_text)
+        text_length += len(encoded_text)
+        text_offsets.append(text_length)
+
+    metadata = [
+        value.encode("utf-8")
+        for value in (
+            transcript.video_id,
+            transcript.language,
+            transcript.language_code,
+            CaptionWireFormat(transcript.wire_format).value,
+        )
+    ]
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        _TIME_FORMATS.index(time_format),
+        transcript.is_generated,
+        len(starts),
+        text_length,
+        *(len(value) for value in metadata),
+    )
+    chunks = [header, *metadata]
+    offset = sum(len(chunk) for chunk in chunks)
+    for column in (starts, durations, text_offsets):
+        chunks.append(b"\x00" * (_pad(offset) - offset))
+        if not _LITTLE_ENDIAN:
+            column.byteswap()
+        chunks.append(column.tobytes())
+        offset = _pad(offset) + len(chunks[-1])
+    chunks.extend(texts)
+    return b"".join(chunks)
+
+
+def dump(
+    transcript: FetchedTranscript,
+    path: str,
+    time_format: TimeFormat = TimeFormat.SECONDS,
+) -> None:
+    """
+    Serializes `transcript` into the binary format and writes it to the file at
+    `path`, which can then be loaded using `load`.
+
+    :param time_format: how the start times and durations are stored
+    """
+    with open(path, "wb") as file:
+        file.write(dumps(transcript, time_format=time_format))
+
+
+def loads(data: Union[bytes, bytearray, memoryview, mmap.mmap]) -> FetchedTranscript:
+    """
+    Loads a transcript from its binary representation. The snippets of the returned
+    transcript are stored in `SnippetColumns`, which use `data` without copying it, if
+    the times are stored in seconds.
+
+    :raises ValueError: if `data` isn't a transcript in a supported version of the
+        binary format
+    """
+    buffer = memoryview(data)
+    if len(buffer) < _HEADER.size:
+        raise ValueError("data is too short to contain a serialized transcript")
+    (
+        magic,
+        version,
+        time_format_index,
+        is_generated,
+        snippet_count,
+        text_length,
+        *metadata_lengths,
+    ) = _HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("data is not a serialized transcript")
+    if version != VERSION or time_format_index >= len(_TIME_FORMATS):
+        raise ValueError(
+            "unsupported version of the serialization format: {version}".format(
+                version=version
+            )
+        )
+    time_format = _TIME_FORMATS[time_format_index]
+
+    offset = _HEADER.size
+    metadata = []
+    for length in metadata_lengths:
+        metadata.append(str(buffer[offset : offset + length], "utf-8"))
+        offset += length
+    video_id, language, language_code, wire_format = metadata
+
+    time_type_code = _TIME_TYPE_CODES[time_format]
+    columns = []
+    for type_code, count in (
+        (time_type_code, snippet_count),
+        (time_type_code, snippet_count),
+        ("q", snippet_count + 1),
+    ):
+        offset = _pad(offset)
+        size = array(type_code).itemsize * count
+        columns.append(_read_column(buffer[offset : offset + size], type_code, count))
+        offset += size
+    starts, durations, text_offsets = columns
+    if time_format == TimeFormat.MILLISECONDS:
+        starts = array("d", (start / 1000 for start in starts))
+        durations = array("d", (duration / 1000 for duration in durations))
+    text_buffer = buffer[offset : offset + text_length]
+    if len(text_buffer) != text_length:
+        raise ValueError("data is truncated")
+
+    return FetchedTranscript(
+        snippets=SnippetColumns(starts, durations, text_buffer, text_offsets),
+        video_id=video_id,
+        language=language,
+        language_code=language_code,
+        is_generated=bool(is_generated),
+        wire_format=CaptionWireFormat(wire_format),
+    )
+
+
+def load(path: str) -> FetchedTranscript:
+    """
+    Loads a transcript from the file at `path`. The file is memory-mapped, so that the
+    snippets are only read from disk when they are accessed. The file is kept open
+    until the returned transcript isn't referenced anymore.
+
+    :raises ValueError: if the file isn't a transcript in a supported version of the
+        binary format
+    """
+    with open(path, "rb") as file:
+        mapped_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return loads(mapped_file)
+
+
+def _read_column(
+    buffer: memoryview, type_code: str, count: int
+) -> Union[memoryview, array]:
+    if len(buffer) != array(type_code).itemsize * count:
+        raise ValueError("data is truncated")
+    if _LITTLE_ENDIAN:
+        return buffer.cast(type_code)
+    column = array(type_code, buffer.tobytes())
+    column.byteswap()
+    return column
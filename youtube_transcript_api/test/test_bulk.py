@@ -0,0 +1,266 @@
+import multiprocessing
+import os
+import pickle
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+import httpretty
+
+from youtube_transcript_api import (
+    YouTubeTranscriptApi,
+    YouTubeTranscriptApiException,
+    FetchedTranscript,
+    FetchedTranscriptSnippet,
+    SnippetColumns,
+    VideoUnavailable,
+    CaptionWireFormat,
+)
+from youtube_transcript_api import bulk
+from youtube_transcript_api.bulk import ApiConfig, ProcessPoolFetcher
+from youtube_transcript_api.proxies import GenericProxyConfig
+from youtube_transcript_api.serialization import TimeFormat, loads
+
+from youtube_transcript_api.test.test_api import load_asset
+
+
+REF_TRANSCRIPT = FetchedTranscript(
+    snippets=[
+        FetchedTranscriptSnippet(
+            text="Hey, this is just a test",
+            start=0.0,
+            duration=1.54,
+        ),
+        FetchedTranscriptSnippet(
+            text="this is not the original transcript",
+            start=1.54,
+            duration=4.16,
+        ),
+        FetchedTranscriptSnippet(
+            text="just something shorter, I made up for testing",
+            start=5.7,
+            duration=3.239,
+        ),
+    ],
+    language="English",
+    language_code="en",
+    is_generated=False,
+    video_id="GJLlxj_dtq8",
+)
+
+
+def fetch(video_id, **kwargs):
+    if video_id.startswith("unavailable"):
+        raise VideoUnavailable(video_id)
+    if video_id == "crash":
+        os._exit(1)
+    return REF_TRANSCRIPT
+
+
+class UnpicklableError(Exception):
+    def __reduce__(self):
+        raise TypeError("can't pickle this")
+
+
+class TestApiConfig(TestCase):
+    def test_build(self):
+        ytt_api = ApiConfig(pool_maxsize=32).build()
+
+        self.assertIsInstance(ytt_api, YouTubeTranscriptApi)
+        self.assertIsNotNone(ytt_api._fetcher._api_key_cache)
+        self.assertIsNone(ytt_api._fetcher._proxy_config)
+        adapter = ytt_api._fetcher._http_client.get_adapter("https://www.youtube.com")
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+    def test_build__without_api_key_cache(self):
+        ytt_api = ApiConfig(api_key_cache_ttl=None).build()
+
+        self.assertIsNone(ytt_api._fetcher._api_key_cache)
+
+    def test_build__proxy_configs_are_distributed(self):
+        proxy_configs = (
+            GenericProxyConfig(http_url="http://proxy-0"),
+            GenericProxyConfig(http_url="http://proxy-1"),
+        )
+        config = ApiConfig(proxy_configs=proxy_configs)
+
+        self.assertEqual(
+            [config.build(number)._fetcher._proxy_config for number in range(5)],
+            [proxy_configs[number % 2] for number in range(5)],
+        )
+
+    def test_is_picklable(self):
+        config = ApiConfig(
+            proxy_configs=(GenericProxyConfig(http_url="http://proxy"),),
+            api_key_cache_ttl=60,
+        )
+
+        unpickled_config = pickle.loads(pickle.dumps(config))
+
+        self.assertEqual(unpickled_config.api_key_cache_ttl, 60)
+        self.assertEqual(
+            unpickled_config.build()._fetcher._http_client.proxies,
+            {"http": "http://proxy", "https": "http://proxy"},
+        )
+
+
+class TestWorker(TestCase):
+    def setUp(self):
+        httpretty.enable()
+        httpretty.register_uri(
+            httpretty.POST,
+            "https://www.youtube.com/youtubei/v1/player",
+            body=load_asset("youtube.innertube.json.static"),
+        )
+        httpretty.register_uri(
+            httpretty.GET,
+            "https://www.youtube.com/watch",
+            body=load_asset("youtube.html.static"),
+        )
+        httpretty.register_uri(
+            httpretty.GET,
+            "https://www.youtube.com/api/timedtext",
+            body=load_asset("transcript.xml.static"),
+        )
+
+    def tearDown(self):
+        httpretty.reset()
+        httpretty.disable()
+        bulk._worker_api = None
+
+    def test_init_worker(self):
+        proxy_configs = (
+            GenericProxyConfig(http_url="http://proxy-0"),
+            GenericProxyConfig(http_url="http://proxy-1"),
+        )
+        worker_counter = multiprocessing.Value("i", 0)
+
+        for number in range(3):
+            bulk._init_worker(ApiConfig(proxy_configs=proxy_configs), worker_counter)
+            self.assertIs(
+                bulk._worker_api._fetcher._proxy_config, proxy_configs[number % 2]
+            )
+        self.assertEqual(worker_counter.value, 3)
+
+    def test_fetch_chunk(self):
+        bulk._init_worker(ApiConfig(), multiprocessing.Value("i", 0))
+
+        results = bulk._fetch_chunk(
+            ["GJLlxj_dtq8", "GJLlxj_dtq8"],
+            languages=("de", "en"),
+            preserve_formatting=False,
+            wire_format=CaptionWireFormat.XML,
+            threads=2,
+            time_format=TimeFormat.SECONDS,
+        )
+
+        self.assertEqual(len(results), 2)
+        for data, error in results:
+            self.assertIsInstance(data, bytes)
+            self.assertIsNone(error)
+            transcript = loads(data)
+            self.assertEqual(list(transcript), REF_TRANSCRIPT.snippets)
+            self.assertEqual(transcript.video_id, "GJLlxj_dtq8")
+
+    def test_fetch_chunk__errors(self):
+        bulk._init_worker(ApiConfig(), multiprocessing.Value("i", 0))
+
+        with patch.object(YouTubeTranscriptApi, "fetch", side_effect=fetch):
+            results = bulk._fetch_chunk(
+                ["unavailable", "GJLlxj_dtq8"],
+                languages=("en",),
+                preserve_formatting=False,
+                wire_format=CaptionWireFormat.XML,
+                threads=1,
+                time_format=TimeFormat.MILLISECONDS,
+            )
+
+        (first_data, first_error), (second_data, second_error) = results
+        self.assertIsNone(first_data)
+        self.assertIsInstance(first_error, VideoUnavailable)
+        self.assertEqual(loads(second_data).snippets[1].start, 1.54)
+        self.assertIsNone(second_error)
+
+    def test_picklable(self):
+        error = VideoUnavailable("video_id")
+
+        self.assertIs(bulk._picklable(error), error)
+
+    def test_picklable__replaces_unpicklable_error(self):
+        error = bulk._picklable(UnpicklableError("something went wrong"))
+
+        self.assertIsInstance(error, YouTubeTranscriptApiException)
+        self.assertEqual(str(error), "UnpicklableError: something went wrong")
+
+
+@skipUnless(
+    "fork" in multiprocessing.get_all_start_methods(),
+    "the workers have to inherit the mocked HTTP layer",
+)
+class TestProcessPoolFetcher(TestCase):
+    def setUp(self):
+        self.mp_context = multiprocessing.get_context("fork")
+        # forked workers inherit the patched fetch
+        patcher = patch.object(YouTubeTranscriptApi, "fetch", side_effect=fetch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_fetch_many(self):
+        video_ids = ["v{}".format(number) for number in range(10)]
+        video_ids[4] = "unavailable-4"
+
+        with ProcessPoolFetcher(
+            max_workers=2, chunk_size=3, mp_context=self.mp_context
+        ) as fetcher:
+            results = sorted(
+                fetcher.fetch_many(iter(video_ids)), key=lambda result: result.index
+            )
+
+        self.assertEqual([result.video_id for result in results], video_ids)
+        self.assertEqual([result.index for result in results], list(range(10)))
+        for result in results:
+            if result.video_id == "unavailable-4":
+                self.assertFalse(result.is_successful)
+                self.assertIsInstance(result.error, VideoUnavailable)
+                self.assertEqual(result.error.video_id, "unavailable-4")
+            else:
+                self.assertTrue(result.is_successful)
+                self.assertIsInstance(result.transcript.snippets, SnippetColumns)
+                self.assertEqual(list(result.transcript), REF_TRANSCRIPT.snippets)
+
+    def test_fetch_many__ordered(self):
+        video_ids = ["v{}".format(number) for number in range(20)]
+
+        with ProcessPoolFetcher(
+            max_workers=3, chunk_size=2, mp_context=self.mp_context
+        ) as fetcher:
+            results = list(fetcher.fetch_many(video_ids, ordered=True))
+            # the workers are reused
+            results_of_second_call = list(fetcher.fetch_many(["v0"], ordered=True))
+
+        self.assertEqual([result.video_id for result in results], video_ids)
+        self.assertEqual([result.index for result in results], list(range(20)))
+        self.assertEqual(len(results_of_second_call), 1)
+
+    def test_fetch_many__worker_crashes(self):
+        with ProcessPoolFetcher(
+            max_workers=1, chunk_size=2, mp_context=self.mp_context
+        ) as fetcher:
+            results = list(fetcher.fetch_many(["v0", "crash"], ordered=True))
+
+        self.assertEqual([result.video_id for result in results], ["v0", "crash"])
+        for result in results:
+            self.assertFalse(result.is_successful)
+            self.assertIsNotNone(result.error)
+
+    def test_init__invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ProcessPoolFetcher(threads_per_worker=0)
+        with self.assertRaises(ValueError):
+            ProcessPoolFetcher(chunk_size=0)
+
+    def test_init__defaults_to_cpu_count(self):
+        with patch.object(os, "cpu_count", return_value=None):
+            fetcher = ProcessPoolFetcher()
+        fetcher.close()
+
+        self.assertEqual(fetcher._max_chunks_in_flight, 2)
@@ -0,0 +1,93 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from youtube_transcript_api import Chunk, FetchedTranscript, FetchedTranscriptSnippet
+from youtube_transcript_api import _chunks
+
+
+def build_transcript(texts):
+    return FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(text=text, start=index * 2.0, duration=2.5)
+            for index, text in enumerate(texts)
+        ],
+        video_id="12345",
+        language="English",
+        language_code="en",
+        is_generated=False,
+    )
+
+
+class TestChunks(TestCase):
+    def setUp(self):
+        self.transcript = build_transcript(
+            ["Hey,", "this is", "just a", "test for", "chunking", "", "a", "transcript"]
+        )
+
+    def test_chunks(self):
+        self.assertEqual(
+            list(self.transcript.chunks(max_size=16)),
+            [
+                Chunk(text="Hey, this is", start=0.0, end=4.5, snippets=range(0, 2)),
+                Chunk(text="just a test for", start=4.0, end=8.5, snippets=range(2, 4)),
+                Chunk(text="chunking a", start=8.0, end=14.5, snippets=range(4, 7)),
+                Chunk(text="transcript", start=14.0, end=16.5, snippets=range(7, 8)),
+            ],
+        )
+
+    def test_chunks__overlap(self):
+        self.assertEqual(
+            [
+                (chunk.text, chunk.snippets)
+                for chunk in self.transcript.chunks(max_size=20, overlap=8)
+            ],
+            [
+                ("Hey, this is just a", range(0, 3)),
+                ("just a test for", range(2, 4)),
+                ("test for chunking a", range(3, 7)),
+                ("a transcript", range(5, 8)),
+            ],
+        )
+
+    def test_chunks__snippet_exceeding_max_size(self):
+        self.assertEqual(
+            [chunk.text for chunk in self.transcript.chunks(max_size=5, overlap=4)],
+            ["Hey,", "this is", "just a", "test for", "chunking", "a", "transcript"],
+        )
+
+    def test_chunks__length_function(self):
+        self.assertEqual(
+            [
+                chunk.text
+                for chunk in self.transcript.chunks(
+                    max_size=3,
+                    length_function=lambda text: len(text.split()),
+                    separator="\n",
+                )
+            ],
+            ["Hey,\nthis is", "just a", "test for\nchunking", "a\ntranscript"],
+        )
+
+    def test_chunks__small_batches(self):
+        for max_size, overlap in ((16, 0), (20, 8), (5, 4), (30, 20)):
+            expected = list(self.transcript.chunks(max_size=max_size, overlap=overlap))
+
+            with patch.object(_chunks, "_BATCH_SIZE", 2):
+                chunks = list(
+                    self.transcript.chunks(max_size=max_size, overlap=overlap)
+                )
+
+            self.assertEqual(chunks, expected)
+
+    def test_chunks__empty(self):
+        self.assertEqual(list(build_transcript([]).chunks()), [])
+
+    def test_chunks__is_lazy(self):
+        chunks = self.transcript.to_columnar().chunks(max_size=16)
+
+        self.assertEqual(next(chunks).snippets, range(0, 2))
+
+    def test_chunks__invalid_overlap(self):
+        for overlap in (-1, 10):
+            with self.assertRaises(ValueError):
+                self.transcript.chunks(max_size=10, overlap=overlap)
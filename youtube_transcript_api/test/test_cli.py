@@ -1,8 +1,10 @@
 import pytest
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import json
+import os
+from tempfile import TemporaryDirectory
 
 from youtube_transcript_api import (
     YouTubeTranscriptApi,
@@ -54,8 +56,13 @@ class TestYouTubeTranscriptCli(TestCase):
             return_value=self.transcript_mock
         )
 
-        YouTubeTranscriptApi.__init__ = MagicMock(return_value=None)
-        YouTubeTranscriptApi.list = MagicMock(return_value=self.transcript_list_mock)
+        patcher = patch.multiple(
+            YouTubeTranscriptApi,
+            __init__=MagicMock(return_value=None),
+            list=MagicMock(return_value=self.transcript_list_mock),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_argument_parsing(self):
         parsed_args = YouTubeTranscriptCli(
@@ -233,6 +240,32 @@ class TestYouTubeTranscriptCli(TestCase):
         self.assertTrue(parsed_args.exclude_manually_created)
         self.assertTrue(parsed_args.exclude_generated)
 
+    def test_argument_parsing__max_in_flight(self):
+        parsed_args = YouTubeTranscriptCli("v1 v2".split())._parse_args()
+        self.assertEqual(parsed_args.max_in_flight, 1)
+
+        parsed_args = YouTubeTranscriptCli(
+            "v1 v2 --max-in-flight 4".split()
+        )._parse_args()
+        self.assertEqual(parsed_args.video_ids, ["v1", "v2"])
+        self.assertEqual(parsed_args.max_in_flight, 4)
+
+    def test_argument_parsing__max_in_flight_not_positive(self):
+        with self.assertRaises(SystemExit):
+            YouTubeTranscriptCli("v1 v2 --max-in-flight 0".split())._parse_args()
+
+    def test_argument_parsing__output_dir(self):
+        parsed_args = YouTubeTranscriptCli("v1 v2".split())._parse_args()
+        self.assertIsNone(parsed_args.output_dir)
+        self.assertFalse(parsed_args.print_metrics)
+
+        parsed_args = YouTubeTranscriptCli(
+            "v1 v2 --output-dir transcripts --print-metrics".split()
+        )._parse_args()
+        self.assertEqual(parsed_args.video_ids, ["v1", "v2"])
+        self.assertEqual(parsed_args.output_dir, "transcripts")
+        self.assertTrue(parsed_args.print_metrics)
+
     def test_run(self):
         YouTubeTranscriptCli("v1 v2 --languages de en".split()).run()
 
@@ -248,6 +281,89 @@ class TestYouTubeTranscriptCli(TestCase):
 
         self.assertEqual(output, str(VideoUnavailable("video_id")))
 
+    def test_run__max_in_flight(self):
+        def list_transcripts(video_id):
+            if video_id == "v2":
+                raise VideoUnavailable(video_id)
+            transcript_list = MagicMock()
+            transcript_list.__str__ = MagicMock(return_value=video_id)
+            return transcript_list
+
+        YouTubeTranscriptApi.list = MagicMock(side_effect=list_transcripts)
+
+        output = YouTubeTranscriptCli(
+            "--list-transcripts v1 v2 v3 v4 --max-in-flight 3".split()
+        ).run()
+
+        self.assertEqual(
+            output, "\n\n".join([str(VideoUnavailable("v2")), "v1", "v3", "v4"])
+        )
+
+    def test_run__output_dir(self):
+        self.transcript_mock._parse = MagicMock(
+            return_value=self.transcript_mock.fetch.return_value
+        )
+
+        with TemporaryDirectory() as directory:
+            output_dir = os.path.join(directory, "transcripts")
+            output = YouTubeTranscriptCli(
+                "v1 v2 --languages de en --format json --max-in-flight 2 "
+                "--output-dir {output_dir}".format(output_dir=output_dir).split()
+            ).run()
+
+            self.assertEqual(os.listdir(output_dir), ["GJLlxj_dtq8.json"])
+            with open(os.path.join(output_dir, "GJLlxj_dtq8.json")) as file:
+                json.loads(file.read())
+
+        self.assertEqual(
+            output,
+            "Wrote 2 transcript(s) to {output_dir}".format(output_dir=output_dir),
+        )
+        self.transcript_list_mock.find_transcript.assert_any_call(["de", "en"])
+        self.transcript_mock.fetch.assert_not_called()
+
+    def test_run__output_dir_with_failures_and_metrics(self):
+        self.transcript_mock._parse = MagicMock(
+            return_value=self.transcript_mock.fetch.return_value
+        )
+
+        def list_transcripts(video_id):
+            if video_id == "v2":
+                raise VideoUnavailable(video_id)
+            return self.transcript_list_mock
+
+        YouTubeTranscriptApi.list = MagicMock(side_effect=list_transcripts)
+
+        with TemporaryDirectory() as directory:
+            output = YouTubeTranscriptCli(
+                "v1 v2 --output-dir {directory} --print-metrics".format(
+                    directory=directory
+                ).split()
+            ).run()
+
+            self.assertEqual(os.listdir(directory), ["GJLlxj_dtq8.txt"])
+
+        error = str(VideoUnavailable("v2"))
+        self.assertTrue(output.startswith(error + "\n\n"))
+        summary, metrics = output[len(error) + 2 :].split("\n\n")
+        self.assertEqual(
+            summary, "Wrote 1 transcript(s) to {directory}".format(directory=directory)
+        )
+        metrics = metrics.splitlines()
+        self.assertEqual(
+            [line.split()[0] for line in metrics],
+            ["stage", "list", "download", "parse", "format", "write"],
+        )
+        self.assertEqual(metrics[1].split()[1:4], ["1", "1", "1"])
+
+    def test_run__output_dir_is_ignored_when_listing_transcripts(self):
+        output = YouTubeTranscriptCli(
+            "--list-transcripts v1 --output-dir transcripts".split()
+        ).run()
+
+        self.assertEqual(output, str(self.transcript_list_mock))
+        self.assertFalse(os.path.exists("transcripts"))
+
     def test_run__exclude_generated(self):
         YouTubeTranscriptCli(
             "v1 v2 --languages de en --exclude-generated".split()
@@ -0,0 +1,287 @@
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+from youtube_transcript_api import corpus
+from youtube_transcript_api.corpus import CorpusIndex, CorpusMatch, _Segment
+
+
+def build_transcript(video_id: str, texts, language_code: str = "en"):
+    return FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(text=text, start=index * 2.0, duration=2.0)
+            for index, text in enumerate(texts)
+        ],
+        video_id=video_id,
+        language="English",
+        language_code=language_code,
+        is_generated=False,
+    )
+
+
+class TestCorpusIndex(TestCase):
+    def setUp(self):
+        self.temporary_directory = TemporaryDirectory()
+        self.directory = self.temporary_directory.name
+        self.transcripts = [
+            build_transcript("video1", ["Hello World, this is", "a test", "the end"]),
+            build_transcript("video2", ["hello there", "WORLD peace"], "de"),
+            build_transcript("video3", ["no match here", "Hello"]),
+            build_transcript("video4", ["world wide", "ｆｕｌｌ-width Straße"]),
+            build_transcript("video5", []),
+        ]
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def _build_index(self, **kwargs) -> CorpusIndex:
+        index = CorpusIndex(self.directory, **kwargs)
+        for transcript in self.transcripts:
+            index.add(transcript)
+        return index
+
+    def test_search(self):
+        with self._build_index() as index:
+            index.flush()
+
+            self.assertEqual(
+                index.search("hello"),
+                [
+                    CorpusMatch(video_id="video1", language_code="en", start=0.0),
+                    CorpusMatch(video_id="video2", language_code="de", start=0.0),
+                    CorpusMatch(video_id="video3", language_code="en", start=2.0),
+                ],
+            )
+            self.assertEqual(
+                index.search("hello world"),
+                [CorpusMatch(video_id="video1", language_code="en", start=0.0)],
+            )
+            self.assertEqual(
+                index.search("this is a TEST"),
+                [CorpusMatch(video_id="video1", language_code="en", start=0.0)],
+            )
+            self.assertEqual(
+                index.search("full width strasse"),
+                [CorpusMatch(video_id="video4", language_code="en", start=2.0)],
+            )
+
+    def test_search__phrases_do_not_span_transcripts(self):
+        with self._build_index() as index:
+            index.flush()
+
+            self.assertEqual(index.search("end hello"), [])
+            self.assertEqual(index.search("hello world wide"), [])
+            self.assertEqual(index.search("unknown"), [])
+            self.assertEqual(index.search(""), [])
+
+    def test_search__only_flushed_transcripts(self):
+        with self._build_index() as index:
+            self.assertEqual(index.search("hello"), [])
+            self.assertEqual(index.segment_count, 0)
+
+    def test_kwic(self):
+        with self._build_index() as index:
+            index.flush()
+
+            self.assertEqual(
+                [match.context for match in index.kwic("world", context=2)],
+                [
+                    "Hello **World** this is",
+                    "hello there **WORLD** peace",
+                    "**world** wide full",
+                ],
+            )
+            self.assertEqual(
+                index.kwic("a test", context=1, highlight=("<b>", "</b>")),
+                [
+                    CorpusMatch(
+                        video_id="video1",
+                        language_code="en",
+                        start=2.0,
+                        context="is <b>a test</b> the",
+                    )
+                ],
+            )
+
+    def test_reopen(self):
+        with self._build_index():
+            pass
+
+        with CorpusIndex(self.directory) as index:
+            self.assertEqual(index.segment_count, 1)
+            self.assertEqual(len(index.search("hello")), 3)
+            index.add(build_transcript("video6", ["hello again"]))
+            index.flush()
+            self.assertEqual(index.segment_count, 2)
+            self.assertEqual(len(index.search("hello")), 4)
+
+        self.assertEqual(
+            sorted(os.listdir(self.directory)),
+            ["00000000.seg", "00000001.seg", "manifest.json"],
+        )
+
+    def test_reopen__removes_leftover_files(self):
+        with self._build_index():
+            pass
+        for name in ("00000005.seg", "00000006.seg.tmp", "manifest.json.tmp"):
+            with open(os.path.join(self.directory, name), "wb") as file:
+                file.write(b"garbage")
+
+        with CorpusIndex(self.directory) as index:
+            self.assertEqual(len(index.search("hello")), 3)
+
+        self.assertEqual(
+            sorted(os.listdir(self.directory)), ["00000000.seg", "manifest.json"]
+        )
+
+    def test_reopen__keeps_foreign_files(self):
+        with self._build_index():
+            pass
+        foreign_names = ("backup.seg", "notes.tmp", "0000000.seg", "00000000.seg.bak")
+        for name in foreign_names:
+            with open(os.path.join(self.directory, name), "wb") as file:
+                file.write(b"not part of the index")
+
+        with CorpusIndex(self.directory) as index:
+            self.assertEqual(len(index.search("hello")), 3)
+
+        self.assertEqual(
+            sorted(os.listdir(self.directory)),
+            sorted(("00000000.seg", "manifest.json") + foreign_names),
+        )
+
+    def test_background_merge(self):
+        with self._build_index(max_buffered_snippets=1, merge_factor=2) as index:
+            index.wait_for_merges()
+
+            self.assertEqual(index.segment_count, 1)
+            self.assertEqual(
+                sorted(match.video_id for match in index.search("hello")),
+                ["video1", "video2", "video3"],
+            )
+            self.assertEqual(len(index.kwic("world")), 3)
+
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+
+    def test_merge(self):
+        with self._build_index(max_buffered_snippets=1) as index:
+            self.assertEqual(index.segment_count, 4)
+
+            index.merge()
+
+            self.assertEqual(index.segment_count, 1)
+            self.assertEqual(len(index.search("hello")), 3)
+
+            index.merge()
+
+            self.assertEqual(index.segment_count, 1)
+
+    def test_merge__same_as_writing_all_documents(self):
+        documents = [
+            (
+                transcript.video_id,
+                transcript.language_code,
+                [(snippet.text, snippet.start) for snippet in transcript],
+            )
+            for transcript in self.transcripts
+        ]
+        paths = []
+        for number, segment_documents in enumerate(
+            (documents[:2], documents[2:3], documents[3:])
+        ):
+            paths.append(os.path.join(self.directory, "{}.seg".format(number)))
+            _Segment.write(paths[-1], segment_documents)
+        segments = [_Segment(path) for path in paths]
+        merged_path = os.path.join(self.directory, "merged.seg")
+        written_path = os.path.join(self.directory, "written.seg")
+
+        with patch("youtube_transcript_api.corpus._CHUNK_SIZE", 2):
+            _Segment.merge(merged_path, segments)
+        _Segment.write(written_path, documents)
+
+        for segment in segments:
+            segment.close()
+        with open(merged_path, "rb") as merged_file:
+            with open(written_path, "rb") as written_file:
+                self.assertEqual(merged_file.read(), written_file.read())
+
+    def test_merge__manifest_is_written_before_removing_segments(self):
+        def remove(path):
+            with open(
+                os.path.join(self.directory, "manifest.json"), encoding="utf-8"
+            ) as file:
+                self.assertNotIn(os.path.basename(path), json.load(file)["segments"])
+            # simulates a crash, before the merged segments have been removed
+            raise OSError("power loss")
+
+        index = self._build_index(max_buffered_snippets=1)
+        with patch.object(corpus.os, "remove", side_effect=remove) as patched_remove:
+            with self.assertRaises(OSError):
+                index.merge()
+        self.assertEqual(patched_remove.call_count, 1)
+        # flushes the empty transcript, which is still buffered, into a new segment
+        index.close()
+
+        with CorpusIndex(self.directory) as reopened_index:
+            self.assertEqual(reopened_index.segment_count, 2)
+            self.assertEqual(len(reopened_index.search("hello")), 3)
+        self.assertEqual(
+            sorted(os.listdir(self.directory)),
+            ["00000004.seg", "00000005.seg", "manifest.json"],
+        )
+
+    def test_writes_are_synced(self):
+        with patch.object(
+            corpus, "_sync_directory", wraps=corpus._sync_directory
+        ) as sync_directory:
+            with self._build_index() as index:
+                index.flush()
+
+        # once for the segment and once for the manifest
+        self.assertEqual(sync_directory.call_count, 2)
+        for call in sync_directory.call_args_list:
+            self.assertTrue(os.path.samefile(call.args[0], self.directory))
+
+    def test_sync_directory__not_on_windows(self):
+        with (
+            patch.object(corpus.os, "name", "nt"),
+            patch.object(corpus.os, "open") as open_directory,
+        ):
+            corpus._sync_directory(self.directory)
+
+        open_directory.assert_not_called()
+
+    def test_background_merge__error(self):
+        with patch.object(_Segment, "merge", side_effect=OSError("disk full")):
+            index = CorpusIndex(self.directory, max_buffered_snippets=1, merge_factor=2)
+            index.add(self.transcripts[0])
+            index.add(self.transcripts[1])
+
+            with self.assertRaises(OSError):
+                index.wait_for_merges()
+            index.wait_for_merges()
+            self.assertEqual(index.segment_count, 2)
+            index.close()
+
+    def test_invalid_merge_factor(self):
+        with self.assertRaises(ValueError):
+            CorpusIndex(self.directory, merge_factor=1)
+
+    def test_invalid_segment(self):
+        path = os.path.join(self.directory, "invalid.seg")
+        with open(path, "wb") as file:
+            file.write(b"\x00" * 256)
+
+        with self.assertRaises(ValueError):
+            _Segment(path)
+
+    def test_segment_with_different_byte_order(self):
+        path = os.path.join(self.directory, "segment.seg")
+        _Segment.write(path, [("video_id", "en", [("text", 1.0)])])
+
+        with patch.object(_Segment, "_BYTE_ORDER", b"X"):
+            with self.assertRaises(ValueError):
+                _Segment(path)
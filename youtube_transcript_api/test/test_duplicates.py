@@ -0,0 +1,198 @@
+import os
+import random
+import sqlite3
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+from youtube_transcript_api.duplicates import (
+    DuplicateIndex,
+    DuplicateMatch,
+    minhash_signature,
+)
+
+
+def build_transcript(words, video_id="12345"):
+    return FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(
+                text=" ".join(words[index : index + 8]), start=index * 0.5, duration=4.0
+            )
+            for index in range(0, len(words), 8)
+        ],
+        video_id=video_id,
+        language="English",
+        language_code="en",
+        is_generated=False,
+    )
+
+
+def random_words(generator, count=1000):
+    return ["word{index}".format(index=generator.randrange(5000)) for _ in range(count)]
+
+
+class TestMinhashSignature(TestCase):
+    def test_minhash_signature(self):
+        words = random_words(random.Random(0))
+        signature = minhash_signature(build_transcript(words))
+
+        self.assertEqual(len(signature), 128)
+        self.assertEqual(
+            minhash_signature(build_transcript([word.upper() + "," for word in words])),
+            signature,
+        )
+        self.assertNotEqual(
+            minhash_signature(build_transcript(random_words(random.Random(1)))),
+            signature,
+        )
+
+    def test_minhash_signature__estimates_similarity(self):
+        words = random_words(random.Random(0))
+        edited_words = list(words)
+        # changing every 50th word changes about 10% of the shingles
+        for index in range(0, len(words), 50):
+            edited_words[index] = "edited"
+
+        similarity = (
+            sum(
+                map(
+                    int.__eq__,
+                    minhash_signature(build_transcript(words), num_perm=256),
+                    minhash_signature(build_transcript(edited_words), num_perm=256),
+                )
+            )
+            / 256
+        )
+
+        self.assertAlmostEqual(similarity, 0.82, delta=0.08)
+
+    def test_minhash_signature__fewer_words_than_shingle_size(self):
+        signature = minhash_signature(build_transcript(["only", "three", "words"]))
+
+        # all bins but one are empty, so they take the value of the only filled one
+        self.assertEqual(len(set(signature)), 1)
+        self.assertEqual(
+            signature, minhash_signature(build_transcript(["Only", "three", "words!"]))
+        )
+
+    def test_minhash_signature__no_words(self):
+        self.assertIsNone(minhash_signature(build_transcript([])))
+        self.assertIsNone(minhash_signature(build_transcript(["...", "-"])))
+
+
+class TestDuplicateIndex(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "duplicates.db")
+        generator = random.Random(0)
+        self.words = random_words(generator)
+        self.transcripts = [build_transcript(self.words, "original")] + [
+            build_transcript(
+                random_words(generator), "other{index}".format(index=index)
+            )
+            for index in range(20)
+        ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def build_index(self, **kwargs):
+        index = DuplicateIndex(self.path, **kwargs)
+        for transcript in self.transcripts:
+            index.add(transcript)
+        return index
+
+    def test_query(self):
+        edited_words = list(self.words)
+        for index in range(0, len(edited_words), 100):
+            edited_words[index] = "edited"
+
+        with self.build_index() as index:
+            matches = index.query(build_transcript(edited_words, "copy"))
+
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0].video_id, "original")
+        self.assertEqual(matches[0].language_code, "en")
+        self.assertGreater(matches[0].similarity, 0.8)
+
+    def test_query__identical(self):
+        with self.build_index() as index:
+            self.assertEqual(
+                index.query(self.transcripts[3]),
+                [DuplicateMatch(video_id="other2", language_code="en", similarity=1.0)],
+            )
+
+    def test_query__no_duplicate(self):
+        with self.build_index() as index:
+            self.assertEqual(
+                index.query(build_transcript(random_words(random.Random(1)))), []
+            )
+
+    def test_query__threshold(self):
+        # the second half of the words differs, so only a third of the shingles of
+        # both transcripts are shared
+        words = self.words[:500] + random_words(random.Random(1), 500)
+
+        with self.build_index(bands=64) as index:
+            self.assertEqual(index.query(build_transcript(words)), [])
+            matches = index.query(build_transcript(words), threshold=0.2)
+
+        self.assertEqual([match.video_id for match in matches], ["original"])
+        self.assertAlmostEqual(matches[0].similarity, 0.33, delta=0.1)
+
+    def test_query__sorted_by_similarity(self):
+        self.transcripts.append(build_transcript(self.words[:900], "shortened"))
+
+        with self.build_index(threshold=0.5) as index:
+            matches = index.query(build_transcript(self.words))
+
+        self.assertEqual(
+            [match.video_id for match in matches], ["original", "shortened"]
+        )
+        self.assertEqual(matches[0].similarity, 1.0)
+        self.assertLess(matches[1].similarity, 1.0)
+
+    def test_no_words(self):
+        with self.build_index() as index:
+            index.add(build_transcript([]))
+
+            self.assertEqual(len(index), 21)
+            self.assertEqual(index.query(build_transcript([])), [])
+
+    def test_reopen(self):
+        self.build_index().close()
+
+        with DuplicateIndex(self.path) as index:
+            self.assertEqual(len(index), 21)
+            self.assertEqual(len(index.query(self.transcripts[0])), 1)
+            index.add(build_transcript(self.words, "copy"))
+
+            self.assertEqual(
+                [match.video_id for match in index.query(self.transcripts[0])],
+                ["original", "copy"],
+            )
+
+    def test_commit(self):
+        def count_committed():
+            connection = sqlite3.connect(self.path)
+            try:
+                return connection.execute("SELECT COUNT(*) FROM documents").fetchone()[
+                    0
+                ]
+            finally:
+                connection.close()
+
+        with self.build_index(max_uncommitted=8) as index:
+            self.assertEqual(count_committed(), 16)
+            index.commit()
+            self.assertEqual(count_committed(), 21)
+
+    def test_different_settings(self):
+        self.build_index().close()
+
+        with self.assertRaises(ValueError):
+            DuplicateIndex(self.path, shingle_size=3)
+
+    def test_invalid_bands(self):
+        with self.assertRaises(ValueError):
+            DuplicateIndex(self.path, bands=10)
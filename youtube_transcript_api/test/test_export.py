@@ -0,0 +1,218 @@
+import os
+import sys
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipUnless
+from unittest.mock import MagicMock, patch
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+from youtube_transcript_api.export import ArrowExporter, ExportFormat
+
+try:
+    import pyarrow
+    import pyarrow.dataset
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+
+def build_transcript(video_id, snippet_count, language_code="en", is_generated=False):
+    return FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(
+                text="snippet {index}".format(index=index),
+                start=index * 2.0,
+                duration=2.0,
+            )
+            for index in range(snippet_count)
+        ],
+        video_id=video_id,
+        language="Some language",
+        language_code=language_code,
+        is_generated=is_generated,
+    )
+
+
+class TestArrowExporter(TestCase):
+    def setUp(self):
+        self.temporary_directory = TemporaryDirectory()
+        self.directory = self.temporary_directory.name
+        self.transcripts = [
+            build_transcript("video1", 5),
+            build_transcript("video2", 2, "de", is_generated=True),
+            build_transcript("video3", 0),
+            build_transcript("video4", 2),
+        ]
+        self.pyarrow = MagicMock()
+        self.modules = {
+            "pyarrow": self.pyarrow,
+            "pyarrow.parquet": self.pyarrow.parquet,
+            "pyarrow.ipc": self.pyarrow.ipc,
+        }
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def _export(self, **kwargs) -> ArrowExporter:
+        with patch.dict(sys.modules, self.modules):
+            with ArrowExporter(self.directory, **kwargs) as exporter:
+                for transcript in self.transcripts:
+                    exporter.add(transcript)
+        return exporter
+
+    def test_export(self):
+        exporter = self._export(row_group_size=3)
+
+        self.assertEqual(
+            [os.path.relpath(path, self.directory) for path in exporter.paths],
+            [
+                os.path.join("language_code=en", os.path.basename(exporter.paths[0])),
+                os.path.join("language_code=de", os.path.basename(exporter.paths[1])),
+            ],
+        )
+        self.assertTrue(exporter.paths[0].endswith("-0.parquet"))
+        self.assertTrue(all(os.path.isdir(os.path.dirname(p)) for p in exporter.paths))
+        writer = self.pyarrow.parquet.ParquetWriter.return_value
+        # 7 snippets in row groups of 3, 3 and 1 rows (en) and 2 in a single one (de)
+        self.assertEqual(writer.write_batch.call_count, 4)
+        self.assertEqual(writer.close.call_count, 2)
+        self.assertEqual(
+            [call.args[1] for call in self.pyarrow.Array.from_buffers.call_args_list],
+            [3, 3, 3] * 2 + [2] * 3 + [1] * 3,
+        )
+        self.assertEqual(
+            [
+                call.args[0]
+                for call in self.pyarrow.array.call_args_list
+                if call.kwargs["type"] == self.pyarrow.string.return_value
+            ][:3],
+            [
+                ["snippet 0", "snippet 1", "snippet 2"],
+                ["video1"],
+                ["en"],
+            ],
+        )
+        self.assertEqual(
+            self.pyarrow.schema.call_args.args[0],
+            [
+                ("video_id", self.pyarrow.string.return_value),
+                ("is_generated", self.pyarrow.bool_.return_value),
+                ("start", self.pyarrow.float64.return_value),
+                ("duration", self.pyarrow.float64.return_value),
+                ("text", self.pyarrow.string.return_value),
+            ],
+        )
+
+    def test_export__arrow_format(self):
+        exporter = self._export(
+            format=ExportFormat.ARROW, partition_by=("is_generated", "video_id")
+        )
+
+        self.assertEqual(
+            [
+                os.path.dirname(os.path.relpath(p, self.directory))
+                for p in exporter.paths
+            ],
+            [
+                os.path.join("is_generated=false", "video_id=video1"),
+                os.path.join("is_generated=true", "video_id=video2"),
+                os.path.join("is_generated=false", "video_id=video4"),
+            ],
+        )
+        self.assertTrue(exporter.paths[0].endswith(".arrow"))
+        self.assertEqual(self.pyarrow.ipc.new_file.call_count, 3)
+        self.pyarrow.parquet.ParquetWriter.assert_not_called()
+
+    def test_export__not_partitioned(self):
+        exporter = self._export(partition_by=())
+
+        self.assertEqual(len(exporter.paths), 1)
+        self.assertEqual(os.path.dirname(exporter.paths[0]), self.directory)
+
+    def test_export__max_open_files(self):
+        self.transcripts.append(build_transcript("video5", 1, "de"))
+
+        exporter = self._export(max_open_files=1)
+
+        self.assertEqual(
+            [os.path.basename(os.path.dirname(path)) for path in exporter.paths],
+            [
+                "language_code=en",
+                "language_code=de",
+                "language_code=en",
+                "language_code=de",
+            ],
+        )
+        writer = self.pyarrow.parquet.ParquetWriter.return_value
+        self.assertEqual(writer.close.call_count, 4)
+
+    def test_export__escapes_partition_values(self):
+        self.transcripts = [build_transcript("a/b=c", 1)]
+
+        exporter = self._export(partition_by=("video_id",))
+
+        self.assertEqual(
+            os.path.basename(os.path.dirname(exporter.paths[0])), "video_id=a%2Fb%3Dc"
+        )
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ArrowExporter(self.directory, partition_by=("text",))
+        with self.assertRaises(ValueError):
+            ArrowExporter(self.directory, row_group_size=0)
+
+
+@skipUnless(pyarrow is not None, "pyarrow is not installed")
+class TestArrowExporterWithPyarrow(TestCase):  # pragma: no cover
+    def setUp(self):
+        self.temporary_directory = TemporaryDirectory()
+        self.directory = self.temporary_directory.name
+        self.transcripts = [
+            build_transcript("video1", 5),
+            build_transcript("video2", 2, "de", is_generated=True),
+            build_transcript("video3", 1).to_columnar(),
+        ]
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_round_trip(self):
+        for export_format in ExportFormat:
+            directory = os.path.join(self.directory, export_format.value)
+            with ArrowExporter(
+                directory, format=export_format, row_group_size=2
+            ) as exporter:
+                for transcript in self.transcripts:
+                    exporter.add(transcript)
+
+            table = pyarrow.dataset.dataset(
+                directory, format=export_format.value, partitioning="hive"
+            ).to_table()
+            rows = sorted(
+                table.to_pylist(), key=lambda row: (row["video_id"], row["start"])
+            )
+            self.assertEqual(
+                rows,
+                [
+                    {
+                        "video_id": transcript.video_id,
+                        "language_code": transcript.language_code,
+                        "is_generated": transcript.is_generated,
+                        "start": snippet.start,
+                        "duration": snippet.duration,
+                        "text": snippet.text,
+                    }
+                    for transcript in self.transcripts
+                    for snippet in transcript
+                ],
+            )
+
+    def test_row_groups(self):
+        with ArrowExporter(
+            self.directory, partition_by=(), row_group_size=2
+        ) as exporter:
+            for transcript in self.transcripts:
+                exporter.add(transcript)
+
+        metadata = pyarrow.parquet.ParquetFile(exporter.paths[0]).metadata
+        self.assertEqual(metadata.num_rows, 8)
+        self.assertEqual(metadata.num_row_groups, 4)
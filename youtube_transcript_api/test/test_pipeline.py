@@ -0,0 +1,321 @@
+import json
+import os
+import threading
+import time
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import httpretty
+
+from youtube_transcript_api import (
+    YouTubeTranscriptApi,
+    FetchedTranscript,
+    FetchedTranscriptSnippet,
+    NoTranscriptFound,
+    VideoUnavailable,
+)
+from youtube_transcript_api.formatters import JSONFormatter, TextFormatter
+from youtube_transcript_api.pipeline import (
+    DirectoryWriter,
+    StageMetrics,
+    TranscriptPipeline,
+)
+
+from youtube_transcript_api.test.test_api import load_asset
+
+
+class Collector:
+    def __init__(self):
+        self.written = []
+        self._lock = threading.Lock()
+
+    def __call__(self, transcript, formatted):
+        with self._lock:
+            self.written.append((transcript, formatted))
+
+
+class TestTranscriptPipeline(TestCase):
+    def setUp(self):
+        self.ref_transcript = FetchedTranscript(
+            snippets=[
+                FetchedTranscriptSnippet(
+                    text="Hey, this is just a test",
+                    start=0.0,
+                    duration=1.54,
+                ),
+                FetchedTranscriptSnippet(
+                    text="this is not the original transcript",
+                    start=1.54,
+                    duration=4.16,
+                ),
+                FetchedTranscriptSnippet(
+                    text="just something shorter, I made up for testing",
+                    start=5.7,
+                    duration=3.239,
+                ),
+            ],
+            language="English",
+            language_code="en",
+            is_generated=False,
+            video_id="GJLlxj_dtq8",
+        )
+        httpretty.enable()
+        httpretty.register_uri(
+            httpretty.POST,
+            "https://www.youtube.com/youtubei/v1/player",
+            body=load_asset("youtube.innertube.json.static"),
+        )
+        httpretty.register_uri(
+            httpretty.GET,
+            "https://www.youtube.com/watch",
+            body=load_asset("youtube.html.static"),
+        )
+        httpretty.register_uri(
+            httpretty.GET,
+            "https://www.youtube.com/api/timedtext",
+            body=load_asset("transcript.xml.static"),
+        )
+
+    def tearDown(self):
+        httpretty.reset()
+        httpretty.disable()
+
+    def test_run(self):
+        collector = Collector()
+        pipeline = TranscriptPipeline(collector, formatter="json", queue_size=2)
+
+        results = list(pipeline.run(["GJLlxj_dtq8"] * 10))
+
+        self.assertEqual(sorted(result.index for result in results), list(range(10)))
+        for result in results:
+            self.assertTrue(result.is_successful)
+            self.assertEqual(result.video_id, "GJLlxj_dtq8")
+            self.assertEqual(result.transcript, self.ref_transcript)
+        self.assertEqual(len(collector.written), 10)
+        for transcript, formatted in collector.written:
+            self.assertEqual(transcript, self.ref_transcript)
+            self.assertEqual(json.loads(formatted), self.ref_transcript.to_raw_data())
+
+    def test_run__metrics(self):
+        pipeline = TranscriptPipeline(
+            Collector(), workers={"list": 3, "write": 2}, queue_size=4
+        )
+        self.assertEqual(pipeline.metrics(), [])
+
+        list(pipeline.run(["GJLlxj_dtq8"] * 10))
+
+        metrics = pipeline.metrics()
+        self.assertEqual(
+            [stage.name for stage in metrics], list(TranscriptPipeline.STAGES)
+        )
+        self.assertEqual([stage.workers for stage in metrics], [3, 8, 1, 1, 2])
+        for stage in metrics:
+            self.assertIsInstance(stage, StageMetrics)
+            self.assertEqual(stage.processed, 10)
+            self.assertEqual(stage.failed, 0)
+            self.assertEqual(stage.queue_size, 4)
+            self.assertEqual(stage.queue_depth, 0)
+            self.assertGreater(stage.max_queue_depth, 0)
+            self.assertLessEqual(stage.max_queue_depth, 4)
+            self.assertGreater(stage.busy_seconds, 0)
+
+    def test_run__failures(self):
+        collector = Collector()
+        pipeline = TranscriptPipeline(collector, languages=["xx"])
+
+        results = list(pipeline.run(["GJLlxj_dtq8"] * 3))
+
+        self.assertEqual(collector.written, [])
+        for result in results:
+            self.assertFalse(result.is_successful)
+            self.assertIsInstance(result.error, NoTranscriptFound)
+        metrics = pipeline.metrics()
+        self.assertEqual(metrics[0].failed, 3)
+        self.assertEqual(sum(stage.processed for stage in metrics), 0)
+
+    def test_run__failures_in_later_stages(self):
+        error = ValueError("disk full")
+
+        def write(transcript, formatted):
+            raise error
+
+        httpretty.register_uri(
+            httpretty.GET,
+            "https://www.youtube.com/api/timedtext",
+            body="<invalid",
+        )
+        results = list(TranscriptPipeline(write).run(["GJLlxj_dtq8"]))
+        self.assertFalse(results[0].is_successful)
+
+        httpretty.register_uri(
+            httpretty.GET,
+            "https://www.youtube.com/api/timedtext",
+            body=load_asset("transcript.xml.static"),
+        )
+        pipeline = TranscriptPipeline(write)
+        results = list(pipeline.run(["GJLlxj_dtq8"]))
+
+        self.assertIs(results[0].error, error)
+        self.assertEqual(
+            [(stage.processed, stage.failed) for stage in pipeline.metrics()],
+            [(1, 0), (1, 0), (1, 0), (1, 0), (0, 1)],
+        )
+
+    def test_run__errors_do_not_stop_other_videos(self):
+        def list_transcripts(ytt_api, video_id):
+            if video_id == "unavailable":
+                raise VideoUnavailable(video_id)
+            return original_list(ytt_api, video_id)
+
+        original_list = YouTubeTranscriptApi.list
+        collector = Collector()
+        with patch.object(YouTubeTranscriptApi, "list", list_transcripts):
+            results = list(
+                TranscriptPipeline(collector).run(
+                    ["GJLlxj_dtq8", "unavailable", "GJLlxj_dtq8"]
+                )
+            )
+
+        errors = {result.index: result.error for result in results}
+        self.assertEqual(sorted(errors), [0, 1, 2])
+        self.assertIsInstance(errors[1], VideoUnavailable)
+        self.assertIsNone(errors[0])
+        self.assertIsNone(errors[2])
+        self.assertEqual(len(collector.written), 2)
+
+    def test_run__formatter_and_find_transcript(self):
+        collector = Collector()
+        pipeline = TranscriptPipeline(
+            collector,
+            ytt_api=YouTubeTranscriptApi(),
+            find_transcript=lambda transcript_list: transcript_list.find_transcript(
+                ["en"]
+            ).translate("de"),
+            formatter=TextFormatter(),
+            preserve_formatting=True,
+        )
+
+        list(pipeline.run(["GJLlxj_dtq8"]))
+
+        self.assertEqual(
+            httpretty.last_request().querystring["tlang"],
+            ["de"],
+        )
+        transcript, formatted = collector.written[0]
+        self.assertEqual(transcript.language_code, "de")
+        self.assertEqual(formatted, TextFormatter().format_transcript(transcript))
+
+    def test_run__backpressure(self):
+        release = threading.Event()
+        collector = Collector()
+
+        def write(transcript, formatted):
+            self.assertTrue(release.wait(timeout=5))
+            collector(transcript, formatted)
+
+        pipeline = TranscriptPipeline(write, queue_size=1)
+        consumed = []
+
+        def video_ids():
+            for number in range(100):
+                consumed.append(number)
+                yield "GJLlxj_dtq8"
+
+        results = pipeline.run(video_ids())
+
+        def release_when_stalled():
+            # the write stage is stalled, once the videos pile up in front of it
+            while not all(stage.queue_depth == 1 for stage in pipeline.metrics()[-2:]):
+                time.sleep(0.01)
+            time.sleep(0.1)
+            release.set()
+
+        threading.Thread(target=release_when_stalled).start()
+        self.assertTrue(next(results).is_successful)
+
+        # while the write stage was blocked, only a couple of videos fit into the
+        # queues of the stages
+        self.assertLess(len(consumed), 40)
+        self.assertEqual(len(list(results)), 99)
+        metrics = pipeline.metrics()
+        self.assertGreater(metrics[-1].blocked_seconds, 0)
+        for stage in metrics:
+            self.assertEqual(stage.max_queue_depth, 1)
+
+    def test_run__closing_drops_queued_videos(self):
+        consumed = []
+        second_write_started = threading.Event()
+        release = threading.Event()
+        collector = Collector()
+
+        def write(transcript, formatted):
+            if collector.written:
+                second_write_started.set()
+                self.assertTrue(release.wait(timeout=5))
+            collector(transcript, formatted)
+
+        def video_ids():
+            for number in range(1000):
+                consumed.append(number)
+                yield "GJLlxj_dtq8"
+
+        pipeline = TranscriptPipeline(write, queue_size=1)
+        results = pipeline.run(video_ids())
+        self.assertTrue(next(results).is_successful)
+        self.assertTrue(second_write_started.wait(timeout=5))
+        # wait until there are videos queued behind the blocked write
+        while pipeline.metrics()[0].processed <= 2:
+            time.sleep(0.01)
+        threading.Timer(0.1, release.set).start()
+        results.close()
+
+        # the running write is completed, but the queued videos are dropped
+        self.assertEqual(len(collector.written), 2)
+        metrics = pipeline.metrics()
+        self.assertEqual(metrics[-1].processed, 2)
+        self.assertGreater(metrics[0].processed, 2)
+        self.assertLess(len(consumed), 1000)
+
+    def test_run__error_in_video_ids(self):
+        error = RuntimeError("database is gone")
+
+        def video_ids():
+            yield "GJLlxj_dtq8"
+            raise error
+
+        results = TranscriptPipeline(Collector()).run(video_ids())
+
+        self.assertTrue(next(results).is_successful)
+        with self.assertRaises(RuntimeError) as context:
+            next(results)
+        self.assertIs(context.exception, error)
+
+    def test_init__invalid_workers(self):
+        with self.assertRaises(ValueError):
+            TranscriptPipeline(Collector(), workers={"transcode": 2})
+        with self.assertRaises(ValueError):
+            TranscriptPipeline(Collector(), workers={"parse": 0})
+        with self.assertRaises(ValueError):
+            TranscriptPipeline(Collector(), queue_size=0)
+
+
+class TestDirectoryWriter(TestCase):
+    def test_write(self):
+        transcript = FetchedTranscript(
+            snippets=[FetchedTranscriptSnippet(text="ä test", start=0.0, duration=1.0)],
+            language="English",
+            language_code="en",
+            is_generated=False,
+            video_id="video_id",
+        )
+
+        with TemporaryDirectory() as directory:
+            output_dir = os.path.join(directory, "nested", "transcripts")
+            writer = DirectoryWriter(output_dir, extension="json")
+            writer(transcript, JSONFormatter().format_transcript(transcript))
+
+            with open(
+                os.path.join(output_dir, "video_id.json"), encoding="utf-8"
+            ) as file:
+                self.assertEqual(json.load(file), transcript.to_raw_data())
@@ -0,0 +1,106 @@
+import json
+import pickle
+from dataclasses import asdict
+from unittest import TestCase
+
+from youtube_transcript_api import (
+    FetchedTranscript,
+    FetchedTranscriptSnippet,
+    SearchMatch,
+)
+
+
+class TestFetchedTranscriptSearch(TestCase):
+    def setUp(self):
+        self.snippets = [
+            FetchedTranscriptSnippet(
+                text="Hello World, this is", start=0.0, duration=1.5
+            ),
+            FetchedTranscriptSnippet(
+                text="a test. HELLO world", start=1.5, duration=2.0
+            ),
+            FetchedTranscriptSnippet(
+                text="[Music] ｆｕｌｌ-width Straße", start=3.5, duration=1.0
+            ),
+        ]
+        self.transcript = FetchedTranscript(
+            snippets=self.snippets,
+            video_id="12345",
+            language="English",
+            language_code="en",
+            is_generated=True,
+        )
+
+    def test_search(self):
+        self.assertEqual(
+            self.transcript.search("hello WORLD"),
+            [
+                SearchMatch(start=0.0, snippets=(self.snippets[0],)),
+                SearchMatch(start=1.5, snippets=(self.snippets[1],)),
+            ],
+        )
+
+    def test_search__phrase_across_snippets(self):
+        self.assertEqual(
+            self.transcript.search("this is a test"),
+            [SearchMatch(start=0.0, snippets=tuple(self.snippets[:2]))],
+        )
+
+    def test_search__normalizes_words(self):
+        for query in ("full width STRASSE", "Full-Width straße"):
+            self.assertEqual(
+                self.transcript.search(query),
+                [SearchMatch(start=3.5, snippets=(self.snippets[2],))],
+                query,
+            )
+
+    def test_search__no_match(self):
+        self.assertEqual(self.transcript.search("world test"), [])
+        self.assertEqual(self.transcript.search("unknown"), [])
+        self.assertEqual(self.transcript.search(""), [])
+        self.assertEqual(self.transcript.search("..."), [])
+
+    def test_search__context(self):
+        self.assertEqual(
+            [
+                match.context
+                for match in self.transcript.search("hello world", context=2)
+            ],
+            ["**Hello World** this is", "a test **HELLO world** Music full"],
+        )
+        self.assertEqual(
+            self.transcript.search("test", context=0, highlight=("<b>", "</b>"))[
+                0
+            ].context,
+            "<b>test</b>",
+        )
+
+    def test_search__index_is_reused(self):
+        self.transcript.search("hello")
+        index = self.transcript._search_index
+
+        self.transcript.search("world")
+
+        self.assertIs(self.transcript._search_index, index)
+
+    def test_search__index_is_not_a_field(self):
+        self.transcript.at(1.0)
+        self.transcript.search("hello")
+
+        self.assertEqual(
+            list(asdict(self.transcript)),
+            [
+                "snippets",
+                "video_id",
+                "language",
+                "language_code",
+                "is_generated",
+                "wire_format",
+            ],
+        )
+        json.dumps(asdict(self.transcript))
+        unpickled_transcript = pickle.loads(pickle.dumps(self.transcript))
+        self.assertNotIn("_search_index", vars(unpickled_transcript))
+        self.assertEqual(
+            unpickled_transcript.search("hello"), self.transcript.search("hello")
+        )
@@ -0,0 +1,127 @@
+from unittest import TestCase
+
+from youtube_transcript_api import (
+    FetchedTranscript,
+    FetchedTranscriptSnippet,
+    Sentence,
+)
+
+
+def build_transcript(snippets):
+    return FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(text=text, start=start, duration=duration)
+            for text, start, duration in snippets
+        ],
+        video_id="12345",
+        language="English (auto-generated)",
+        language_code="en",
+        is_generated=True,
+    )
+
+
+class TestSentences(TestCase):
+    def assertSentences(self, sentences, expected):
+        self.assertTrue(all(isinstance(sentence, Sentence) for sentence in sentences))
+        self.assertEqual(
+            [
+                (sentence.text, round(sentence.start, 6), round(sentence.end, 6))
+                for sentence in sentences
+            ],
+            expected,
+        )
+
+    def test_sentences__punctuation(self):
+        transcript = build_transcript(
+            [
+                ("Hello there. How", 0.0, 1.6),
+                ("are you?! I'm", 1.6, 1.3),
+                ('"fine."', 2.9, 0.7),
+            ]
+        )
+
+        self.assertSentences(
+            list(transcript.sentences()),
+            [
+                ("Hello there.", 0.0, 1.2),
+                ("How are you?!", 1.3, 2.5),
+                ('I\'m "fine."', 2.6, 3.6),
+            ],
+        )
+
+    def test_sentences__pauses(self):
+        transcript = build_transcript(
+            [
+                ("so today we", 0.0, 1.1),
+                ("talk about", 1.5, 1.0),
+                ("sentences", 4.0, 1.0),
+                ("", 5.0, 1.0),
+            ]
+        )
+
+        self.assertSentences(
+            list(transcript.sentences()),
+            [
+                ("so today we talk about", 0.0, 2.5),
+                ("sentences", 4.0, 5.0),
+            ],
+        )
+        self.assertEqual(
+            [sentence.text for sentence in transcript.sentences(max_pause=0.3)],
+            ["so today we", "talk about", "sentences"],
+        )
+
+    def test_sentences__overlaps(self):
+        transcript = build_transcript(
+            [
+                ("we are going", 0.0, 3.0),
+                ("are going to go", 1.2, 3.0),
+                ("go home", 2.4, 3.0),
+            ]
+        )
+
+        self.assertSentences(
+            list(transcript.sentences()),
+            [("we are going to go go home", 0.0, 5.4)],
+        )
+        self.assertSentences(
+            list(transcript.sentences(max_duration=4.0)),
+            [
+                ("we are going to go", 0.0, 2.4),
+                ("go home", 2.4, 5.4),
+            ],
+        )
+
+    def test_sentences__overlaps__single_repeated_word(self):
+        transcript = build_transcript(
+            [
+                ("that", 0.0, 2.0),
+                ("that works", 1.0, 2.0),
+                ("works well.", 2.0, 2.0),
+                (" ", 3.0, 2.0),
+            ]
+        )
+
+        self.assertSentences(
+            list(transcript.sentences()), [("that that works works well.", 0.0, 3.0)]
+        )
+        transcript = build_transcript(
+            [("we are here", 0.0, 2.0), ("are you", 1.0, 1.0)]
+        )
+        self.assertEqual(
+            [sentence.text for sentence in transcript.sentences()],
+            ["we are here are you"],
+        )
+
+    def test_sentences__empty(self):
+        self.assertEqual(list(build_transcript([]).sentences()), [])
+
+    def test_sentences__columnar(self):
+        transcript = build_transcript(
+            [("First one.", 0.0, 1.0), ("Second one.", 1.0, 1.0)]
+        ).to_columnar()
+
+        self.assertEqual(
+            [sentence.text for sentence in transcript.sentences()],
+            ["First one.", "Second one."],
+        )
@@ -0,0 +1,127 @@
+import mmap
+import os
+import pickle
+from dataclasses import replace
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from youtube_transcript_api import (
+    CaptionWireFormat,
+    FetchedTranscript,
+    FetchedTranscriptSnippet,
+    SnippetColumns,
+)
+from youtube_transcript_api import serialization
+from youtube_transcript_api.serialization import TimeFormat
+
+
+class TestSerialization(TestCase):
+    def setUp(self):
+        self.transcript = FetchedTranscript(
+            snippets=[
+                FetchedTranscriptSnippet(text="Hey, this is", start=0.0, duration=1.54),
+                FetchedTranscriptSnippet(text="just a test", start=1.54, duration=4.16),
+                FetchedTranscriptSnippet(text="", start=5.7, duration=0.0),
+                FetchedTranscriptSnippet(
+                    text="ünïcödé ✓ 😀", start=5.7, duration=3.239
+                ),
+            ],
+            video_id="GJLlxj_dtq8",
+            language="Deutsch (automatisch erzeugt)",
+            language_code="de",
+            is_generated=True,
+            wire_format=CaptionWireFormat.SRV3,
+        )
+        self.temporary_directory = TemporaryDirectory()
+        self.path = os.path.join(self.temporary_directory.name, "transcript.bin")
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_round_trip(self):
+        loaded = serialization.loads(serialization.dumps(self.transcript))
+
+        self.assertEqual(loaded, self.transcript)
+        self.assertIsInstance(loaded.snippets, SnippetColumns)
+        self.assertEqual(loaded.wire_format, CaptionWireFormat.SRV3)
+
+    def test_round_trip__columnar(self):
+        transcript = self.transcript.to_columnar()
+
+        self.assertEqual(
+            serialization.dumps(transcript), serialization.dumps(self.transcript)
+        )
+        self.assertEqual(
+            serialization.loads(
+                serialization.dumps(replace(transcript, snippets=transcript[1:3]))
+            ).snippets,
+            self.transcript.snippets[1:3],
+        )
+
+    def test_round_trip__milliseconds(self):
+        self.transcript.snippets[3] = FetchedTranscriptSnippet(
+            text="rounded", start=5.7004, duration=3.2396
+        )
+        data = serialization.dumps(self.transcript, time_format=TimeFormat.MILLISECONDS)
+
+        loaded = serialization.loads(data)
+
+        self.assertLess(len(data), len(serialization.dumps(self.transcript)))
+        self.assertEqual(loaded.snippets[:3], self.transcript.snippets[:3])
+        self.assertEqual(
+            loaded.snippets[3],
+            FetchedTranscriptSnippet(text="rounded", start=5.7, duration=3.24),
+        )
+
+    def test_round_trip__empty(self):
+        self.transcript.snippets = []
+
+        loaded = serialization.loads(serialization.dumps(self.transcript))
+
+        self.assertEqual(loaded, self.transcript)
+        self.assertEqual(len(loaded), 0)
+
+    def test_dump_and_load(self):
+        serialization.dump(self.transcript, self.path)
+
+        loaded = serialization.load(self.path)
+
+        self.assertEqual(loaded, self.transcript)
+        self.assertIsInstance(loaded.snippets.starts.obj, mmap.mmap)
+        self.assertIsInstance(loaded.snippets.durations.obj, mmap.mmap)
+
+    def test_load__pickle(self):
+        serialization.dump(self.transcript, self.path)
+        loaded = serialization.load(self.path)
+
+        unpickled = pickle.loads(pickle.dumps(loaded))
+
+        self.assertEqual(unpickled, self.transcript)
+        self.assertEqual(
+            pickle.loads(pickle.dumps(loaded.snippets[1:3])),
+            self.transcript.snippets[1:3],
+        )
+
+    def test_big_endian_host(self):
+        with patch.object(serialization, "_LITTLE_ENDIAN", False):
+            data = serialization.dumps(self.transcript)
+            loaded = serialization.loads(data)
+
+        self.assertEqual(loaded, self.transcript)
+        # on this host, the columns are swapped when writing and swapped back when
+        # reading them
+        self.assertNotEqual(data, serialization.dumps(self.transcript))
+
+    def test_loads__invalid_data(self):
+        data = serialization.dumps(self.transcript)
+        for invalid_data in (
+            b"",
+            b"\x00" * 100,
+            data[:8] + b"\x02\x00" + data[10:],
+            data[:10] + b"\x07" + data[11:],
+            data[:-1],
+            data[:100],
+        ):
+            with self.assertRaises(ValueError):
+                serialization.loads(invalid_data)
@@ -0,0 +1,153 @@
+import pickle
+from unittest import TestCase
+
+from youtube_transcript_api import (
+    FetchedTranscript,
+    FetchedTranscriptSnippet,
+    SnippetColumns,
+)
+
+
+def build_transcript(snippets):
+    return FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(text=text, start=start, duration=duration)
+            for text, start, duration in snippets
+        ],
+        video_id="12345",
+        language="English",
+        language_code="en",
+        is_generated=True,
+    )
+
+
+class TestTransforms(TestCase):
+    def setUp(self):
+        self.transcript = build_transcript(
+            [
+                ("Hey,", 0.0, 1.0),
+                ("", 1.0, 0.5),
+                ("this is", 2.0, 1.0),
+                ("just a test", 2.5, 2.0),
+                ("übrigens", 10.0, 1.0),
+            ]
+        )
+
+    def assertSnippets(self, transcript, expected):
+        self.assertIsInstance(transcript.snippets, SnippetColumns)
+        self.assertEqual(transcript, build_transcript(expected))
+
+    def test_shift(self):
+        self.assertSnippets(
+            self.transcript.shift(1),
+            [
+                ("Hey,", 1.0, 1.0),
+                ("", 2.0, 0.5),
+                ("this is", 3.0, 1.0),
+                ("just a test", 3.5, 2.0),
+                ("übrigens", 11.0, 1.0),
+            ],
+        )
+
+    def test_shift__shares_texts_and_durations(self):
+        transcript = self.transcript.to_columnar()
+
+        shifted = transcript.shift(-2.0)
+
+        self.assertIs(shifted.snippets._text_buffer, transcript.snippets._text_buffer)
+        self.assertEqual(shifted.snippets.durations, transcript.snippets.durations)
+        self.assertEqual(shifted[2].start, 0.0)
+
+    def test_shift__view(self):
+        transcript = self.transcript.to_columnar()
+        view = FetchedTranscript(
+            snippets=transcript.snippets[2:4],
+            video_id="12345",
+            language="English",
+            language_code="en",
+            is_generated=True,
+        )
+
+        shifted = view.shift(-2.0)
+
+        self.assertSnippets(shifted, [("this is", 0.0, 1.0), ("just a test", 0.5, 2.0)])
+        self.assertEqual(pickle.loads(pickle.dumps(shifted)), shifted)
+
+    def test_scale(self):
+        self.assertSnippets(
+            self.transcript.scale(0.5),
+            [
+                ("Hey,", 0.0, 0.5),
+                ("", 0.5, 0.25),
+                ("this is", 1.0, 0.5),
+                ("just a test", 1.25, 1.0),
+                ("übrigens", 5.0, 0.5),
+            ],
+        )
+
+    def test_scale__invalid_factor(self):
+        with self.assertRaises(ValueError):
+            self.transcript.scale(0)
+
+    def test_clip(self):
+        self.assertSnippets(
+            self.transcript.clip(1.25, 3.0),
+            [
+                ("", 1.25, 0.25),
+                ("this is", 2.0, 1.0),
+                ("just a test", 2.5, 0.5),
+            ],
+        )
+        self.assertSnippets(self.transcript.clip(5.0, 10.0), [])
+
+    def test_merge(self):
+        self.assertSnippets(
+            self.transcript.merge(),
+            [
+                ("Hey,", 0.0, 1.5),
+                ("this is just a test", 2.0, 2.5),
+                ("übrigens", 10.0, 1.0),
+            ],
+        )
+
+    def test_merge__max_gap_and_max_duration(self):
+        self.assertSnippets(
+            self.transcript.merge(max_gap=0.5, max_duration=3.0, separator="|"),
+            [
+                ("Hey,|this is", 0.0, 3.0),
+                ("just a test", 2.5, 2.0),
+                ("übrigens", 10.0, 1.0),
+            ],
+        )
+        self.assertSnippets(
+            self.transcript.merge(max_gap=100),
+            [("Hey, this is just a test übrigens", 0.0, 11.0)],
+        )
+
+    def test_merge__empty(self):
+        self.assertSnippets(build_transcript([]).merge(), [])
+
+    def test_bucket(self):
+        self.assertSnippets(
+            self.transcript.bucket(2.5),
+            [
+                ("Hey, this is", 0.0, 2.5),
+                ("just a test", 2.5, 2.5),
+                ("übrigens", 10.0, 2.5),
+            ],
+        )
+
+    def test_bucket__unsorted(self):
+        transcript = build_transcript([("b", 6.0, 1.0), ("a", 1.0, 1.0), ("c", 7.0, 1)])
+
+        self.assertSnippets(transcript.bucket(5), [("a", 0.0, 5.0), ("b c", 5.0, 5.0)])
+
+    def test_bucket__invalid_window(self):
+        with self.assertRaises(ValueError):
+            self.transcript.bucket(-1.0)
+
+    def test_chained_transforms(self):
+        self.assertSnippets(
+            self.transcript.clip(2.0, 20.0).shift(-2.0).scale(2.0).merge(max_gap=20),
+            [("this is just a test übrigens", 0.0, 18.0)],
+        )